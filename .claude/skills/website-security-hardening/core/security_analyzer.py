@@ -447,7 +447,7 @@ class SecurityAnalyzer:
             lines.append("## Recommended Fixes")
             for i, fix in enumerate(fixes[:10], 1):  # Top 10
                 lines.append(f"### {i}. {fix.title}")
-                lines.append(f"**Severity**: {fix.severity.value.upper()}")
+                lines.append(f"**Severity**: {fix.severity.name}")
                 lines.append(f"**Component**: {fix.affected_component}")
                 lines.append("")
                 lines.append(f"{fix.description}")
@@ -8,11 +8,12 @@ and the normalized data format for security reports.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
+from itertools import chain
 from typing import Dict, List, Optional, Tuple, Any
 
 
-class PlatformType(Enum):
+class PlatformType(str, Enum):
     """Supported platform types for security scanning."""
     GENERIC_URL = "generic_url"
     WORDPRESS = "wordpress"
@@ -22,16 +23,34 @@ class PlatformType(Enum):
     UNKNOWN = "unknown"
 
 
-class SeverityLevel(Enum):
-    """Severity levels for vulnerabilities and misconfigurations."""
-    CRITICAL = "critical"  # Immediate action required
-    HIGH = "high"          # Important to fix soon
-    MEDIUM = "medium"      # Should be addressed
-    LOW = "low"            # Nice to fix
-    INFO = "info"          # Informational
+class SeverityLevel(IntEnum):
+    """
+    Severity levels for vulnerabilities and misconfigurations.
+
+    Values are ordered, so levels compare and sort by severity.
+    Use ``.name`` for a display label.
+    """
+    CRITICAL = 5  # Immediate action required
+    HIGH = 4      # Important to fix soon
+    MEDIUM = 3    # Should be addressed
+    LOW = 2       # Nice to fix
+    INFO = 1      # Informational
+
+
+# Display markers used when rendering findings
+_SEVERITY_EMOJI: Dict[SeverityLevel, str] = {
+    SeverityLevel.CRITICAL: "🔴",
+    SeverityLevel.HIGH: "🟠",
+    SeverityLevel.MEDIUM: "🟡",
+    SeverityLevel.LOW: "🟢",
+    SeverityLevel.INFO: "ℹ️"
+}
 
+# Severities reported by get_high_priority_issues()
+_HIGH_PRIORITY_SEVERITIES = frozenset((SeverityLevel.CRITICAL, SeverityLevel.HIGH))
 
-@dataclass
+
+@dataclass(slots=True)
 class Vulnerability:
     """Represents a security vulnerability."""
     severity: SeverityLevel
@@ -43,20 +62,17 @@ class Vulnerability:
     references: List[str] = field(default_factory=list)
 
     def __str__(self) -> str:
-        """String representation of vulnerability."""
-        severity_emoji = {
-            SeverityLevel.CRITICAL: "🔴",
-            SeverityLevel.HIGH: "🟠",
-            SeverityLevel.MEDIUM: "🟡",
-            SeverityLevel.LOW: "🟢",
-            SeverityLevel.INFO: "ℹ️"
-        }
-        emoji = severity_emoji.get(self.severity, "•")
+        """Compact one-line representation of vulnerability."""
+        return f"[{self.severity.name}] {self.title}"
+
+    def format_report(self) -> str:
+        """Multi-line representation of vulnerability for reports."""
+        emoji = _SEVERITY_EMOJI.get(self.severity, "•")
         cve = f" [{self.cve_id}]" if self.cve_id else ""
         return f"{emoji} {self.title}{cve}\n   {self.description}\n   Component: {self.affected_component}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Misconfiguration:
     """Represents a security misconfiguration."""
     severity: SeverityLevel
@@ -67,20 +83,17 @@ class Misconfiguration:
     fix_code: Optional[str] = None
 
     def __str__(self) -> str:
-        """String representation of misconfiguration."""
-        severity_emoji = {
-            SeverityLevel.CRITICAL: "🔴",
-            SeverityLevel.HIGH: "🟠",
-            SeverityLevel.MEDIUM: "🟡",
-            SeverityLevel.LOW: "🟢",
-            SeverityLevel.INFO: "ℹ️"
-        }
-        emoji = severity_emoji.get(self.severity, "•")
+        """Compact one-line representation of misconfiguration."""
+        return f"[{self.severity.name}] {self.issue}"
+
+    def format_report(self) -> str:
+        """Multi-line representation of misconfiguration for reports."""
+        emoji = _SEVERITY_EMOJI.get(self.severity, "•")
         config_info = f" ({self.config_file})" if self.config_file else ""
         return f"{emoji} [{self.category}] {self.issue}{config_info}\n   Recommendation: {self.recommendation}"
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedSecurityReport:
     """
     Normalized security report format.
@@ -112,43 +125,39 @@ class NormalizedSecurityReport:
 
     def get_severity_counts(self) -> Dict[SeverityLevel, int]:
         """Get count of issues by severity level."""
-        counts = {level: 0 for level in SeverityLevel}
-
-        for vuln in self.vulnerabilities:
-            counts[vuln.severity] += 1
-
-        for config in self.misconfigurations:
-            counts[config.severity] += 1
-
+        counts, _, _ = self._summarize()
         return counts
 
     def get_critical_issues(self) -> List:
         """Get all critical severity issues."""
-        issues = []
-
-        for vuln in self.vulnerabilities:
-            if vuln.severity == SeverityLevel.CRITICAL:
-                issues.append(vuln)
-
-        for config in self.misconfigurations:
-            if config.severity == SeverityLevel.CRITICAL:
-                issues.append(config)
-
-        return issues
+        _, critical, _ = self._summarize()
+        return critical
 
     def get_high_priority_issues(self) -> List:
         """Get all high and critical severity issues."""
-        issues = []
+        _, _, high_priority = self._summarize()
+        return high_priority
 
-        for vuln in self.vulnerabilities:
-            if vuln.severity in [SeverityLevel.CRITICAL, SeverityLevel.HIGH]:
-                issues.append(vuln)
-
-        for config in self.misconfigurations:
-            if config.severity in [SeverityLevel.CRITICAL, SeverityLevel.HIGH]:
-                issues.append(config)
+    def _summarize(self) -> Tuple[Dict[SeverityLevel, int], List, List]:
+        """
+        Count and bucket all findings in one pass.
 
-        return issues
+        Returns:
+            Tuple: (severity counts, critical issues, high priority issues)
+        """
+        counts = dict.fromkeys(SeverityLevel, 0)
+        critical = []
+        high_priority = []
+
+        for issue in chain(self.vulnerabilities, self.misconfigurations):
+            severity = issue.severity
+            counts[severity] += 1
+            if severity in _HIGH_PRIORITY_SEVERITIES:
+                high_priority.append(issue)
+                if severity == SeverityLevel.CRITICAL:
+                    critical.append(issue)
+
+        return counts, critical, high_priority
 
     def get_risk_grade(self) -> str:
         """Get letter grade based on risk score."""
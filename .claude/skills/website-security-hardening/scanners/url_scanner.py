@@ -8,14 +8,23 @@ Suitable for scanning any publicly accessible website.
 import re
 import socket
 import ssl
+import sys
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timezone
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, SSLError
 
+# Optional: parse certificates from DER instead of getpeercert() dicts
+try:
+    from cryptography import x509
+except ImportError:
+    x509 = None
+
 from .base_scanner import (
     BaseSecurityConnector,
     NormalizedSecurityReport,
@@ -25,6 +34,103 @@ from .base_scanner import (
     Misconfiguration
 )
 
+# Lowercase security header names, interned so the lookup tables below
+# share one string object per header
+_HSTS = sys.intern('strict-transport-security')
+_X_FRAME_OPTIONS = sys.intern('x-frame-options')
+_X_CONTENT_TYPE_OPTIONS = sys.intern('x-content-type-options')
+_CSP = sys.intern('content-security-policy')
+_X_XSS_PROTECTION = sys.intern('x-xss-protection')
+_REFERRER_POLICY = sys.intern('referrer-policy')
+_PERMISSIONS_POLICY = sys.intern('permissions-policy')
+
+# Required security headers as (header, display name) pairs
+_SECURITY_HEADERS = (
+    (_HSTS, 'HSTS'),
+    (_X_FRAME_OPTIONS, 'Clickjacking Protection'),
+    (_X_CONTENT_TYPE_OPTIONS, 'MIME Sniffing Protection'),
+    (_CSP, 'Content Security Policy'),
+    (_X_XSS_PROTECTION, 'XSS Protection'),
+    (_REFERRER_POLICY, 'Referrer Policy'),
+    (_PERMISSIONS_POLICY, 'Permissions Policy'),
+)
+
+# Missing headers reported as HIGH rather than MEDIUM severity
+_HIGH_SEVERITY_HEADERS = frozenset((_HSTS, _CSP))
+
+# Remediation for each missing security header
+_HEADER_RECOMMENDATIONS = {
+    _HSTS: 'Add: Header always set Strict-Transport-Security "max-age=31536000; includeSubDomains"',
+    _X_FRAME_OPTIONS: 'Add: Header always set X-Frame-Options "SAMEORIGIN"',
+    _X_CONTENT_TYPE_OPTIONS: 'Add: Header always set X-Content-Type-Options "nosniff"',
+    _CSP: 'Add: Header always set Content-Security-Policy "default-src \'self\'"',
+    _X_XSS_PROTECTION: 'Add: Header always set X-XSS-Protection "1; mode=block"',
+    _REFERRER_POLICY: 'Add: Header always set Referrer-Policy "strict-origin-when-cross-origin"',
+    _PERMISSIONS_POLICY: 'Add: Header always set Permissions-Policy "geolocation=(), microphone=(), camera=()"',
+}
+
+# Risk score deduction per finding of each severity
+_SEVERITY_POINTS = {
+    SeverityLevel.CRITICAL: 25,
+    SeverityLevel.HIGH: 15,
+    SeverityLevel.MEDIUM: 10,
+    SeverityLevel.LOW: 5,
+    SeverityLevel.INFO: 1
+}
+
+# Protocol versions flagged as weak by _check_ssl_tls
+_WEAK_TLS_PROTOCOLS = frozenset(('SSLv2', 'SSLv3', 'TLSv1', 'TLSv1.1'))
+
+# Shared TLS client context. Sessions are deliberately not resumed: a
+# resumed handshake reports the certificate cached in the session, which
+# may no longer be the one the server presents
+_TLS_CONTEXT = ssl.create_default_context()
+
+# Files that must never be publicly readable
+_SENSITIVE_PATHS = (
+    '/.git/config',
+    '/.git/HEAD',
+    '/.env',
+    '/.env.production',
+    '/config.php',
+    '/wp-config.php',
+    '/backup.sql',
+    '/database.sql',
+    '/.htaccess',
+    '/phpinfo.php',
+)
+
+# Common admin panel locations
+_ADMIN_PATHS = (
+    '/admin',
+    '/administrator',
+    '/wp-admin',
+    '/ghost/admin',
+    '/phpmyadmin',
+    '/cpanel',
+)
+
+# HTTP methods that should not be enabled on a public site
+_DANGEROUS_METHODS = ('PUT', 'DELETE', 'TRACE', 'CONNECT')
+
+# Status codes showing a server rejects an HTTP method
+_METHOD_REJECTED_STATUSES = frozenset((405, 501))
+
+# Page body signatures as (marker, finding) pairs. Markers appear near the
+# top of the page, so only the first bytes of the body are fetched
+_BODY_SIGNATURES = (
+    (b'Index of /', 'directory_listing'),
+    (b'<title>Index of', 'directory_listing'),
+)
+_BODY_SCAN_BYTES = 64 * 1024
+
+# All signatures compiled into one alternation so a body is scanned once
+# regardless of how many markers are registered
+_BODY_SIGNATURE_RE = re.compile(
+    b'|'.join(re.escape(marker) for marker, _ in _BODY_SIGNATURES)
+)
+_BODY_SIGNATURE_FINDINGS = dict(_BODY_SIGNATURES)
+
 
 class URLSecurityScanner(BaseSecurityConnector):
     """
@@ -38,13 +144,14 @@ class URLSecurityScanner(BaseSecurityConnector):
     - Dangerous HTTP methods
     """
 
-    def __init__(self, target: str, timeout: int = 10, **kwargs):
+    def __init__(self, target: str, timeout: int = 10, max_workers: int = 20, **kwargs):
         """
         Initialize URL scanner.
 
         Args:
             target: Target URL (https://example.com)
             timeout: Request timeout in seconds
+            max_workers: Maximum number of concurrent probe requests
             **kwargs: Additional configuration
         """
         # Ensure URL has scheme
@@ -53,11 +160,20 @@ class URLSecurityScanner(BaseSecurityConnector):
 
         super().__init__(target, **kwargs)
         self.timeout = timeout
+        self._base_url = self.target.rstrip('/')
+        self.max_workers = max_workers
+        self._root_response: Optional[Tuple[requests.Response, bytes]] = None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Security-Scanner/1.0 (Security Audit)'
         })
 
+        # Size the connection pool for concurrent probes so connections
+        # are reused instead of discarded once the default pool is full
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
     def _detect_platform(self) -> PlatformType:
         """Detect platform type from URL scan."""
         return PlatformType.GENERIC_URL
@@ -65,8 +181,10 @@ class URLSecurityScanner(BaseSecurityConnector):
     def test_connection(self) -> Tuple[bool, str]:
         """Test connection to target URL."""
         try:
-            response = self.session.get(self.target, timeout=self.timeout, allow_redirects=True)
-            return True, f"Connected successfully (Status: {response.status_code})"
+            with self.session.get(
+                self.target, timeout=self.timeout, allow_redirects=True, stream=True
+            ) as response:
+                return True, f"Connected successfully (Status: {response.status_code})"
         except SSLError as e:
             return False, f"SSL Error: {str(e)}"
         except RequestException as e:
@@ -77,12 +195,16 @@ class URLSecurityScanner(BaseSecurityConnector):
         start_time = time.time()
         report = self._create_report()
 
-        # Run all security checks
-        self._check_security_headers(report)
-        self._check_ssl_tls(report)
-        self._check_information_disclosure(report)
-        self._check_common_paths(report)
-        self._check_http_methods(report)
+        # Run all security checks, sharing one fetch of the target page
+        self._root_response = None
+        try:
+            self._check_security_headers(report)
+            self._check_ssl_tls(report)
+            self._check_information_disclosure(report)
+            self._check_common_paths(report)
+            self._check_http_methods(report)
+        finally:
+            self._root_response = None
 
         # Calculate risk score
         report.risk_score = self._calculate_risk_score(report)
@@ -93,26 +215,16 @@ class URLSecurityScanner(BaseSecurityConnector):
     def _check_security_headers(self, report: NormalizedSecurityReport):
         """Check for presence of security headers."""
         try:
-            response = self.session.get(self.target, timeout=self.timeout)
-            headers = {k.lower(): v for k, v in response.headers.items()}
-
-            # Define required security headers
-            security_headers = {
-                'strict-transport-security': 'HSTS',
-                'x-frame-options': 'Clickjacking Protection',
-                'x-content-type-options': 'MIME Sniffing Protection',
-                'content-security-policy': 'Content Security Policy',
-                'x-xss-protection': 'XSS Protection',
-                'referrer-policy': 'Referrer Policy',
-                'permissions-policy': 'Permissions Policy',
-            }
-
-            for header, name in security_headers.items():
+            response, _ = self._get_root_response()
+            # requests exposes headers as a CaseInsensitiveDict
+            headers = response.headers
+
+            for header, name in _SECURITY_HEADERS:
                 present = header in headers
                 report.security_headers[name] = present
 
                 if not present:
-                    severity = SeverityLevel.HIGH if header in ['strict-transport-security', 'content-security-policy'] else SeverityLevel.MEDIUM
+                    severity = SeverityLevel.HIGH if header in _HIGH_SEVERITY_HEADERS else SeverityLevel.MEDIUM
 
                     report.misconfigurations.append(
                         Misconfiguration(
@@ -177,10 +289,9 @@ class URLSecurityScanner(BaseSecurityConnector):
             hostname = parsed.hostname
             port = parsed.port or 443
 
-            context = ssl.create_default_context()
             with socket.create_connection((hostname, port), timeout=self.timeout) as sock:
-                with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                    cert = ssock.getpeercert()
+                with _TLS_CONTEXT.wrap_socket(sock, server_hostname=hostname) as ssock:
+                    expires_at = self._get_cert_expiry(ssock)
                     protocol = ssock.version()
                     cipher = ssock.cipher()
 
@@ -192,9 +303,8 @@ class URLSecurityScanner(BaseSecurityConnector):
                     }
 
                     # Check certificate expiration
-                    if cert:
-                        not_after = datetime.strptime(cert['notAfter'], '%b %d %H:%M:%S %Y %GMT')
-                        days_until_expiry = (not_after - datetime.now()).days
+                    if expires_at is not None:
+                        days_until_expiry = int((expires_at - time.time()) // 86400)
 
                         report.ssl_tls_status['expires_in_days'] = days_until_expiry
 
@@ -220,7 +330,7 @@ class URLSecurityScanner(BaseSecurityConnector):
                             )
 
                     # Check protocol version
-                    if protocol in ['SSLv2', 'SSLv3', 'TLSv1', 'TLSv1.1']:
+                    if protocol in _WEAK_TLS_PROTOCOLS:
                         report.vulnerabilities.append(
                             Vulnerability(
                                 severity=SeverityLevel.HIGH,
@@ -247,44 +357,60 @@ class URLSecurityScanner(BaseSecurityConnector):
         except Exception as e:
             report.ssl_tls_status['error'] = str(e)
 
+    def _get_cert_expiry(self, ssock: ssl.SSLSocket) -> Optional[float]:
+        """
+        Get the peer certificate's expiry time in epoch seconds.
+
+        Loads the DER certificate with cryptography when it is installed,
+        skipping the text dict built by getpeercert(); otherwise parses
+        the notAfter field of that dict.
+
+        Returns:
+            Optional[float]: Expiry timestamp, or None if no certificate
+        """
+        if x509 is not None:
+            der = ssock.getpeercert(binary_form=True)
+            if not der:
+                return None
+
+            cert = x509.load_der_x509_certificate(der)
+            not_after = getattr(cert, 'not_valid_after_utc', None)
+            if not_after is None:
+                # cryptography < 42 only exposes a naive UTC datetime
+                not_after = cert.not_valid_after.replace(tzinfo=timezone.utc)
+            return not_after.timestamp()
+
+        cert = ssock.getpeercert()
+        if not cert:
+            return None
+        return ssl.cert_time_to_seconds(cert['notAfter'])
+
     def _check_information_disclosure(self, report: NormalizedSecurityReport):
         """Check for information disclosure vulnerabilities."""
         # Check for exposed sensitive files
-        sensitive_paths = [
-            '/.git/config',
-            '/.git/HEAD',
-            '/.env',
-            '/.env.production',
-            '/config.php',
-            '/wp-config.php',
-            '/backup.sql',
-            '/database.sql',
-            '/.htaccess',
-            '/phpinfo.php',
-        ]
-
-        for path in sensitive_paths:
-            try:
-                url = f"{self.target.rstrip('/')}{path}"
-                response = self.session.get(url, timeout=self.timeout, allow_redirects=False)
-
-                if response.status_code == 200:
-                    report.vulnerabilities.append(
-                        Vulnerability(
-                            severity=SeverityLevel.CRITICAL,
-                            title=f"Sensitive file exposed: {path}",
-                            description=f"File accessible at {url}",
-                            affected_component="File Permissions",
-                            remediation=f"Remove or restrict access to {path}"
-                        )
+        urls = [self._base_url + path for path in _SENSITIVE_PATHS]
+        statuses = self._probe_all(
+            lambda url: self._probe_path(url, allow_redirects=False),
+            urls
+        )
+
+        for path, url, status_code in zip(_SENSITIVE_PATHS, urls, statuses):
+            # None means the file is not accessible (good)
+            if status_code == 200:
+                report.vulnerabilities.append(
+                    Vulnerability(
+                        severity=SeverityLevel.CRITICAL,
+                        title=f"Sensitive file exposed: {path}",
+                        description=f"File accessible at {url}",
+                        affected_component="File Permissions",
+                        remediation=f"Remove or restrict access to {path}"
                     )
-            except RequestException:
-                pass  # File not accessible (good)
+                )
 
         # Check for directory listing
         try:
-            response = self.session.get(self.target, timeout=self.timeout)
-            if 'Index of /' in response.text or '<title>Index of' in response.text:
+            _, body_head = self._get_root_response()
+            if 'directory_listing' in self._match_body_signatures(body_head):
                 report.vulnerabilities.append(
                     Vulnerability(
                         severity=SeverityLevel.MEDIUM,
@@ -299,83 +425,164 @@ class URLSecurityScanner(BaseSecurityConnector):
 
     def _check_common_paths(self, report: NormalizedSecurityReport):
         """Check for exposed admin panels and common paths."""
-        admin_paths = [
-            '/admin',
-            '/administrator',
-            '/wp-admin',
-            '/ghost/admin',
-            '/phpmyadmin',
-            '/cpanel',
-        ]
-
-        for path in admin_paths:
-            try:
-                url = f"{self.target.rstrip('/')}{path}"
-                response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
-
-                if response.status_code == 200:
-                    report.misconfigurations.append(
-                        Misconfiguration(
-                            severity=SeverityLevel.MEDIUM,
-                            category="authentication",
-                            issue=f"Admin panel accessible: {path}",
-                            recommendation="Add IP whitelist or additional authentication for admin areas"
-                        )
+        urls = [self._base_url + path for path in _ADMIN_PATHS]
+        statuses = self._probe_all(
+            lambda url: self._probe_path(url, allow_redirects=True),
+            urls
+        )
+
+        for path, status_code in zip(_ADMIN_PATHS, statuses):
+            if status_code == 200:
+                report.misconfigurations.append(
+                    Misconfiguration(
+                        severity=SeverityLevel.MEDIUM,
+                        category="authentication",
+                        issue=f"Admin panel accessible: {path}",
+                        recommendation="Add IP whitelist or additional authentication for admin areas"
                     )
-            except RequestException:
-                pass
+                )
 
     def _check_http_methods(self, report: NormalizedSecurityReport):
         """Check for dangerous HTTP methods."""
-        dangerous_methods = ['PUT', 'DELETE', 'TRACE', 'CONNECT']
-
-        for method in dangerous_methods:
-            try:
-                response = self.session.request(method, self.target, timeout=self.timeout)
-
-                if response.status_code not in [405, 501]:  # Method not allowed
-                    report.vulnerabilities.append(
-                        Vulnerability(
-                            severity=SeverityLevel.HIGH,
-                            title=f"Dangerous HTTP method enabled: {method}",
-                            description=f"{method} method returned status {response.status_code}",
-                            affected_component="Web Server Configuration",
-                            remediation=f"Disable {method} method in web server config"
-                        )
-                    )
-            except RequestException:
-                pass
+        enabled = []
+
+        # A single OPTIONS request usually lists every allowed method
+        allowed = self._get_allowed_methods()
+        if allowed:
+            for method in _DANGEROUS_METHODS:
+                if method in allowed:
+                    enabled.append((method, f"{method} method listed in Allow header"))
+        else:
+            # Server did not report allowed methods, probe each one
+            statuses = self._probe_all(
+                lambda method: self._probe_status(method, self.target),
+                _DANGEROUS_METHODS
+            )
 
-    def _calculate_risk_score(self, report: NormalizedSecurityReport) -> int:
-        """Calculate risk score (100 = perfect, 0 = critical)."""
-        score = 100
-
-        # Deduct points based on severity
-        severity_points = {
-            SeverityLevel.CRITICAL: 25,
-            SeverityLevel.HIGH: 15,
-            SeverityLevel.MEDIUM: 10,
-            SeverityLevel.LOW: 5,
-            SeverityLevel.INFO: 1
+            for method, status_code in zip(_DANGEROUS_METHODS, statuses):
+                if status_code is None:
+                    continue
+
+                if status_code not in _METHOD_REJECTED_STATUSES:
+                    enabled.append((method, f"{method} method returned status {status_code}"))
+
+        for method, description in enabled:
+            report.vulnerabilities.append(
+                Vulnerability(
+                    severity=SeverityLevel.HIGH,
+                    title=f"Dangerous HTTP method enabled: {method}",
+                    description=description,
+                    affected_component="Web Server Configuration",
+                    remediation=f"Disable {method} method in web server config"
+                )
+            )
+
+    def _get_allowed_methods(self) -> frozenset:
+        """
+        Get the methods advertised in the target's OPTIONS Allow header.
+
+        Returns:
+            frozenset: Uppercase method names, empty if none were reported
+        """
+        try:
+            with self.session.options(self.target, timeout=self.timeout, stream=True) as response:
+                allow = response.headers.get('Allow', '')
+        except RequestException:
+            return frozenset()
+
+        return frozenset(
+            method.strip().upper() for method in allow.split(',') if method.strip()
+        )
+
+    def _get_root_response(self) -> Tuple[requests.Response, bytes]:
+        """
+        Fetch the target page, reusing the response within a scan.
+
+        Only the start of the body is downloaded, since checks look for
+        markers near the top of the page; the response is then closed.
+
+        Returns:
+            Tuple[requests.Response, bytes]: (closed response, first body bytes)
+
+        Raises:
+            RequestException: If the target cannot be fetched
+        """
+        if self._root_response is None:
+            with self.session.get(self.target, timeout=self.timeout, stream=True) as response:
+                body_head = next(response.iter_content(_BODY_SCAN_BYTES), b'')
+            self._root_response = (response, body_head)
+        return self._root_response
+
+    def _match_body_signatures(self, body: bytes) -> set:
+        """
+        Scan a page body for all known signatures in a single pass.
+
+        Returns:
+            set: Findings whose markers occur in the body
+        """
+        return {
+            _BODY_SIGNATURE_FINDINGS[match.group()]
+            for match in _BODY_SIGNATURE_RE.finditer(body)
         }
 
-        for vuln in report.vulnerabilities:
-            score -= severity_points.get(vuln.severity, 0)
+    def _probe_path(self, url: str, allow_redirects: bool = True) -> Optional[int]:
+        """
+        Check whether a path is reachable without downloading its body.
+
+        Uses HEAD, falling back to GET for servers that reject HEAD with 405.
+
+        Returns:
+            Optional[int]: HTTP status code, or None if the request failed
+        """
+        status_code = self._probe_status('HEAD', url, allow_redirects=allow_redirects)
+        if status_code == 405:
+            status_code = self._probe_status('GET', url, allow_redirects=allow_redirects)
+        return status_code
+
+    def _probe_status(self, method: str, url: str, allow_redirects: bool = True) -> Optional[int]:
+        """
+        Send a single probe request and return its status code.
+
+        The response is streamed and closed without reading the body,
+        since only the status code is needed.
+
+        Returns:
+            Optional[int]: HTTP status code, or None if the request failed
+        """
+        try:
+            with self.session.request(
+                method, url, timeout=self.timeout,
+                allow_redirects=allow_redirects, stream=True
+            ) as response:
+                return response.status_code
+        except RequestException:
+            return None
+
+    def _probe_all(self, probe: Callable, items: Sequence) -> List:
+        """
+        Run probe over items concurrently, bounded by max_workers.
+
+        Probes are network-bound, so overlapping them makes the wall time
+        of a check roughly that of its slowest request rather than the sum.
+
+        Returns:
+            List: Probe results in the same order as items
+        """
+        if not items:
+            return []
 
-        for config in report.misconfigurations:
-            score -= severity_points.get(config.severity, 0)
+        workers = min(self.max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(probe, items))
 
-        return max(0, score)
+    def _calculate_risk_score(self, report: NormalizedSecurityReport) -> int:
+        """Calculate risk score (100 = perfect, 0 = critical)."""
+        # Deduct points per finding, weighted by severity
+        counts = report.get_severity_counts()
+        penalty = sum(_SEVERITY_POINTS[level] * count for level, count in counts.items())
+
+        return max(0, 100 - penalty)
 
     def _get_header_recommendation(self, header: str) -> str:
         """Get remediation recommendation for missing header."""
-        recommendations = {
-            'strict-transport-security': 'Add: Header always set Strict-Transport-Security "max-age=31536000; includeSubDomains"',
-            'x-frame-options': 'Add: Header always set X-Frame-Options "SAMEORIGIN"',
-            'x-content-type-options': 'Add: Header always set X-Content-Type-Options "nosniff"',
-            'content-security-policy': 'Add: Header always set Content-Security-Policy "default-src \'self\'"',
-            'x-xss-protection': 'Add: Header always set X-XSS-Protection "1; mode=block"',
-            'referrer-policy': 'Add: Header always set Referrer-Policy "strict-origin-when-cross-origin"',
-            'permissions-policy': 'Add: Header always set Permissions-Policy "geolocation=(), microphone=(), camera=()"',
-        }
-        return recommendations.get(header, f"Add {header} header to server configuration")
+        return _HEADER_RECOMMENDATIONS.get(header, f"Add {header} header to server configuration")
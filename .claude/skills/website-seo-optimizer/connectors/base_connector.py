@@ -5,11 +5,15 @@ All platform connectors must implement this interface to work with the
 core SEO analysis modules.
 """
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional, Tuple, Any
 
+# Matches a single HTML tag
+_TAG_RE = re.compile(r'<[^>]+>')
+
 
 class PlatformType(Enum):
     """Supported platform types."""
@@ -23,7 +27,7 @@ class PlatformType(Enum):
     FASTAPI = "fastapi"
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedContent:
     """
     Standardized content format that all connectors must return.
@@ -70,16 +74,40 @@ class NormalizedContent:
     reading_time_minutes: int = 0
 
     def __post_init__(self):
-        """Calculate derived fields."""
+        """Defer derived fields until they are first read."""
+        # Unset slots fall through to __getattr__, which fills them in
         if not self.word_count and self.content:
-            # Simple word count from HTML content
-            import re
-            text = re.sub(r'<[^>]+>', '', self.content)
-            self.word_count = len(text.split())
+            del self.word_count
 
-        if not self.reading_time_minutes and self.word_count:
+        if not self.reading_time_minutes:
+            del self.reading_time_minutes
+
+    def __getattr__(self, name: str) -> Any:
+        """Calculate derived fields that were not passed in."""
+        if name == "word_count":
+            # Simple word count from HTML content
+            text = _TAG_RE.sub('', self.content)
+            value = len(text.split())
+        elif name == "reading_time_minutes":
             # Average reading speed: 200 words/minute
-            self.reading_time_minutes = max(1, self.word_count // 200)
+            word_count = self.word_count
+            value = max(1, word_count // 200) if word_count else 0
+        else:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+        setattr(self, name, value)
+        return value
+
+    def as_post_dict(self) -> Dict[str, str]:
+        """Return the fields the core analyzers read, as a post dictionary."""
+        return {
+            'title': self.title,
+            'content': self.content,
+            'meta_description': self.meta_description,
+            'url_slug': self.url_slug,
+        }
 
 
 class BaseConnector(ABC):
@@ -6,11 +6,15 @@ for SEO analysis. No authentication required.
 """
 
 import re
-from typing import Dict, List, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Tuple, Any, Union
 from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .base_connector import (
     BaseConnector,
@@ -20,6 +24,72 @@ from .base_connector import (
     NotFoundError,
 )
 
+# Prefer the C-based lxml parser; fall back to the pure-Python parser
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# Optional: selectolax (Lexbor) is much faster than BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Bytes read per chunk when downloading a page
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Heading elements, h1 through h6
+_HEADING_TAGS = ["h1", "h2", "h3", "h4", "h5", "h6"]
+
+# Elements excluded from the main content HTML
+_NON_CONTENT_TAGS = ["script", "style", "nav", "header", "footer"]
+
+# Main content containers, in order of preference
+_MAIN_CONTENT_SELECTORS = ["main", "article", '[role="main"]']
+
+# Only these elements (with their subtrees) are built when parsing with
+# BeautifulSoup. <body> is left out, since keeping it would keep everything
+_SOUP_STRAINER = SoupStrainer(
+    _HEADING_TAGS
+    + ["title", "meta", "link", "img", "a", "main", "article"]
+    + _NON_CONTENT_TAGS
+)
+
+# <script> and <style> elements; their raw text never holds markup
+_RAW_TEXT_ELEMENT_RE = re.compile(
+    rb"<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+
+
+def _header_encoding(response: requests.Response) -> Optional[str]:
+    """Charset from the Content-Type header, or None if it names none."""
+    # requests assumes ISO-8859-1 for any text/* type without a charset,
+    # which would override the page's own <meta charset>
+    if "charset" in response.headers.get("content-type", "").lower():
+        return response.encoding
+    return None
+
+
+def _decode_html(html_bytes: bytes, encoding: Optional[str] = None) -> str:
+    """Decode a page: the HTTP charset if given, else BOM, <meta charset> or sniffing."""
+    known = [encoding] if encoding else []
+    dammit = UnicodeDammit(html_bytes, known_definite_encodings=known, is_html=True)
+    if dammit.unicode_markup is None:
+        return html_bytes.decode("utf-8", "replace")
+    return dammit.unicode_markup
+
+
+def _url_joiner(base_url: str):
+    """
+    Return urljoin() bound to base_url, memoized for one page.
+
+    Pages repeat the same hrefs and image sources (navigation, footers,
+    icons), so each distinct reference is only resolved once.
+    """
+    return lru_cache(maxsize=None)(partial(urljoin, base_url))
+
 
 class URLConnector(BaseConnector):
     """Fetch and analyze content from any public URL."""
@@ -41,6 +111,22 @@ class URLConnector(BaseConnector):
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": self.user_agent})
 
+        # Keep enough pooled keep-alive connections for fetch_many() and
+        # retry transient failures; the final response is still returned
+        # so fetch() reports HTTP errors as before
+        adapter = HTTPAdapter(
+            pool_connections=50,
+            pool_maxsize=100,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     @property
     def platform_type(self) -> PlatformType:
         return PlatformType.URL
@@ -62,8 +148,14 @@ class URLConnector(BaseConnector):
         url = self._normalize_url(identifier)
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            # Stream the body in large chunks (decompressed on the fly) and
+            # release the connection back to the pool before parsing
+            with self.session.get(
+                url, timeout=self.timeout, stream=True
+            ) as response:
+                response.raise_for_status()
+                html_bytes = b"".join(response.iter_content(_READ_CHUNK_SIZE))
+                encoding = _header_encoding(response)
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 raise NotFoundError(f"URL not found: {url}")
@@ -71,18 +163,21 @@ class URLConnector(BaseConnector):
         except requests.exceptions.RequestException as e:
             raise ConnectorError(f"Failed to fetch {url}: {e}")
 
-        # Parse HTML
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # Extract content
-        title = self._extract_title(soup)
-        meta_description = self._extract_meta_description(soup)
-        meta_keywords = self._extract_meta_keywords(soup)
-        canonical_url = self._extract_canonical(soup, url)
-        headings = self._extract_headings(soup)
-        images = self._extract_images(soup, url)
-        links = self._extract_links(soup, url)
-        content = self._extract_main_content(soup)
+        # Parse HTML from raw bytes, honouring the HTTP charset if there is
+        # one and otherwise letting <meta charset> or sniffing decide
+        if LexborHTMLParser is not None:
+            extracted = self._parse_with_lexbor(html_bytes, url, encoding)
+        else:
+            extracted = self._parse_with_soup(html_bytes, url, encoding)
+
+        title = extracted["title"]
+        meta_description = extracted["meta_description"]
+        meta_keywords = extracted["meta_keywords"]
+        canonical_url = extracted["canonical_url"]
+        headings = extracted["headings"]
+        images = extracted["images"]
+        links = extracted["links"]
+        content = extracted["content"]
 
         # Generate URL slug from path
         parsed = urlparse(url)
@@ -107,6 +202,36 @@ class URLConnector(BaseConnector):
             },
         )
 
+    def fetch_many(
+        self, identifiers: List[str], max_workers: int = 10
+    ) -> List[Union[NormalizedContent, ConnectorError]]:
+        """
+        Fetch and normalize several URLs concurrently.
+
+        Fetching is network-bound, so overlapping requests makes the total
+        time close to that of the slowest page rather than the sum.
+
+        Args:
+            identifiers: Full URLs (http:// or https://)
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            One entry per identifier, in input order: the NormalizedContent,
+            or the ConnectorError raised while fetching that URL
+        """
+        if not identifiers:
+            return []
+
+        def fetch_one(identifier: str) -> Union[NormalizedContent, ConnectorError]:
+            try:
+                return self.fetch(identifier)
+            except ConnectorError as e:
+                return e
+
+        workers = min(max_workers, len(identifiers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch_one, identifiers))
+
     def list_items(self, **filters) -> List[Dict[str, Any]]:
         """
         URL connector doesn't support listing (no index/sitemap parsing).
@@ -145,6 +270,116 @@ class URLConnector(BaseConnector):
             url = "https://" + url
         return url
 
+    def _parse_with_soup(
+        self, html_bytes: bytes, url: str, encoding: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Extract all page fields using BeautifulSoup."""
+        # Scripts and styles are dropped from the content anyway, so cut
+        # them before parsing instead of building their subtrees
+        html_bytes = _RAW_TEXT_ELEMENT_RE.sub(b"", html_bytes)
+        soup = BeautifulSoup(
+            html_bytes, _HTML_PARSER,
+            parse_only=_SOUP_STRAINER, from_encoding=encoding
+        )
+
+        extracted = {
+            "title": self._extract_title(soup),
+            "meta_description": self._extract_meta_description(soup),
+            "meta_keywords": self._extract_meta_keywords(soup),
+            "canonical_url": self._extract_canonical(soup, url),
+            # Must run last: removes non-content elements from the tree
+            **self._extract_all(soup, url),
+        }
+
+        # Without <main> or <article>, the content comes from elements the
+        # strainer skipped, so parse the full document for it
+        if extracted["content"] is None:
+            extracted["content"] = self._extract_main_content(
+                BeautifulSoup(html_bytes, _HTML_PARSER, from_encoding=encoding)
+            )
+
+        return extracted
+
+    def _parse_with_lexbor(
+        self, html_bytes: bytes, url: str, encoding: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract all page fields using selectolax's Lexbor parser.
+
+        Produces the same fields as _parse_with_soup() without building
+        a Python object per node.
+        """
+        # Lexbor reads bytes as UTF-8, so decode the page first
+        tree = LexborHTMLParser(_decode_html(html_bytes, encoding))
+
+        def meta_content(name: str) -> str:
+            meta = tree.css_first(f'meta[name="{name}"]')
+            content = meta.attributes.get("content") if meta else None
+            return content.strip() if content else ""
+
+        # Title, falling back to the first <h1>
+        title = ""
+        title_tag = tree.css_first("title")
+        if title_tag:
+            title = title_tag.text(strip=True)
+        if not title:
+            h1_tag = tree.css_first("h1")
+            title = h1_tag.text(strip=True) if h1_tag else "Untitled Page"
+
+        canonical_url = url
+        canonical = tree.css_first('link[rel~="canonical"]')
+        if canonical and canonical.attributes.get("href"):
+            canonical_url = urljoin(url, canonical.attributes["href"])
+
+        join_url = _url_joiner(url)
+
+        headings = []
+        for tag in tree.css(", ".join(_HEADING_TAGS)):
+            text = tag.text(strip=True)
+            if text:
+                headings.append({"level": tag.tag, "text": text})
+
+        images = []
+        for img in tree.css("img"):
+            attrs = img.attributes
+            src = attrs.get("src")
+            if src:
+                images.append({
+                    "src": join_url(src),
+                    "alt": attrs.get("alt") or "",
+                    "title": attrs.get("title") or "",
+                })
+
+        links = []
+        for a in tree.css("a[href]"):
+            attrs = a.attributes
+            links.append({
+                "href": join_url(attrs.get("href") or ""),
+                "text": a.text(strip=True),
+                "rel": " ".join((attrs.get("rel") or "").split()),
+            })
+
+        # Main content: drop non-content elements, then find the container
+        tree.strip_tags(_NON_CONTENT_TAGS, recursive=True)
+        main_content = None
+        for selector in _MAIN_CONTENT_SELECTORS:
+            main_content = tree.css_first(selector)
+            if main_content:
+                break
+        if not main_content:
+            main_content = tree.body or tree.root
+
+        return {
+            "title": title,
+            "meta_description": meta_content("description"),
+            "meta_keywords": meta_content("keywords"),
+            "canonical_url": canonical_url,
+            "headings": headings,
+            "images": images,
+            "links": links,
+            "content": main_content.html if main_content else "",
+        }
+
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract page title."""
         # Try <title> tag first
@@ -180,66 +415,91 @@ class URLConnector(BaseConnector):
             return urljoin(base_url, link["href"])
         return base_url
 
-    def _extract_headings(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
-        """Extract all headings (h1-h6)."""
+    def _extract_all(
+        self, soup: BeautifulSoup, base_url: str
+    ) -> Dict[str, Any]:
+        """
+        Extract headings, images, links and main content in one tree walk.
+
+        Main content is the first <main> or else <article> outside
+        navigation, headers, footers, scripts and styles, or None when
+        there is neither. The tree is modified, so this must run after
+        all other extraction.
+        """
         headings = []
-        for level in range(1, 7):
-            for tag in soup.find_all(f"h{level}"):
+        images = []
+        links = []
+        non_content = []
+        join_url = _url_joiner(base_url)
+
+        # First <main> and first <article> found
+        candidates: List[Any] = [None, None]
+
+        for tag in soup.find_all(True):
+            name = tag.name
+
+            if name in _HEADING_TAGS:
                 text = tag.get_text(strip=True)
                 if text:
-                    headings.append({"level": f"h{level}", "text": text})
-        return headings
+                    headings.append({"level": name, "text": text})
+            elif name == "img":
+                src = tag.get("src", "")
+                if src:
+                    images.append({
+                        "src": join_url(src),
+                        "alt": tag.get("alt", ""),
+                        "title": tag.get("title", ""),
+                    })
+            elif name == "a":
+                if tag.has_attr("href"):
+                    rel = tag.get("rel", [])
+                    if isinstance(rel, list):
+                        rel = " ".join(rel)
+
+                    links.append({
+                        "href": join_url(tag["href"]),
+                        "text": tag.get_text(strip=True),
+                        "rel": rel,
+                    })
+            elif name in _NON_CONTENT_TAGS:
+                non_content.append(tag)
+            elif name == "main" or name == "article":
+                index = 0 if name == "main" else 1
+                if (candidates[index] is None
+                        and tag.find_parent(_NON_CONTENT_TAGS) is None):
+                    candidates[index] = tag
 
-    def _extract_images(
-        self, soup: BeautifulSoup, base_url: str
-    ) -> List[Dict[str, str]]:
-        """Extract all images with alt text."""
-        images = []
-        for img in soup.find_all("img"):
-            src = img.get("src", "")
-            if src:
-                images.append({
-                    "src": urljoin(base_url, src),
-                    "alt": img.get("alt", ""),
-                    "title": img.get("title", ""),
-                })
-        return images
+        # Remove unwanted elements
+        for tag in non_content:
+            tag.decompose()
 
-    def _extract_links(
-        self, soup: BeautifulSoup, base_url: str
-    ) -> List[Dict[str, str]]:
-        """Extract all links."""
-        links = []
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
-            rel = a.get("rel", [])
-            if isinstance(rel, list):
-                rel = " ".join(rel)
+        main_content = next(
+            (tag for tag in candidates if tag is not None), None
+        )
 
-            links.append({
-                "href": urljoin(base_url, href),
-                "text": text,
-                "rel": rel,
-            })
-        return links
+        return {
+            "headings": headings,
+            "images": images,
+            "links": links,
+            "content": str(main_content) if main_content is not None else None,
+        }
 
     def _extract_main_content(self, soup: BeautifulSoup) -> str:
         """
-        Extract main content HTML.
+        Extract main content HTML from a fully parsed document.
 
         Tries to identify the main content area and exclude navigation,
         headers, footers, sidebars, etc.
         """
         # Remove unwanted elements
-        for tag in soup.find_all(["script", "style", "nav", "header", "footer"]):
+        for tag in soup.find_all(_NON_CONTENT_TAGS):
             tag.decompose()
 
         # Try to find main content container
         main_content = None
 
         # Look for semantic HTML5 tags
-        for selector in ["main", "article", '[role="main"]']:
+        for selector in _MAIN_CONTENT_SELECTORS:
             main_content = soup.select_one(selector)
             if main_content:
                 break
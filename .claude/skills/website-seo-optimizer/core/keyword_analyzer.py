@@ -5,24 +5,49 @@ Analyzes content for keyword optimization, density calculation,
 and LSI keyword suggestions.
 """
 
+import heapq
 import re
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 from collections import Counter
 import html
 
+# Precompiled patterns shared by all analyzer calls
+_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'\b\w+\b')
+
+
+# Words that carry no meaning on their own in LSI phrases
+_STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
+    'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
+    'to', 'was', 'will', 'with', 'you', 'your', 'this', 'but', 'not',
+    'or', 'can', 'all', 'would', 'there', 'their', 'what', 'so', 'up',
+    'out', 'if', 'about', 'which', 'when', 'make', 'just', 'know'
+})
+
+# Filler words dropped from titles by extract_keywords_from_title()
+_TITLE_STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
+    'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
+    'to', 'was', 'will', 'with', 'how', 'what', 'when', 'where', 'why'
+})
+
+
+@lru_cache(maxsize=1024)
+def _keyword_pattern(keyword: str) -> re.Pattern:
+    """Case-insensitive pattern for a keyword phrase, compiled once."""
+    return re.compile(re.escape(keyword), re.IGNORECASE)
+
 
 class KeywordAnalyzer:
     """Analyze content for keyword optimization."""
 
     def __init__(self):
         """Initialize keyword analyzer."""
-        self.stop_words = {
-            'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
-            'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
-            'to', 'was', 'will', 'with', 'you', 'your', 'this', 'but', 'not',
-            'or', 'can', 'all', 'would', 'there', 'their', 'what', 'so', 'up',
-            'out', 'if', 'about', 'which', 'when', 'make', 'just', 'know'
-        }
+        self.stop_words = _STOP_WORDS
 
     def analyze_content(
         self,
@@ -30,7 +55,8 @@ class KeywordAnalyzer:
         target_keyword: str,
         title: str = "",
         meta_description: str = "",
-        headings: List[str] = None
+        headings: List[str] = None,
+        plain_text: Optional[str] = None
     ) -> Dict:
         """
         Analyze content for keyword optimization.
@@ -41,18 +67,102 @@ class KeywordAnalyzer:
             title: Post title
             meta_description: Meta description
             headings: List of headings (H1, H2, H3, etc.)
+            plain_text: Content already passed through _strip_html()
+                (optional, skips stripping it again)
 
         Returns:
             Dictionary with keyword analysis results
         """
-        # Strip HTML tags
-        text_content = self._strip_html(content)
+        # Strip HTML tags and tokenize once for the whole analysis
+        text_content, text_lower, words = self._prepare_text(content, plain_text)
+
+        return self._analyze_text(
+            text_content,
+            text_lower,
+            words,
+            target_keyword,
+            title,
+            meta_description,
+            headings
+        )
+
+    def analyze_multi(
+        self,
+        content: str,
+        keywords: List[str],
+        title: str = "",
+        meta_description: str = "",
+        headings: List[str] = None
+    ) -> Dict[str, Dict]:
+        """
+        Analyze content for several target keywords at once.
+
+        The HTML is stripped and the words counted once for the whole
+        batch instead of once per keyword.
+
+        Args:
+            content: HTML content of the post
+            keywords: Keywords to analyze
+            title: Post title
+            meta_description: Meta description
+            headings: List of headings (H1, H2, H3, etc.)
+
+        Returns:
+            Dictionary mapping each keyword to its analyze_content() result
+        """
+        text_content, text_lower, words = self._prepare_text(content)
+
+        return {
+            keyword: self._analyze_text(
+                text_content,
+                text_lower,
+                words,
+                keyword,
+                title,
+                meta_description,
+                headings
+            )
+            for keyword in keywords
+        }
+
+    def analyze_batch(
+        self,
+        pages: List[Tuple[str, str]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Analyze many independent pages in parallel across CPU cores.
 
-        # Calculate word count
-        word_count = self._count_words(text_content)
+        Analysis is pure CPU work, so pages are spread over worker
+        processes rather than threads.
 
+        Args:
+            pages: (content, target_keyword) pairs
+            max_workers: Maximum number of worker processes (default: CPU count)
+
+        Returns:
+            One analyze_content() result per page, in input order
+        """
+        if len(pages) <= 1:
+            return [_analyze_page(page) for page in pages]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_analyze_page, pages, chunksize=8))
+
+    def _analyze_text(
+        self,
+        text_content: str,
+        text_lower: str,
+        words: List[str],
+        target_keyword: str,
+        title: str,
+        meta_description: str,
+        headings: Optional[List[str]]
+    ) -> Dict:
+        """Analyze already-stripped and tokenized text for a single keyword."""
         # Calculate keyword density
-        keyword_count = self._count_keyword_occurrences(text_content, target_keyword)
+        word_count = len(words)
+        keyword_count = self._count_keyword_occurrences(text_lower, target_keyword)
         density = (keyword_count / word_count * 100) if word_count > 0 else 0
 
         # Target density (1-2% is optimal)
@@ -69,7 +179,7 @@ class KeywordAnalyzer:
         )
 
         # Extract potential LSI keywords
-        lsi_keywords = self._extract_lsi_keywords(text_content, target_keyword)
+        lsi_keywords = self._extract_lsi_keywords(words, target_keyword)
 
         # Generate recommendations
         recommendations = []
@@ -112,21 +222,29 @@ class KeywordAnalyzer:
     def _strip_html(self, html_content: str) -> str:
         """Strip HTML tags and decode entities."""
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', ' ', html_content)
+        text = _TAG_RE.sub(' ', html_content)
         # Decode HTML entities
         text = html.unescape(text)
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
-
-    def _count_words(self, text: str) -> int:
-        """Count words in text."""
-        words = re.findall(r'\b\w+\b', text.lower())
-        return len(words)
-
-    def _count_keyword_occurrences(self, text: str, keyword: str) -> int:
-        """Count keyword occurrences (case-insensitive, whole phrase)."""
-        text_lower = text.lower()
+        # Normalize whitespace (str.split() also drops leading/trailing runs)
+        return ' '.join(text.split())
+
+    def _prepare_text(
+        self,
+        content: str,
+        plain_text: Optional[str] = None
+    ) -> Tuple[str, str, List[str]]:
+        """
+        Strip HTML and tokenize content once per analysis.
+
+        Returns:
+            Tuple of (stripped text, lowercased text, lowercased words)
+        """
+        text_content = self._strip_html(content) if plain_text is None else plain_text
+        text_lower = text_content.lower()
+        return text_content, text_lower, _WORD_RE.findall(text_lower)
+
+    def _count_keyword_occurrences(self, text_lower: str, keyword: str) -> int:
+        """Count keyword occurrences in already-lowercased text (whole phrase)."""
         keyword_lower = keyword.lower()
 
         # Count exact phrase matches
@@ -143,60 +261,59 @@ class KeywordAnalyzer:
         headings: List[str]
     ) -> Dict[str, bool]:
         """Check where the keyword appears."""
-        keyword_lower = keyword.lower()
+        # One case-insensitive pattern searches every region, so none of
+        # them needs a lowercased copy
+        search = _keyword_pattern(keyword).search
 
-        # Check first 100 words
-        words = content.split()[:100]
-        first_100_words = ' '.join(words).lower()
+        # Check first 100 words; maxsplit stops splitting after them and
+        # leaves the rest of the document in one trailing element
+        words = content.split(None, 100)[:100]
+        first_100_words = ' '.join(words)
 
         # Check H1 (first heading if provided)
         h1 = headings[0] if headings else ""
 
         return {
-            'in_title': keyword_lower in title.lower(),
-            'in_meta': keyword_lower in meta_description.lower(),
-            'in_h1': keyword_lower in h1.lower(),
-            'in_first_100': keyword_lower in first_100_words,
-            'in_headings': any(keyword_lower in h.lower() for h in headings)
+            'in_title': search(title) is not None,
+            'in_meta': search(meta_description) is not None,
+            'in_h1': search(h1) is not None,
+            'in_first_100': search(first_100_words) is not None,
+            'in_headings': any(search(h) is not None for h in headings)
         }
 
-    def _extract_lsi_keywords(self, text: str, target_keyword: str) -> List[str]:
+    def _extract_lsi_keywords(self, words: List[str], target_keyword: str) -> List[str]:
         """
         Extract potential LSI (Latent Semantic Indexing) keywords.
 
         For MVP: Simple extraction of common 2-3 word phrases.
         Future: Use AI/ML for semantic keyword extraction.
         """
-        # Extract 2-3 word phrases
-        words = re.findall(r'\b\w+\b', text.lower())
-
-        # Get bigrams and trigrams
-        bigrams = [' '.join(words[i:i+2]) for i in range(len(words)-1)]
-        trigrams = [' '.join(words[i:i+3]) for i in range(len(words)-2)]
-
-        all_phrases = bigrams + trigrams
-
-        # Count frequency
-        phrase_counts = Counter(all_phrases)
+        # Count bigrams, then trigrams, as word tuples; only the phrases
+        # that are kept get joined into strings
+        phrase_counts = Counter(zip(words, words[1:]))
+        phrase_counts.update(zip(words, words[1:], words[2:]))
 
         # Filter out stop-word-heavy phrases and target keyword
         target_lower = target_keyword.lower()
+        stop_words = self.stop_words
         lsi_candidates = []
 
-        for phrase, count in phrase_counts.most_common(20):
+        # Top 20 phrases by count. Phrases seen only once are never kept,
+        # so leave them out of the heap; they make up most of the counter
+        repeated = (item for item in phrase_counts.items() if item[1] >= 2)
+
+        for phrase_words, _ in heapq.nlargest(20, repeated, key=itemgetter(1)):
+            phrase = ' '.join(phrase_words)
+
             # Skip if it's the target keyword
             if phrase == target_lower:
                 continue
 
-            # Skip if too many stop words
-            phrase_words = phrase.split()
-            stop_word_count = sum(1 for w in phrase_words if w in self.stop_words)
-            if stop_word_count >= len(phrase_words):
+            # Skip if every word is a stop word
+            if all(w in stop_words for w in phrase_words):
                 continue
 
-            # Only include if appears at least 2 times
-            if count >= 2:
-                lsi_candidates.append(phrase)
+            lsi_candidates.append(phrase)
 
         return lsi_candidates[:5]  # Return top 5
 
@@ -266,11 +383,9 @@ class KeywordAnalyzer:
         suggestions = []
 
         # Calculate how many more mentions needed
-        word_count = self._count_words(self._strip_html(content))
-        current_count = self._count_keyword_occurrences(
-            self._strip_html(content),
-            target_keyword
-        )
+        _, text_lower, words = self._prepare_text(content)
+        word_count = len(words)
+        current_count = self._count_keyword_occurrences(text_lower, target_keyword)
         target_count = int(target_density * word_count / 100)
         needed = target_count - current_count
 
@@ -287,17 +402,17 @@ class KeywordAnalyzer:
         return suggestions
 
 
+def _analyze_page(page: Tuple[str, str]) -> Dict:
+    """Analyze one (content, target_keyword) pair; picklable for worker processes."""
+    content, target_keyword = page
+    return KeywordAnalyzer().analyze_content(content, target_keyword)
+
+
 def extract_keywords_from_title(title: str) -> List[str]:
     """Extract potential keywords from title."""
     # Remove common filler words
-    stop_words = {
-        'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
-        'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
-        'to', 'was', 'will', 'with', 'how', 'what', 'when', 'where', 'why'
-    }
-
-    words = re.findall(r'\b\w+\b', title.lower())
-    keywords = [w for w in words if w not in stop_words and len(w) > 3]
+    words = _WORD_RE.findall(title.lower())
+    keywords = [w for w in words if w not in _TITLE_STOP_WORDS and len(w) > 3]
 
     # Return as both individual words and potential phrases
     keyword_list = keywords.copy()
@@ -7,18 +7,65 @@ and scoring for any website content.
 ADAPTED FOR MULTI-PLATFORM: Works with NormalizedContent from any connector.
 """
 
-from typing import Dict, List, Optional, Union
+import copy
+import hashlib
+import json
+import re
+import sys
+import threading
+from collections import OrderedDict
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, TextIO, Union
 from .keyword_analyzer import KeywordAnalyzer, extract_keywords_from_title
-from .onpage_optimizer import OnPageOptimizer
+from .onpage_optimizer import OnPageOptimizer, _extract_features
+
+# Minimum score percentage for each status label, best first
+_STATUS_THRESHOLDS = ((90, 'excellent'), (70, 'good'), (50, 'needs work'))
+
+# On-page categories listed in the score breakdown, in report order
+_BREAKDOWN_CATEGORIES = ('title', 'meta_description', 'headers', 'content', 'images')
+
+# Sort rank of each recommendation priority
+_PRIORITY_ORDER = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+
+# Features of a blank document, shared read-only by analyses of posts with no body
+_EMPTY_FEATURES = {'headers': [], 'images': []}
+
+# Report progress bars at the default width, indexed by filled cells
+_PROGRESS_BAR_WIDTH = 20
+_PROGRESS_BARS = tuple(
+    "█" * filled + "░" * (_PROGRESS_BAR_WIDTH - filled)
+    for filled in range(_PROGRESS_BAR_WIDTH + 1)
+)
+
+# Issues counted as critical in the analysis summary; whole words only,
+# so e.g. "noncritical" does not count
+_CRITICAL_ISSUE_RE = re.compile(r'\b(?:critical|missing)\b', re.IGNORECASE)
 
 
 class SEOAnalyzer:
-    """Main SEO analyzer that orchestrates all analysis modules."""
+    """
+    Main SEO analyzer that orchestrates all analysis modules.
+
+    Analyzers keep no per-page state, so one instance can be reused (and
+    shared between threads) for any number of pages.
+    """
+
+    def __init__(self, cache_size: int = 0):
+        """
+        Initialize SEO analyzer with all sub-analyzers.
 
-    def __init__(self):
-        """Initialize SEO analyzer with all sub-analyzers."""
+        Args:
+            cache_size: Number of analyze() results to keep, keyed by a
+                hash of the analyzed fields, so re-analyzing identical
+                content (retries, duplicate URLs) is skipped. 0 disables
+                the cache.
+        """
         self.keyword_analyzer = KeywordAnalyzer()
         self.onpage_optimizer = OnPageOptimizer()
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def analyze(self, content: Union[Dict, 'NormalizedContent'], target_keyword: Optional[str] = None) -> Dict:
         """
@@ -38,18 +85,16 @@ class SEOAnalyzer:
                 - issues: List of issues found
                 - recommendations: Prioritized recommendations
                 - score_breakdown: Detailed score breakdown
+
+        Posts with a blank body skip HTML parsing entirely, so batches of
+        unpublished drafts are cheap to score.
         """
         # Handle both NormalizedContent and dict
-        if hasattr(content, 'title'):
-            # NormalizedContent object
-            post_data = {
-                'title': content.title,
-                'content': content.content,
-                'meta_description': content.meta_description,
-                'url_slug': content.url_slug,
-            }
-        else:
+        if isinstance(content, dict):
             post_data = content
+        else:
+            # NormalizedContent object
+            post_data = content.as_post_dict()
 
         # Auto-detect target keyword if not provided
         if not target_keyword:
@@ -61,8 +106,31 @@ class SEOAnalyzer:
         meta_description = post_data.get('meta_description', '')
         url_slug = post_data.get('url_slug', '')
 
-        # Extract headings from content
-        headings = self._extract_headings(html_content)
+        cache_key = None
+        if self.cache_size > 0:
+            cache_key = self._cache_key(
+                title, html_content, meta_description, url_slug, target_keyword
+            )
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        if html_content.strip():
+            # Extract and strip the content once; every analysis below shares them
+            features = _extract_features(html_content)
+            plain_text = self.keyword_analyzer._strip_html(html_content)
+
+            # Extract headings from content
+            headings = self._extract_headings(html_content, features)
+        else:
+            # Blank body (e.g. a draft): nothing to parse. Title, meta
+            # description and URL are still scored as usual
+            features = _EMPTY_FEATURES
+            plain_text = ''
+            headings = []
 
         # Run keyword analysis
         keyword_analysis = self.keyword_analyzer.analyze_content(
@@ -70,7 +138,8 @@ class SEOAnalyzer:
             target_keyword=target_keyword,
             title=title,
             meta_description=meta_description,
-            headings=headings
+            headings=headings,
+            plain_text=plain_text
         )
 
         # Run on-page analysis
@@ -81,7 +150,9 @@ class SEOAnalyzer:
             'url_slug': url_slug,
             'target_keyword': target_keyword
         }
-        onpage_analysis = self.onpage_optimizer.analyze_onpage(onpage_data)
+        onpage_analysis = self.onpage_optimizer.analyze_onpage(
+            onpage_data, plain_text=plain_text, features=features
+        )
 
         # Calculate overall score (0-100)
         keyword_score = keyword_analysis['score']  # Out of 100
@@ -93,10 +164,17 @@ class SEOAnalyzer:
             (onpage_score / 70 * 85)  # 85% weight
         )
 
-        # Collect all issues
+        # Collect all issues, counting critical ones in the same pass
         all_issues = []
-        all_issues.extend(keyword_analysis.get('recommendations', []))
-        all_issues.extend(onpage_analysis.get('issues', []))
+        critical_issues = 0
+        is_critical = _CRITICAL_ISSUE_RE.search
+        for issue in chain(
+            keyword_analysis.get('recommendations', ()),
+            onpage_analysis.get('issues', ())
+        ):
+            all_issues.append(issue)
+            if is_critical(issue):
+                critical_issues += 1
 
         # Collect recommendations with priority
         recommendations = self._prioritize_recommendations(
@@ -111,46 +189,19 @@ class SEOAnalyzer:
                 'max': 100,
                 'percentage': keyword_score,
                 'status': self._get_status(keyword_score, 100)
-            },
-            'title': {
-                'score': onpage_analysis['title']['score'],
-                'max': onpage_analysis['title']['max_score'],
-                'percentage': int(onpage_analysis['title']['score'] / onpage_analysis['title']['max_score'] * 100),
-                'status': 'optimal' if onpage_analysis['title']['optimal'] else 'needs work'
-            },
-            'meta_description': {
-                'score': onpage_analysis['meta_description']['score'],
-                'max': onpage_analysis['meta_description']['max_score'],
-                'percentage': int(onpage_analysis['meta_description']['score'] / onpage_analysis['meta_description']['max_score'] * 100),
-                'status': 'optimal' if onpage_analysis['meta_description']['optimal'] else 'needs work'
-            },
-            'headers': {
-                'score': onpage_analysis['headers']['score'],
-                'max': onpage_analysis['headers']['max_score'],
-                'percentage': int(onpage_analysis['headers']['score'] / onpage_analysis['headers']['max_score'] * 100),
-                'status': 'optimal' if onpage_analysis['headers']['optimal'] else 'needs work'
-            },
-            'content': {
-                'score': onpage_analysis['content']['score'],
-                'max': onpage_analysis['content']['max_score'],
-                'percentage': int(onpage_analysis['content']['score'] / onpage_analysis['content']['max_score'] * 100),
-                'status': 'optimal' if onpage_analysis['content']['optimal'] else 'needs work'
-            },
-            'images': {
-                'score': onpage_analysis['images']['score'],
-                'max': onpage_analysis['images']['max_score'],
-                'percentage': int(onpage_analysis['images']['score'] / onpage_analysis['images']['max_score'] * 100),
-                'status': 'optimal' if onpage_analysis['images']['optimal'] else 'needs work'
             }
         }
+        for category in _BREAKDOWN_CATEGORIES:
+            category_analysis = onpage_analysis[category]
+            score, max_score = category_analysis['score'], category_analysis['max_score']
+            score_breakdown[category] = {
+                'score': score,
+                'max': max_score,
+                'percentage': score * 100 // max_score,
+                'status': 'optimal' if category_analysis['optimal'] else 'needs work'
+            }
 
-        # Count critical issues
-        critical_issues = len([
-            r for r in all_issues
-            if 'critical' in r.lower() or 'missing' in r.lower()
-        ])
-
-        return {
+        result = {
             'overall_score': overall_score,
             'target_keyword': target_keyword,
             'keyword_analysis': keyword_analysis,
@@ -162,6 +213,23 @@ class SEOAnalyzer:
             'summary': self._generate_summary(overall_score, critical_issues, len(recommendations))
         }
 
+        if cache_key is not None:
+            # Keep a private copy so callers can't modify the cached result
+            with self._cache_lock:
+                self._cache[cache_key] = copy.deepcopy(result)
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return result
+
+    def _cache_key(self, *fields: str) -> bytes:
+        """Hash the analyzed fields into an analyze() cache key."""
+        return hashlib.blake2b(
+            "\x00".join(fields).encode("utf-8", "surrogatepass"),
+            digest_size=16
+        ).digest()
+
     def _detect_primary_keyword(self, post_data: Dict) -> str:
         """Auto-detect primary keyword from title."""
         title = post_data.get('title', '')
@@ -169,23 +237,22 @@ class SEOAnalyzer:
 
         # Return first 2-3 word phrase
         for candidate in candidates:
-            if len(candidate.split()) >= 2 and len(candidate.split()) <= 3:
+            if 2 <= len(candidate.split()) <= 3:
                 return candidate
 
         # Fallback: return first phrase or first word
         return candidates[0] if candidates else "main topic"
 
-    def _extract_headings(self, html_content: str) -> List[str]:
-        """Extract all heading text from HTML content."""
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html_content, 'html.parser')
-        headings = []
-
-        for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            for heading in soup.find_all(tag):
-                headings.append(heading.get_text())
+    def _extract_headings(
+        self, html_content: str, features: Optional[Dict] = None
+    ) -> List[str]:
+        """Extract all heading text from HTML content (or its extracted features)."""
+        if features is None:
+            features = _extract_features(html_content)
 
-        return headings
+        # Group by level (all H1s first, then H2s, ...); the stable sort
+        # keeps document order within each level
+        return [text for _, text in sorted(features['headers'], key=lambda header: header[0])]
 
     def _prioritize_recommendations(
         self,
@@ -202,6 +269,10 @@ class SEOAnalyzer:
         - LOW: Nice to have (URL optimization, etc.)
         """
         recommendations = []
+        target_keyword = keyword_analysis['target_keyword']
+        headers = onpage_analysis['headers']
+        images = onpage_analysis['images']
+        content = onpage_analysis['content']
 
         # CRITICAL: Missing essential elements
         if onpage_analysis['meta_description']['score'] == 0:
@@ -213,12 +284,12 @@ class SEOAnalyzer:
                 'impact': '+10 points'
             })
 
-        if onpage_analysis['headers']['h1_count'] == 0:
+        if headers['h1_count'] == 0:
             recommendations.append({
                 'priority': 'CRITICAL',
                 'category': 'Headers',
                 'issue': 'No H1 heading',
-                'action': f"Add H1 heading with '{keyword_analysis['target_keyword']}'",
+                'action': f"Add H1 heading with '{target_keyword}'",
                 'impact': '+5 points'
             })
 
@@ -228,7 +299,7 @@ class SEOAnalyzer:
                 'priority': 'HIGH',
                 'category': 'Keywords',
                 'issue': 'Target keyword not in title',
-                'action': f"Include '{keyword_analysis['target_keyword']}' in title tag",
+                'action': f"Include '{target_keyword}' in title tag",
                 'impact': '+15 points'
             })
 
@@ -242,29 +313,29 @@ class SEOAnalyzer:
             })
 
         # HIGH: Image optimization
-        if onpage_analysis['images']['total_images'] > 0:
-            if onpage_analysis['images']['alt_percentage'] < 100:
-                missing = onpage_analysis['images']['total_images'] - onpage_analysis['images']['images_with_alt']
+        if images['total_images'] > 0:
+            if images['alt_percentage'] < 100:
+                missing = images['total_images'] - images['images_with_alt']
                 recommendations.append({
                     'priority': 'HIGH',
                     'category': 'Images',
                     'issue': f"{missing} images missing alt text",
                     'action': 'Add descriptive alt text to all images',
-                    'impact': f'+{10 - onpage_analysis["images"]["score"]} points'
+                    'impact': f'+{10 - images["score"]} points'
                 })
 
         # MEDIUM: Content quality
-        if onpage_analysis['content']['word_count'] < 1000:
+        if content['word_count'] < 1000:
             recommendations.append({
                 'priority': 'MEDIUM',
                 'category': 'Content',
-                'issue': f"Content too short ({onpage_analysis['content']['word_count']} words)",
+                'issue': f"Content too short ({content['word_count']} words)",
                 'action': 'Expand content to 1000+ words',
                 'impact': '+5 points'
             })
 
         # MEDIUM: Header structure
-        if onpage_analysis['headers']['h2_count'] < 2:
+        if headers['h2_count'] < 2:
             recommendations.append({
                 'priority': 'MEDIUM',
                 'category': 'Headers',
@@ -279,27 +350,22 @@ class SEOAnalyzer:
                 'priority': 'LOW',
                 'category': 'URL',
                 'issue': 'Keyword not in URL',
-                'action': f"Include '{keyword_analysis['target_keyword']}' in URL slug",
+                'action': f"Include '{target_keyword}' in URL slug",
                 'impact': '+3 points'
             })
 
         # Sort by priority
-        priority_order = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
-        recommendations.sort(key=lambda x: priority_order[x['priority']])
+        recommendations.sort(key=lambda x: _PRIORITY_ORDER[x['priority']])
 
         return recommendations
 
     def _get_status(self, score: int, max_score: int) -> str:
         """Get status label based on score percentage."""
         percentage = score / max_score * 100
-        if percentage >= 90:
-            return 'excellent'
-        elif percentage >= 70:
-            return 'good'
-        elif percentage >= 50:
-            return 'needs work'
-        else:
-            return 'poor'
+        for threshold, status in _STATUS_THRESHOLDS:
+            if percentage >= threshold:
+                return status
+        return 'poor'
 
     def _generate_summary(
         self,
@@ -321,14 +387,14 @@ class SEOAnalyzer:
             grade = "Poor"
             emoji = "❌"
 
-        summary = f"{emoji} SEO Score: {overall_score}/100 ({grade})\n"
+        lines = [f"{emoji} SEO Score: {overall_score}/100 ({grade})"]
 
         if critical_issues > 0:
-            summary += f"⚠️  {critical_issues} critical issue(s) need immediate attention\n"
+            lines.append(f"⚠️  {critical_issues} critical issue(s) need immediate attention")
 
-        summary += f"📋 {total_recommendations} optimization opportunities identified"
+        lines.append(f"📋 {total_recommendations} optimization opportunities identified")
 
-        return summary
+        return "\n".join(lines)
 
     def generate_report(self, analysis: Dict, format: str = 'text') -> str:
         """
@@ -344,77 +410,97 @@ class SEOAnalyzer:
         if format == 'text' or format == 'markdown':
             return self._generate_text_report(analysis)
         elif format == 'json':
-            import json
             return json.dumps(analysis, indent=2)
         else:
             raise ValueError(f"Unknown format: {format}")
 
+    def write_report(self, analysis: Dict, stream: Optional[TextIO] = None) -> None:
+        """
+        Write the text report to a stream line by line.
+
+        Produces the same output as print(generate_report(analysis))
+        without building the whole report string first.
+
+        Args:
+            analysis: Analysis results from analyze()
+            stream: Writable text stream (default: sys.stdout)
+        """
+        if stream is None:
+            stream = sys.stdout
+        stream.writelines(f"{line}\n" for line in self._iter_report_lines(analysis))
+
     def _generate_text_report(self, analysis: Dict) -> str:
         """Generate text/markdown formatted report."""
-        report = []
+        return "\n".join(self._iter_report_lines(analysis))
 
+    def _iter_report_lines(self, analysis: Dict) -> Iterator[str]:
+        """Yield the lines of the text/markdown report."""
         # Header
-        report.append("="*60)
-        report.append("  SEO ANALYSIS REPORT")
-        report.append("="*60)
-        report.append("")
+        yield "="*60
+        yield "  SEO ANALYSIS REPORT"
+        yield "="*60
+        yield ""
 
         # Summary
-        report.append(analysis['summary'])
-        report.append("")
+        yield analysis['summary']
+        yield ""
 
         # Target keyword
-        report.append(f"Target Keyword: \"{analysis['target_keyword']}\"")
-        report.append("")
+        yield f"Target Keyword: \"{analysis['target_keyword']}\""
+        yield ""
 
         # Score breakdown
-        report.append("SCORE BREAKDOWN:")
-        report.append("-"*60)
+        yield "SCORE BREAKDOWN:"
+        yield "-"*60
         for category, data in analysis['score_breakdown'].items():
             bar = self._create_progress_bar(data['percentage'])
             status_icon = "✅" if data['status'] == 'optimal' else "⚠️"
-            report.append(f"  {status_icon} {category.replace('_', ' ').title()}: {bar} {data['score']}/{data['max']}")
-        report.append("")
+            yield f"  {status_icon} {category.replace('_', ' ').title()}: {bar} {data['score']}/{data['max']}"
+        yield ""
 
         # Keyword analysis
         ka = analysis['keyword_analysis']
-        report.append("KEYWORDS:")
-        report.append(f"  Density: {ka['density']}% (Target: {ka['target_density']}%)")
-        report.append(f"  Keyword Count: {ka['keyword_count']}")
-        report.append(f"  Word Count: {ka['word_count']}")
-        report.append(f"  Placement:")
+        yield "KEYWORDS:"
+        yield f"  Density: {ka['density']}% (Target: {ka['target_density']}%)"
+        yield f"  Keyword Count: {ka['keyword_count']}"
+        yield f"  Word Count: {ka['word_count']}"
+        yield f"  Placement:"
         for key, value in ka['placement'].items():
             icon = "✅" if value else "❌"
-            report.append(f"    {icon} {key.replace('_', ' ').title()}")
+            yield f"    {icon} {key.replace('_', ' ').title()}"
 
         if ka.get('lsi_keywords'):
-            report.append(f"  LSI Keywords: {', '.join(ka['lsi_keywords'][:3])}")
-        report.append("")
+            yield f"  LSI Keywords: {', '.join(ka['lsi_keywords'][:3])}"
+        yield ""
 
         # Recommendations
         recommendations = analysis['recommendations']
         if recommendations:
-            report.append("RECOMMENDATIONS:")
-            report.append("-"*60)
+            yield "RECOMMENDATIONS:"
+            yield "-"*60
+
+            # Group by priority in one pass
+            by_priority = {priority: [] for priority in _PRIORITY_ORDER}
+            for rec in recommendations:
+                by_priority[rec['priority']].append(rec)
 
-            # Group by priority
-            for priority in ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']:
-                priority_recs = [r for r in recommendations if r['priority'] == priority]
+            for priority, priority_recs in by_priority.items():
                 if priority_recs:
                     icon = "🔴" if priority == 'CRITICAL' else "🟠" if priority == 'HIGH' else "🟡" if priority == 'MEDIUM' else "🟢"
-                    report.append(f"\n{icon} {priority} PRIORITY:")
+                    yield f"\n{icon} {priority} PRIORITY:"
                     for i, rec in enumerate(priority_recs, 1):
-                        report.append(f"  {i}. {rec['category']}: {rec['action']}")
+                        yield f"  {i}. {rec['category']}: {rec['action']}"
                         if rec.get('impact'):
-                            report.append(f"     Impact: {rec['impact']}")
+                            yield f"     Impact: {rec['impact']}"
 
-        report.append("")
-        report.append("="*60)
-
-        return "\n".join(report)
+        yield ""
+        yield "="*60
 
     def _create_progress_bar(self, percentage: int, width: int = 20) -> str:
         """Create ASCII progress bar."""
         filled = int(width * percentage / 100)
-        bar = "█" * filled + "░" * (width - filled)
+        if width == _PROGRESS_BAR_WIDTH and 0 <= filled <= width:
+            bar = _PROGRESS_BARS[filled]
+        else:
+            bar = "█" * filled + "░" * (width - filled)
         return f"[{bar}] {percentage}%"
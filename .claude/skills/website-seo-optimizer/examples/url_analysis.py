@@ -7,11 +7,13 @@ Demonstrates end-to-end SEO analysis of any public URL.
 Usage:
     python examples/url_analysis.py https://example.com
     python examples/url_analysis.py https://github.com --keyword "open source"
+    python examples/url_analysis.py https://example.com/a https://example.com/b
 """
 
 import sys
 import os
 import io
+from concurrent.futures import ProcessPoolExecutor
 
 # Set UTF-8 encoding for Windows console
 if sys.platform == 'win32':
@@ -24,23 +26,92 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from connectors import create_url_connector, ConnectorError
 from core import SEOAnalyzer
 
+# Analyzer owned by each worker process, created once by _init_worker()
+_worker_analyzer = None
+
+
+def _init_worker():
+    """Create the analyzer reused for every page a worker process handles."""
+    global _worker_analyzer
+    _worker_analyzer = SEOAnalyzer()
+
+
+def _analyze_worker(content, target_keyword):
+    """Analyze one fetched page inside a worker process."""
+    return _worker_analyzer.analyze(content, target_keyword=target_keyword)
+
+
+def analyze_many(urls, target_keyword=None, workers=None):
+    """
+    Fetch and analyze several URLs.
+
+    Fetching is network-bound and overlaps on threads; parsing and
+    scoring are CPU-bound, so fetched pages are analyzed in parallel
+    worker processes.
+
+    Args:
+        urls: URLs to analyze
+        target_keyword: Keyword for every page (auto-detected if None)
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        One (url, result) pair per URL, in input order, where result is
+        the analysis or the ConnectorError raised while fetching
+    """
+    workers = workers or os.cpu_count() or 1
+    connector = create_url_connector()
+    contents = connector.fetch_many(urls, max_workers=workers * 4)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = [
+            None if isinstance(content, ConnectorError)
+            else executor.submit(_analyze_worker, content, target_keyword)
+            for content in contents
+        ]
+        return [
+            (url, content if future is None else future.result())
+            for url, content, future in zip(urls, contents, futures)
+        ]
+
 
 def main():
     """Main analysis workflow."""
     # Parse arguments
-    if len(sys.argv) < 2:
-        print("Usage: python url_analysis.py <url> [--keyword <keyword>]")
+    urls = sys.argv[1:]
+    target_keyword = None
+
+    # Parse optional keyword argument
+    if '--keyword' in urls:
+        index = urls.index('--keyword')
+        if index + 1 < len(urls):
+            target_keyword = urls[index + 1]
+        # Drop only the option and its value; URLs may follow it
+        del urls[index:index + 2]
+
+    if not urls:
+        print("Usage: python url_analysis.py <url> [<url> ...] [--keyword <keyword>]")
         print("\nExamples:")
         print("  python url_analysis.py https://example.com")
         print("  python url_analysis.py https://github.com --keyword 'open source'")
+        print("  python url_analysis.py https://example.com/a https://example.com/b")
         sys.exit(1)
 
-    url = sys.argv[1]
-    target_keyword = None
+    # Several URLs: fetch and analyze them in parallel, one line per URL
+    if len(urls) > 1:
+        try:
+            results = analyze_many(urls, target_keyword=target_keyword)
+        except ConnectorError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
 
-    # Parse optional keyword argument
-    if len(sys.argv) >= 4 and sys.argv[2] == '--keyword':
-        target_keyword = sys.argv[3]
+        for url, result in results:
+            if isinstance(result, ConnectorError):
+                print(f"❌ {url}: {result}")
+            else:
+                print(f"{result['overall_score']:>3}/100  {url}")
+        return
+
+    url = urls[0]
 
     print(f"Analyzing URL: {url}")
     if target_keyword:
@@ -67,9 +138,8 @@ def main():
 
         # Step 3: Generate and display report
         print("[3/3] Generating report...")
-        report = analyzer.generate_report(analysis, format='text')
         print()
-        print(report)
+        analyzer.write_report(analysis)
 
         # Display optimization suggestions if score < 80
         if analysis['overall_score'] < 80:
@@ -0,0 +1,70 @@
+"""Tests for URLConnector page decoding."""
+
+import datetime
+import io
+import os
+import sys
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from connectors import url_connector  # noqa: E402
+
+PAGE = (
+    '<html><head>{meta}<title>Café résumé</title></head>'
+    '<body><h1>Crème brûlée</h1><main><p>Déjà vu</p></main></body></html>'
+)
+
+
+def _fake_get(body: bytes, content_type: str):
+    """session.get() stand-in returning a streamed response for body."""
+    def get(url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers = CaseInsensitiveDict({'content-type': content_type})
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(body)
+        response.elapsed = datetime.timedelta(0)
+        return response
+    return get
+
+
+@pytest.fixture(params=['lexbor', 'soup'])
+def connector(request, monkeypatch):
+    """URLConnector using each HTML parser path."""
+    if request.param == 'lexbor' and url_connector.LexborHTMLParser is None:
+        pytest.skip('selectolax not installed')
+    if request.param == 'soup':
+        monkeypatch.setattr(url_connector, 'LexborHTMLParser', None)
+    return url_connector.URLConnector()
+
+
+@pytest.mark.parametrize('meta, content_type', [
+    ('', 'text/html; charset=ISO-8859-1'),
+    ('<meta charset="iso-8859-1">', 'text/html'),
+])
+def test_fetch_decodes_latin1_page(connector, meta, content_type):
+    """Latin-1 pages declared by header or <meta charset> decode correctly."""
+    body = PAGE.format(meta=meta).encode('latin-1')
+    connector.session.get = _fake_get(body, content_type)
+
+    result = connector.fetch('https://example.com/cafe')
+
+    assert result.title == 'Café résumé'
+    assert [h['text'] for h in result.headings] == ['Crème brûlée']
+    assert 'Déjà vu' in result.content
+
+
+def test_fetch_decodes_utf8_page_without_charset(connector):
+    """UTF-8 pages without any declared charset still decode correctly."""
+    body = PAGE.format(meta='').encode('utf-8')
+    connector.session.get = _fake_get(body, 'text/html')
+
+    result = connector.fetch('https://example.com/cafe')
+
+    assert result.title == 'Café résumé'
+    assert [h['text'] for h in result.headings] == ['Crème brûlée']
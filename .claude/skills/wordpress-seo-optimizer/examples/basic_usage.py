@@ -10,11 +10,27 @@ Demonstrates how to:
 
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 # Add parent directory to path to import modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from modules.seo_analyzer import SEOAnalyzer
+from modules.seo_analyzer import PostResult, SEOAnalyzer
+
+# Analyzer owned by each batch worker process, created once by _init_worker()
+_worker_analyzer = None
+
+
+def _init_worker():
+    """Create the analyzer reused for every post a worker process handles."""
+    global _worker_analyzer
+    _worker_analyzer = SEOAnalyzer()
+
+
+def _analyze_one(post):
+    """Analyze one post inside a worker process and return its summary row."""
+    analysis = _worker_analyzer.analyze(post)
+    return PostResult.from_analysis(post['id'], post['title'], analysis)
 
 
 # EXAMPLE 1: Analyze Post SEO (without WordPress connection)
@@ -265,31 +281,37 @@ def example_batch_analysis():
         }
     ]
 
-    analyzer = SEOAnalyzer()
-    results = []
-
     print(f"Analyzing {len(posts)} posts...")
     print()
 
-    for post in posts:
-        analysis = analyzer.analyze(post)
-        results.append({
-            'id': post['id'],
-            'title': post['title'],
-            'score': analysis['overall_score'],
-            'critical_issues': analysis['critical_issues'],
-            'recommendations': len(analysis['recommendations'])
-        })
-
-        print(f"Post {post['id']}: {post['title']}")
-        print(f"  Score: {analysis['overall_score']}/100")
-        print(f"  Critical Issues: {analysis['critical_issues']}")
-        print(f"  Recommendations: {len(analysis['recommendations'])}")
-        print()
-
-    # Summary
-    avg_score = sum(r['score'] for r in results) / len(results)
-    total_critical = sum(r['critical_issues'] for r in results)
+    # Analysis is CPU-bound and independent per post, so spread it across
+    # worker processes; map() keeps results in input order
+    workers = min(os.cpu_count() or 1, 4)
+    # Send posts in chunks so pickling and IPC are paid per chunk, not per post
+    chunksize = max(1, len(posts) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        results = list(executor.map(_analyze_one, posts, chunksize=chunksize))
+
+    # Build the per-post lines and write them in one call
+    lines = []
+    for result in results:
+        lines.append(f"Post {result.id}: {result.title}")
+        lines.append(f"  Score: {result.score}/100")
+        lines.append(f"  Critical Issues: {result.critical_issues}")
+        lines.append(f"  Recommendations: {result.recommendations}")
+        lines.append("")
+    print("\n".join(lines))
+
+    # Summary: gather the totals and low scorers in a single pass
+    total_score = 0
+    total_critical = 0
+    needs_work = []
+    for r in results:
+        total_score += r.score
+        total_critical += r.critical_issues
+        if r.score < 70:
+            needs_work.append(r)
+    avg_score = total_score / len(results)
 
     print("="*70)
     print("BATCH SUMMARY")
@@ -300,21 +322,26 @@ def example_batch_analysis():
     print()
 
     # Posts needing attention
-    needs_work = [r for r in results if r['score'] < 70]
     if needs_work:
         print("Posts Needing Attention:")
         for post in needs_work:
-            print(f"  • Post {post['id']}: {post['title']} (Score: {post['score']}/100)")
+            print(f"  • Post {post.id}: {post.title} (Score: {post.score}/100)")
 
 
 # Run examples
 if __name__ == "__main__":
     import argparse
 
+    examples = {
+        'local': example_analyze_local,
+        'wordpress': example_wordpress_integration,
+        'batch': example_batch_analysis,
+    }
+
     parser = argparse.ArgumentParser(description='WordPress SEO Optimizer Examples')
     parser.add_argument(
         'example',
-        choices=['local', 'wordpress', 'batch', 'all'],
+        choices=[*examples, 'all'],
         nargs='?',
         default='local',
         help='Which example to run'
@@ -322,13 +349,9 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    if args.example == 'local' or args.example == 'all':
-        example_analyze_local()
-        print("\n\n")
-
-    if args.example == 'wordpress' or args.example == 'all':
-        example_wordpress_integration()
-        print("\n\n")
+    to_run = list(examples.values()) if args.example == 'all' else [examples[args.example]]
 
-    if args.example == 'batch' or args.example == 'all':
-        example_batch_analysis()
+    for i, run_example in enumerate(to_run):
+        if i:
+            print("\n\n")
+        run_example()
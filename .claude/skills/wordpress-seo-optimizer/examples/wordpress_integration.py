@@ -11,19 +11,50 @@ Demonstrates full WordPress REST API integration including:
 
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from modules import (
     SEOAnalyzer,
+    PostResult,
     WordPressConnector,
+    WPPost,
     create_connector,
     WordPressNotAvailableError,
     TechnicalAuditor,
     SchemaGenerator
 )
 
+# Analyzer owned by each batch worker process, created once by _init_worker()
+_worker_analyzer = None
+
+
+def _init_worker():
+    """Create the analyzer reused for every post a worker process handles."""
+    global _worker_analyzer
+    _worker_analyzer = SEOAnalyzer()
+
+
+def _analyze_one(post_data: WPPost):
+    """
+    Analyze one fetched post inside a worker process.
+
+    Returns the exception instead of raising it, so one bad post does not
+    abort the rest of its chunk.
+    """
+    try:
+        return _worker_analyzer.analyze({
+            'title': post_data['title'],
+            'content': post_data['content'],
+            'meta_description': post_data['meta_description'],
+            'url_slug': post_data['slug']
+        })
+    except Exception as e:
+        return e
+
 
 def example_wordpress_connection():
     """Example 1: Connect to WordPress and list posts."""
@@ -82,7 +113,7 @@ def example_analyze_wordpress_post(connector: WordPressConnector, post_id: int):
         'content': post_data['content'],
         'meta_description': post_data['meta_description'],
         'url_slug': post_data['slug'],
-        'target_keyword': post_data.get('focus_keyword') or None
+        'target_keyword': post_data['focus_keyword'] or None
     }
 
     analysis = analyzer.analyze(analysis_data)
@@ -94,15 +125,20 @@ def example_analyze_wordpress_post(connector: WordPressConnector, post_id: int):
     return post_data, analysis
 
 
-def example_technical_audit(connector: WordPressConnector, post_id: int):
+def example_technical_audit(
+    connector: WordPressConnector,
+    post_id: int,
+    post_data: Optional[WPPost] = None
+):
     """Example 3: Technical SEO audit of WordPress post."""
     print("\n" + "="*70)
     print(f"EXAMPLE 3: Technical SEO Audit")
     print("="*70)
     print()
 
-    # Fetch post
-    post_data = connector.fetch_post(post_id)
+    # Fetch post (unless it was already fetched)
+    if post_data is None:
+        post_data = connector.fetch_post(post_id)
 
     # Create full HTML page (simplified - real implementation would fetch the actual rendered page)
     full_html = f"""
@@ -120,7 +156,7 @@ def example_technical_audit(connector: WordPressConnector, post_id: int):
     </html>
     """
 
-    # Run technical audit
+    # Run technical audit (the page is parsed once for all checks)
     auditor = TechnicalAuditor()
     tech_audit = auditor.audit(post_data['link'], full_html)
 
@@ -148,7 +184,7 @@ def example_technical_audit(connector: WordPressConnector, post_id: int):
     return tech_audit
 
 
-def example_generate_schema(post_data: dict):
+def example_generate_schema(post_data: WPPost):
     """Example 4: Generate and display schema markup."""
     print("\n" + "="*70)
     print("EXAMPLE 4: Generate Schema Markup")
@@ -163,7 +199,7 @@ def example_generate_schema(post_data: dict):
         author_name="Your Name",  # In real implementation, get from post
         date_published=post_data['date'],
         date_modified=post_data['modified'],
-        description=post_data.get('excerpt', ''),
+        description=post_data['excerpt'],
         image_url=post_data.get('featured_image_url'),
         publisher_name="Your Site Name",
         publisher_logo="https://yoursite.com/logo.png"
@@ -232,22 +268,37 @@ def example_apply_optimizations(
     print(f"  {optimized_meta}")
     print()
 
+    # Collect proposed changes so they are sent in one batch request
+    pending = [{
+        'post_id': post_id,
+        'title': optimized_title if optimized_title != post_data['title'] else None,
+        'meta_description': optimized_meta,
+        'focus_keyword': analysis['target_keyword']
+    }]
+
     # Ask for confirmation
     apply = input("\nApply these optimizations? (yes/no): ").strip().lower()
 
     if apply == 'yes':
         print("\nApplying optimizations...")
 
-        # Update post via WordPress REST API
-        result = connector.update_post_seo(
-            post_id=post_id,
-            title=optimized_title if optimized_title != post_data['title'] else None,
-            meta_description=optimized_meta,
-            focus_keyword=analysis['target_keyword']
-        )
-
-        print("✅ Optimizations applied successfully!")
-        print(f"\nView updated post: {post_data['link']}")
+        # Update posts via the WordPress REST batch endpoint
+        responses = connector.batch_update_post_seo(pending)
+
+        # The batch call succeeds as a whole; each post's own outcome is
+        # in its sub-response status
+        failures = [r for r in responses if not 200 <= r.get('status', 0) < 300]
+
+        if not responses:
+            print("No changes: the post already has these values")
+        elif failures:
+            for response in failures:
+                body = response.get('body')
+                message = body.get('message', '') if isinstance(body, dict) else body
+                print(f"❌ Update rejected (HTTP {response.get('status')}): {message}")
+        else:
+            print("✅ Optimizations applied successfully!")
+            print(f"\nView updated post: {post_data['link']}")
     else:
         print("❌ Optimizations not applied")
 
@@ -264,54 +315,63 @@ def example_batch_analysis(connector: WordPressConnector):
 
     print(f"Analyzing {len(posts)} posts...\n")
 
-    analyzer = SEOAnalyzer()
     results = []
+    workers = min(os.cpu_count() or 1, 4)
+
+    # REST fetches are network-bound and overlap in one batch; each fetched
+    # post is then analyzed in a worker process
+    fetched = connector.fetch_posts([post['id'] for post in posts])
+
+    to_analyze = [post_data for post_data in fetched if not isinstance(post_data, Exception)]
+    # Send posts in chunks so pickling and IPC are paid per chunk, not per post
+    chunksize = max(1, len(to_analyze) // (4 * workers))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        analyses = executor.map(_analyze_one, to_analyze, chunksize=chunksize)
+
+        # Build the per-post lines and write them in one call
+        lines = []
+        for post, post_data in zip(posts, fetched):
+            # A failed fetch has no analysis; otherwise take the next one
+            analysis = post_data if isinstance(post_data, Exception) else next(analyses)
+
+            if isinstance(analysis, Exception):
+                lines.append(f"  ❌ Error analyzing post {post['id']}: {analysis}")
+                continue
+
+            results.append(PostResult.from_analysis(post['id'], post['title'], analysis))
+
+            lines.append(f"  {post['id']}: {post['title'][:50]}")
+            lines.append(f"       Score: {analysis['overall_score']}/100 | Issues: {analysis['critical_issues']}")
 
-    for post in posts:
-        try:
-            # Fetch full post data
-            post_data = connector.fetch_post(post['id'])
-
-            # Analyze
-            analysis = analyzer.analyze({
-                'title': post_data['title'],
-                'content': post_data['content'],
-                'meta_description': post_data['meta_description'],
-                'url_slug': post_data['slug']
-            })
-
-            results.append({
-                'id': post['id'],
-                'title': post['title'],
-                'score': analysis['overall_score'],
-                'critical_issues': analysis['critical_issues'],
-                'recommendations': len(analysis['recommendations'])
-            })
-
-            print(f"  {post['id']}: {post['title'][:50]}")
-            print(f"       Score: {analysis['overall_score']}/100 | Issues: {analysis['critical_issues']}")
-
-        except Exception as e:
-            print(f"  ❌ Error analyzing post {post['id']}: {e}")
+    if lines:
+        print("\n".join(lines))
 
     # Summary
     print("\n" + "="*70)
     print("BATCH SUMMARY")
     print("="*70)
 
-    avg_score = sum(r['score'] for r in results) / len(results) if results else 0
-    total_critical = sum(r['critical_issues'] for r in results)
+    # Gather the totals and low scorers in a single pass
+    total_score = 0
+    total_critical = 0
+    needs_work = []
+    for r in results:
+        total_score += r.score
+        total_critical += r.critical_issues
+        if r.score < 70:
+            needs_work.append(r)
+    avg_score = total_score / len(results) if results else 0
 
     print(f"Total Posts Analyzed: {len(results)}")
     print(f"Average SEO Score: {avg_score:.1f}/100")
     print(f"Total Critical Issues: {total_critical}")
 
     # Posts needing attention
-    needs_work = [r for r in results if r['score'] < 70]
     if needs_work:
         print(f"\nPosts Needing Attention ({len(needs_work)}):")
         for post in needs_work:
-            print(f"  • ID {post['id']}: {post['title'][:50]} (Score: {post['score']}/100)")
+            print(f"  • ID {post.id}: {post.title[:50]} (Score: {post.score}/100)")
 
 
 def main():
@@ -342,7 +402,7 @@ def main():
     post_data, analysis = example_analyze_wordpress_post(connector, post_id)
 
     # Example 3: Technical audit
-    tech_audit = example_technical_audit(connector, post_id)
+    tech_audit = example_technical_audit(connector, post_id, post_data)
 
     # Example 4: Generate schema
     schema = example_generate_schema(post_data)
@@ -2,26 +2,64 @@
 WordPress SEO Optimizer Modules
 
 Core analysis and optimization modules for WordPress SEO.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+one class does not pull in the dependencies of the others.
 """
 
-from .keyword_analyzer import KeywordAnalyzer, extract_keywords_from_title
-from .onpage_optimizer import OnPageOptimizer
-from .seo_analyzer import SEOAnalyzer
-from .technical_auditor import TechnicalAuditor, SchemaValidator
-from .schema_generator import SchemaGenerator
-from .wordpress_connector import WordPressConnector, create_connector, WordPressNotAvailableError
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'KeywordAnalyzer': 'keyword_analyzer',
+    'extract_keywords_from_title': 'keyword_analyzer',
+    'OnPageOptimizer': 'onpage_optimizer',
+    'SEOAnalyzer': 'seo_analyzer',
+    'PostResult': 'seo_analyzer',
+    'TechnicalAuditor': 'technical_auditor',
+    'SchemaValidator': 'technical_auditor',
+    'SchemaGenerator': 'schema_generator',
+    'WordPressConnector': 'wordpress_connector',
+    'WPPost': 'wordpress_connector',
+    'WPPostStats': 'wordpress_connector',
+    'create_connector': 'wordpress_connector',
+    'get_default_connector': 'wordpress_connector',
+    'WordPressNotAvailableError': 'wordpress_connector',
+}
 
 __all__ = [
     'KeywordAnalyzer',
     'OnPageOptimizer',
     'SEOAnalyzer',
+    'PostResult',
     'TechnicalAuditor',
     'SchemaValidator',
     'SchemaGenerator',
     'WordPressConnector',
+    'WPPost',
+    'WPPostStats',
     'create_connector',
+    'get_default_connector',
     'WordPressNotAvailableError',
     'extract_keywords_from_title'
 ]
 
 __version__ = '0.2.0'  # Phase 2: WordPress Integration + Technical SEO + Schema
+
+
+def __getattr__(name):
+    """Import the submodule defining name on first access."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazy exports alongside the loaded names."""
+    return sorted(set(globals()) | set(__all__))
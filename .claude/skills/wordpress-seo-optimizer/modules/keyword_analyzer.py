@@ -10,6 +10,10 @@ from typing import Dict, List, Optional
 from collections import Counter
 import html
 
+# Patterns shared by every analysis, compiled once at import
+_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'\b\w+\b')
+
 
 class KeywordAnalyzer:
     """Analyze content for keyword optimization."""
@@ -30,7 +34,8 @@ class KeywordAnalyzer:
         target_keyword: str,
         title: str = "",
         meta_description: str = "",
-        headings: List[str] = None
+        headings: List[str] = None,
+        plain_text: Optional[str] = None
     ) -> Dict:
         """
         Analyze content for keyword optimization.
@@ -41,18 +46,24 @@ class KeywordAnalyzer:
             title: Post title
             meta_description: Meta description
             headings: List of headings (H1, H2, H3, etc.)
+            plain_text: Content already stripped by _strip_html() (optional)
 
         Returns:
             Dictionary with keyword analysis results
         """
         # Strip HTML tags
-        text_content = self._strip_html(content)
+        text_content = plain_text if plain_text is not None else self._strip_html(content)
+
+        # Lowercase and tokenize once; the word count, keyword count and
+        # LSI extraction share them
+        text_lower = text_content.lower()
+        words = _WORD_RE.findall(text_lower)
 
         # Calculate word count
-        word_count = self._count_words(text_content)
+        word_count = len(words)
 
         # Calculate keyword density
-        keyword_count = self._count_keyword_occurrences(text_content, target_keyword)
+        keyword_count = self._count_keyword_occurrences(text_lower, target_keyword)
         density = (keyword_count / word_count * 100) if word_count > 0 else 0
 
         # Target density (1-2% is optimal)
@@ -69,7 +80,7 @@ class KeywordAnalyzer:
         )
 
         # Extract potential LSI keywords
-        lsi_keywords = self._extract_lsi_keywords(text_content, target_keyword)
+        lsi_keywords = self._extract_lsi_keywords(text_content, target_keyword, words)
 
         # Generate recommendations
         recommendations = []
@@ -112,21 +123,19 @@ class KeywordAnalyzer:
     def _strip_html(self, html_content: str) -> str:
         """Strip HTML tags and decode entities."""
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', ' ', html_content)
+        text = _TAG_RE.sub(' ', html_content)
         # Decode HTML entities
         text = html.unescape(text)
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        # Normalize whitespace (str.split() also drops leading/trailing runs)
+        return ' '.join(text.split())
 
     def _count_words(self, text: str) -> int:
         """Count words in text."""
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = _WORD_RE.findall(text.lower())
         return len(words)
 
-    def _count_keyword_occurrences(self, text: str, keyword: str) -> int:
-        """Count keyword occurrences (case-insensitive, whole phrase)."""
-        text_lower = text.lower()
+    def _count_keyword_occurrences(self, text_lower: str, keyword: str) -> int:
+        """Count keyword occurrences in already-lowercased text (whole phrase)."""
         keyword_lower = keyword.lower()
 
         # Count exact phrase matches
@@ -160,24 +169,32 @@ class KeywordAnalyzer:
             'in_headings': any(keyword_lower in h.lower() for h in headings)
         }
 
-    def _extract_lsi_keywords(self, text: str, target_keyword: str) -> List[str]:
+    def _extract_lsi_keywords(
+        self,
+        text: str,
+        target_keyword: str,
+        words: Optional[List[str]] = None
+    ) -> List[str]:
         """
         Extract potential LSI (Latent Semantic Indexing) keywords.
 
         For MVP: Simple extraction of common 2-3 word phrases.
         Future: Use AI/ML for semantic keyword extraction.
+
+        Args:
+            text: Plain text content
+            target_keyword: Keyword to leave out of the results
+            words: Lowercased word tokens of text (optional, tokenized
+                from text if not provided)
         """
         # Extract 2-3 word phrases
-        words = re.findall(r'\b\w+\b', text.lower())
-
-        # Get bigrams and trigrams
-        bigrams = [' '.join(words[i:i+2]) for i in range(len(words)-1)]
-        trigrams = [' '.join(words[i:i+3]) for i in range(len(words)-2)]
+        if words is None:
+            words = _WORD_RE.findall(text.lower())
 
-        all_phrases = bigrams + trigrams
-
-        # Count frequency
-        phrase_counts = Counter(all_phrases)
+        # Count bigrams, then trigrams, streaming each phrase into the
+        # counter instead of materializing the phrase lists first
+        phrase_counts = Counter(' '.join(words[i:i+2]) for i in range(len(words)-1))
+        phrase_counts.update(' '.join(words[i:i+3]) for i in range(len(words)-2))
 
         # Filter out stop-word-heavy phrases and target keyword
         target_lower = target_keyword.lower()
@@ -266,11 +283,9 @@ class KeywordAnalyzer:
         suggestions = []
 
         # Calculate how many more mentions needed
-        word_count = self._count_words(self._strip_html(content))
-        current_count = self._count_keyword_occurrences(
-            self._strip_html(content),
-            target_keyword
-        )
+        text_lower = self._strip_html(content).lower()
+        word_count = len(_WORD_RE.findall(text_lower))
+        current_count = self._count_keyword_occurrences(text_lower, target_keyword)
         target_count = int(target_density * word_count / 100)
         needed = target_count - current_count
 
@@ -296,7 +311,7 @@ def extract_keywords_from_title(title: str) -> List[str]:
         'to', 'was', 'will', 'with', 'how', 'what', 'when', 'where', 'why'
     }
 
-    words = re.findall(r'\b\w+\b', title.lower())
+    words = _WORD_RE.findall(title.lower())
     keywords = [w for w in words if w not in stop_words and len(w) > 3]
 
     # Return as both individual words and potential phrases
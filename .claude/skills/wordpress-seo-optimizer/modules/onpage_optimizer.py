@@ -7,9 +7,294 @@ meta descriptions, headers, images, and content structure.
 
 import re
 import html
+import html.entities
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from typing import Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
 
+# Prefer the C-based lxml parser; fall back to the pure-Python parser
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# Patterns shared by every analysis, compiled once at import
+_TAG_RE = re.compile(r'<[^>]+>')
+# A maximal run of word characters is bounded by \b on both sides already,
+# so the anchors are left out
+_WORD_RE = re.compile(r'\w+')
+# One match per non-blank sentence: a run up to the next terminator that
+# starts with a non-space character.
+_SENTENCE_RE = re.compile(r'[^.!?\s][^.!?]*')
+
+# Heading elements, h1 through h6
+_HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+
+# Any start or end tag, captured so split() keeps it; quoted attribute
+# values may contain '>'
+_MARKUP_TAG_RE = re.compile(r'(</?[a-zA-Z](?:[^>"\']|"[^"]*"|\'[^\']*\')*>)')
+
+# A complete <hN>...</hN> element and its level
+_HEADING_RE = re.compile(
+    r'<h([1-6])(?:\s(?:[^>"\']|"[^"]*"|\'[^\']*\')*)?>(.*?)</h\1\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Opening and closing heading tags, to spot nested or unclosed headings
+_HEADING_TAG_RE = re.compile(r'</?h[1-6][\s/>]', re.IGNORECASE)
+
+# Phrasing elements a parser keeps inside a heading; any other tag there
+# (e.g. <p>) may end the heading early
+_INLINE_TAGS = frozenset({
+    'a', 'abbr', 'b', 'bdi', 'bdo', 'br', 'cite', 'code', 'data', 'dfn', 'em',
+    'i', 'img', 'kbd', 'mark', 'q', 's', 'samp', 'small', 'span', 'strong',
+    'sub', 'sup', 'time', 'u', 'var', 'wbr'
+})
+
+# Inline elements with no end tag
+_VOID_TAGS = frozenset({'br', 'img', 'wbr'})
+
+# A character reference, or a '&' that starts none
+_ENTITY_RE = re.compile(r'&(?:#(\d+);|#[xX]([0-9a-fA-F]+);|([a-zA-Z][a-zA-Z0-9]*);|(?=[a-zA-Z#]))')
+
+# Whether a tag is an end tag, and its name
+_TAG_NAME_RE = re.compile(r'<(/?)([a-zA-Z][^\s/>]*)')
+
+# An <img> tag and its attribute text
+_IMG_RE = re.compile(r'<img(?=[\s/>])((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>', re.IGNORECASE)
+
+# Start of an <img> tag, to spot ones _IMG_RE could not match
+_IMG_OPEN_RE = re.compile(r'<img[\s/>]', re.IGNORECASE)
+
+# One attribute and its (optionally quoted) value
+_ATTR_RE = re.compile(
+    r'([^\s"\'<>/=]+)(?:\s*=\s*("[^"]*"|\'[^\']*\'|[^\s"\'=<>`]+))?'
+)
+
+# Attribute text made only of well-formed attributes
+_ATTRS_RE = re.compile(
+    r'(?:\s+[^\s"\'<>/=]+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s"\'=<>`]+))?)*\s*/?'
+)
+
+# Markup a parser reads specially: raw-text elements, comments,
+# declarations and processing instructions, <select> and foreign (SVG,
+# MathML) content, plus <pre>, whose whitespace BeautifulSoup keeps as is
+_RAW_MARKUP_RE = re.compile(
+    r'<(?:[!?]|script|style|textarea|title|xmp|noscript|template|pre|select|svg|math)',
+    re.IGNORECASE
+)
+
+# A '<' before the tag it follows is closed, which a parser reads as part
+# of that tag rather than as a new one
+_UNCLOSED_TAG_RE = re.compile(r'</?[a-zA-Z][^>]*<')
+
+
+def _strip_html(html_content: str) -> str:
+    """Strip HTML tags and decode entities."""
+    text = _TAG_RE.sub(' ', html_content)
+    text = html.unescape(text)
+    # Normalize whitespace (str.split() also drops leading/trailing runs)
+    return ' '.join(text.split())
+
+
+def _extract_features(
+    html_content: str,
+    soup: Optional[BeautifulSoup] = None
+) -> Dict:
+    """
+    Pull out the heading and image data the on-page checks inspect.
+
+    Uses regexes when the HTML is simple enough, otherwise BeautifulSoup.
+
+    Args:
+        html_content: HTML content
+        soup: Already parsed html_content (optional, used instead of
+            parsing it again)
+
+    Returns:
+        Dictionary with:
+            - headers: (level, text) of each h1-h6, in document order
+            - images: alt text of each <img> (None if it has none)
+    """
+    if soup is None:
+        features = _extract_features_fast(html_content)
+        if features is not None:
+            return features
+        soup = BeautifulSoup(html_content, _HTML_PARSER)
+
+    return {
+        'headers': [(int(h.name[1]), h.get_text()) for h in soup.find_all(_HEADING_TAGS)],
+        'images': [img.get('alt') for img in soup.find_all('img')]
+    }
+
+
+def _plain_entities(text: str) -> bool:
+    """
+    Whether every character reference in text is one that all parsers
+    decode the same way (terminated, known, printable).
+    """
+    for match in _ENTITY_RE.finditer(text):
+        decimal, hexadecimal, name = match.groups()
+        if name is not None:
+            if name + ';' not in html.entities.html5:
+                return False
+        elif decimal is not None or hexadecimal is not None:
+            code = int(decimal) if decimal is not None else int(hexadecimal, 16)
+            if not (32 <= code < 127 or 160 <= code < 0xD800):
+                return False
+        else:
+            return False
+    return True
+
+
+def _inner_text(inner_html: str) -> Optional[str]:
+    """
+    Text of a heading's inner HTML, as BeautifulSoup's get_text() gives it.
+
+    Returns None unless the inner HTML is only balanced inline markup:
+    parsers end a heading early at block elements and stray end tags, and
+    BeautifulSoup collapses whitespace-only strings only after joining the
+    text around tags it drops.
+    """
+    parts = []
+    open_tags = []
+    previous_blank = False
+    # Text and tags alternate, starting (and ending) with text
+    pieces = _MARKUP_TAG_RE.split(inner_html)
+    for index, piece in enumerate(pieces):
+        if index % 2 == 0:
+            if piece:
+                if not _plain_entities(piece):
+                    return None
+                piece = html.unescape(piece)
+                blank = not piece.strip(' \t\n\r\f')
+                if blank and (previous_blank or piece not in (' ', '\n')):
+                    return None
+                previous_blank = blank
+                parts.append(piece)
+            continue
+
+        tag = piece
+        closing, name = _TAG_NAME_RE.match(tag).groups()
+        name = name.lower()
+        if name not in _INLINE_TAGS:
+            return None
+        if closing:
+            if not open_tags or open_tags.pop() != name:
+                return None
+        elif name not in _VOID_TAGS:
+            if tag.endswith('/>'):
+                return None
+            open_tags.append(name)
+
+    if open_tags:
+        return None
+    return ''.join(parts)
+
+
+def _extract_features_fast(html_content: str) -> Optional[Dict]:
+    """
+    Regex version of _extract_features(), without building any tree.
+
+    Returns None when the HTML is not simple enough for the regexes to
+    agree with a parser (comments, raw-text elements, unclosed tags, nested
+    or unclosed headings, anything but balanced inline markup inside a
+    heading, malformed or repeated <img> attributes, unusual character
+    references).
+    """
+    if _RAW_MARKUP_RE.search(html_content) or _UNCLOSED_TAG_RE.search(html_content):
+        return None
+
+    matches = _HEADING_RE.findall(html_content)
+
+    # Every heading tag must belong to exactly one matched element
+    if len(_HEADING_TAG_RE.findall(html_content)) != 2 * len(matches):
+        return None
+
+    img_attrs = _IMG_RE.findall(html_content)
+
+    # Every <img> tag must have been matched whole
+    if len(_IMG_OPEN_RE.findall(html_content)) != len(img_attrs):
+        return None
+
+    images = []
+    for attrs in img_attrs:
+        if not _ATTRS_RE.fullmatch(attrs):
+            return None
+        alts = [value for name, value in _ATTR_RE.findall(attrs) if name.lower() == 'alt']
+        if len(alts) > 1:
+            return None
+        if alts:
+            alt = alts[0]
+            if alt[:1] in ('"', "'"):
+                alt = alt[1:-1]
+            if not _plain_entities(alt):
+                return None
+            images.append(html.unescape(alt))
+        else:
+            images.append(None)
+
+    headers = []
+    for level, inner in matches:
+        text = _inner_text(inner)
+        if text is None:
+            return None
+        headers.append((int(level), text))
+
+    return {'headers': headers, 'images': images}
+
+
+@lru_cache(maxsize=128)
+def _build_meta_description(
+    content: str,
+    keyword: str,
+    max_length: int,
+    meta_min: int
+) -> str:
+    """
+    Build a meta description (see generate_optimized_meta_description).
+
+    Memoized on the full arguments, so regenerating the description for an
+    unchanged post skips stripping and splitting its content again.
+    """
+    # Extract first paragraph
+    text = _strip_html(content)
+    # Walk sentences lazily; only the first few fit in a description
+    sentences = _SENTENCE_RE.finditer(text)
+    first = next(sentences, None)
+
+    if first is None:
+        return f"Learn about {keyword}. Discover expert tips and insights."
+
+    # Start with keyword
+    description = f"{keyword.capitalize()}. "
+
+    # Add sentences until we reach optimal length
+    for match in chain((first,), sentences):
+        sentence = match.group().rstrip()
+        if len(description) + len(sentence) + 1 <= max_length - 20:  # Leave room for CTA
+            description += sentence + ". "
+        else:
+            break
+
+    # Add CTA
+    if len(description) < max_length - 15:
+        description += "Learn more today!"
+
+    # Ensure it's within limits
+    if len(description) > max_length:
+        cut = description.rfind(' ', 0, max_length)
+        description = description[:cut if cut != -1 else max_length] + "..."
+
+    # Ensure minimum length
+    if len(description) < meta_min:
+        description += f" Discover everything you need to know about {keyword}."
+
+    return description.strip()
+
 
 class OnPageOptimizer:
     """Optimize on-page SEO elements."""
@@ -26,7 +311,13 @@ class OnPageOptimizer:
         """Initialize on-page optimizer."""
         pass
 
-    def analyze_onpage(self, post_data: Dict) -> Dict:
+    def analyze_onpage(
+        self,
+        post_data: Dict,
+        soup: Optional[BeautifulSoup] = None,
+        plain_text: Optional[str] = None,
+        features: Optional[Dict] = None
+    ) -> Dict:
         """
         Analyze all on-page SEO elements.
 
@@ -37,6 +328,10 @@ class OnPageOptimizer:
                 - meta_description: Meta description
                 - url_slug: URL slug
                 - target_keyword: Primary keyword
+            soup: Content already parsed with BeautifulSoup (optional)
+            plain_text: Content already stripped by _strip_html() (optional)
+            features: Content headings and images already extracted by
+                _extract_features() (optional)
 
         Returns:
             Analysis results with scores and recommendations
@@ -47,16 +342,20 @@ class OnPageOptimizer:
         url_slug = post_data.get('url_slug', '')
         target_keyword = post_data.get('target_keyword', '')
 
-        # Parse HTML content
-        soup = BeautifulSoup(content, 'html.parser')
+        # Extract headings and images from the HTML content
+        if features is None:
+            features = _extract_features(content, soup)
+
+        # Lowercase the keyword once for every case-insensitive match below
+        kw_lower = target_keyword.lower()
 
         # Analyze each component
-        title_analysis = self._analyze_title(title, target_keyword)
-        meta_analysis = self._analyze_meta_description(meta_description, target_keyword)
-        headers_analysis = self._analyze_headers(soup, target_keyword)
-        content_analysis = self._analyze_content(content)
-        images_analysis = self._analyze_images(soup)
-        url_analysis = self._analyze_url_slug(url_slug, target_keyword)
+        title_analysis = self._analyze_title(title, target_keyword, kw_lower)
+        meta_analysis = self._analyze_meta_description(meta_description, target_keyword, kw_lower)
+        headers_analysis = self._analyze_headers(features['headers'], target_keyword, kw_lower)
+        content_analysis = self._analyze_content(content, plain_text)
+        images_analysis = self._analyze_images(features['images'])
+        url_analysis = self._analyze_url_slug(url_slug, target_keyword, kw_lower)
 
         # Calculate overall score
         total_score = (
@@ -68,14 +367,14 @@ class OnPageOptimizer:
             url_analysis['score']
         )
 
-        # Collect all issues and recommendations
+        # Collect all issues and recommendations (every section reports both)
         issues = []
         recommendations = []
 
-        for analysis in [title_analysis, meta_analysis, headers_analysis,
-                        content_analysis, images_analysis, url_analysis]:
-            issues.extend(analysis.get('issues', []))
-            recommendations.extend(analysis.get('recommendations', []))
+        for analysis in (title_analysis, meta_analysis, headers_analysis,
+                         content_analysis, images_analysis, url_analysis):
+            issues.extend(analysis['issues'])
+            recommendations.extend(analysis['recommendations'])
 
         return {
             'overall_score': total_score,
@@ -89,15 +388,41 @@ class OnPageOptimizer:
             'recommendations': recommendations
         }
 
-    def _analyze_title(self, title: str, keyword: str) -> Dict:
+    def analyze_batch(
+        self,
+        posts: List[Dict],
+        max_workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Analyze many independent posts in parallel across CPU cores.
+
+        Analysis is pure CPU work (heading and image extraction mostly
+        runs as regexes, which hold the GIL), so posts are spread over
+        worker processes rather than threads.
+
+        Args:
+            posts: Post data, as accepted by analyze_onpage()
+            max_workers: Maximum number of worker processes (default: CPU count)
+
+        Returns:
+            One analyze_onpage() result per post, in input order
+        """
+        if len(posts) <= 1:
+            return [_analyze_post(post) for post in posts]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_analyze_post, posts, chunksize=8))
+
+    def _analyze_title(self, title: str, keyword: str, kw_lower: str) -> Dict:
         """Analyze title tag (max 15 points)."""
         score = 0
         issues = []
         recommendations = []
 
         length = len(title)
-        has_keyword = keyword.lower() in title.lower()
-        keyword_position = title.lower().find(keyword.lower()) if has_keyword else -1
+        title_lower = title.lower()
+        keyword_position = title_lower.find(kw_lower)
+        has_keyword = keyword_position != -1
 
         # Length check (5 points)
         if self.TITLE_MIN <= length <= self.TITLE_MAX:
@@ -136,14 +461,14 @@ class OnPageOptimizer:
             'recommendations': recommendations
         }
 
-    def _analyze_meta_description(self, meta_description: str, keyword: str) -> Dict:
+    def _analyze_meta_description(self, meta_description: str, keyword: str, kw_lower: str) -> Dict:
         """Analyze meta description (max 10 points)."""
         score = 0
         issues = []
         recommendations = []
 
         length = len(meta_description)
-        has_keyword = keyword.lower() in meta_description.lower()
+        has_keyword = kw_lower in meta_description.lower()
 
         # Presence check (7 points)
         if not meta_description:
@@ -188,27 +513,41 @@ class OnPageOptimizer:
             'recommendations': recommendations
         }
 
-    def _analyze_headers(self, soup: BeautifulSoup, keyword: str) -> Dict:
-        """Analyze header structure (max 10 points)."""
+    def _analyze_headers(
+        self,
+        headers: List[Tuple[int, str]],
+        keyword: str,
+        kw_lower: str
+    ) -> Dict:
+        """
+        Analyze header structure (max 10 points).
+
+        Args:
+            headers: (level, text) of each heading, in document order
+        """
         score = 0
         issues = []
         recommendations = []
 
-        # Extract all headers
-        h1_tags = soup.find_all('h1')
-        h2_tags = soup.find_all('h2')
-        h3_tags = soup.find_all('h3')
-        h4_tags = soup.find_all('h4')
+        # Bucket heading text by level
+        by_level = {level: [] for level in range(1, 7)}
+        for level, text in headers:
+            by_level[level].append(text)
+
+        h1_texts = by_level[1]
+        h2_texts = by_level[2]
+        h3_texts = by_level[3]
+        h4_texts = by_level[4]
 
-        h1_count = len(h1_tags)
-        h2_count = len(h2_tags)
+        h1_count = len(h1_texts)
+        h2_count = len(h2_texts)
 
         # H1 check (5 points)
         if h1_count == 1:
             score += 3
-            h1_text = h1_tags[0].get_text()
+            h1_text = h1_texts[0]
             # Check if H1 has keyword
-            if keyword.lower() in h1_text.lower():
+            if kw_lower in h1_text.lower():
                 score += 2
             else:
                 issues.append("H1 doesn't contain target keyword")
@@ -225,8 +564,7 @@ class OnPageOptimizer:
         if h2_count >= 2:
             score += 3
             # Check if at least one H2 has keyword
-            h2_texts = [h.get_text().lower() for h in h2_tags]
-            if any(keyword.lower() in text for text in h2_texts):
+            if any(kw_lower in text.lower() for text in h2_texts):
                 score += 2
             else:
                 recommendations.append(f"Include '{keyword}' in at least one H2 heading")
@@ -239,7 +577,7 @@ class OnPageOptimizer:
             recommendations.append("Add H2 headings to structure content")
 
         # Check hierarchy (no scoring, just recommendations)
-        if self._check_header_hierarchy(soup):
+        if self._check_header_hierarchy(headers):
             pass  # Good hierarchy
         else:
             issues.append("Header hierarchy has gaps (e.g., H4 under H2)")
@@ -250,38 +588,39 @@ class OnPageOptimizer:
             'max_score': 10,
             'h1_count': h1_count,
             'h2_count': h2_count,
-            'h3_count': len(h3_tags),
-            'h4_count': len(h4_tags),
+            'h3_count': len(h3_texts),
+            'h4_count': len(h4_texts),
             'optimal': score >= 8,
             'issues': issues,
             'recommendations': recommendations
         }
 
-    def _check_header_hierarchy(self, soup: BeautifulSoup) -> bool:
-        """Check if header hierarchy is logical (no skipped levels)."""
-        # Simple check: ensure we don't have H3 before H2, etc.
-        headers = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        if not headers:
-            return True
-
-        levels = [int(h.name[1]) for h in headers]
+    def _check_header_hierarchy(self, headers: List[Tuple[int, str]]) -> bool:
+        """
+        Check if header hierarchy is logical (no skipped levels).
 
-        for i in range(1, len(levels)):
+        Args:
+            headers: (level, text) of each heading, in document order
+        """
+        # Simple check: ensure we don't have H3 before H2, etc.
+        previous = None
+        for level, _ in headers:
             # If jump is more than 1 level, hierarchy is broken
-            if levels[i] - levels[i-1] > 1:
+            if previous is not None and level - previous > 1:
                 return False
+            previous = level
 
         return True
 
-    def _analyze_content(self, content: str) -> Dict:
+    def _analyze_content(self, content: str, plain_text: Optional[str] = None) -> Dict:
         """Analyze content quality (max 20 points)."""
         score = 0
         issues = []
         recommendations = []
 
         # Strip HTML and count words
-        text = self._strip_html(content)
-        word_count = len(re.findall(r'\b\w+\b', text))
+        text = plain_text if plain_text is not None else self._strip_html(content)
+        word_count = len(_WORD_RE.findall(text))
 
         # Word count check (10 points)
         if word_count >= 1500:
@@ -299,11 +638,10 @@ class OnPageOptimizer:
 
         # Readability (10 points) - simplified for MVP
         # For MVP: Just check average sentence length
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentence_count = len(_SENTENCE_RE.findall(text))
 
-        if sentences:
-            avg_words_per_sentence = word_count / len(sentences)
+        if sentence_count:
+            avg_words_per_sentence = word_count / sentence_count
             # Optimal: 15-20 words per sentence
             if 12 <= avg_words_per_sentence <= 22:
                 score += 10
@@ -323,21 +661,25 @@ class OnPageOptimizer:
             'score': score,
             'max_score': 20,
             'word_count': word_count,
-            'sentence_count': len(sentences),
-            'avg_words_per_sentence': round(word_count / len(sentences), 1) if sentences else 0,
+            'sentence_count': sentence_count,
+            'avg_words_per_sentence': round(word_count / sentence_count, 1) if sentence_count else 0,
             'optimal': score >= 16,
             'issues': issues,
             'recommendations': recommendations
         }
 
-    def _analyze_images(self, soup: BeautifulSoup) -> Dict:
-        """Analyze image optimization (max 10 points)."""
+    def _analyze_images(self, alts: List[Optional[str]]) -> Dict:
+        """
+        Analyze image optimization (max 10 points).
+
+        Args:
+            alts: alt text of each image (None if it has none)
+        """
         score = 0
         issues = []
         recommendations = []
 
-        images = soup.find_all('img')
-        total_images = len(images)
+        total_images = len(alts)
 
         if total_images == 0:
             recommendations.append("Add images to improve engagement")
@@ -352,8 +694,14 @@ class OnPageOptimizer:
                 'recommendations': recommendations
             }
 
-        # Check alt text
-        images_with_alt = sum(1 for img in images if img.get('alt'))
+        # Check alt text presence and length in a single pass
+        images_with_alt = 0
+        has_long_alt = False
+        for alt in alts:
+            if alt:
+                images_with_alt += 1
+                if len(alt) > self.ALT_TEXT_MAX:
+                    has_long_alt = True
         alt_percentage = (images_with_alt / total_images * 100) if total_images > 0 else 0
 
         # Alt text score (10 points)
@@ -372,11 +720,8 @@ class OnPageOptimizer:
             score += 2
 
         # Check alt text quality (not scored in MVP, just recommendations)
-        for img in images:
-            alt = img.get('alt', '')
-            if alt and len(alt) > self.ALT_TEXT_MAX:
-                recommendations.append(f"Shorten alt text to under {self.ALT_TEXT_MAX} characters")
-                break
+        if has_long_alt:
+            recommendations.append(f"Shorten alt text to under {self.ALT_TEXT_MAX} characters")
 
         return {
             'score': score,
@@ -389,7 +734,7 @@ class OnPageOptimizer:
             'recommendations': recommendations
         }
 
-    def _analyze_url_slug(self, url_slug: str, keyword: str) -> Dict:
+    def _analyze_url_slug(self, url_slug: str, keyword: str, kw_lower: str) -> Dict:
         """Analyze URL slug (max 5 points)."""
         score = 0
         issues = []
@@ -408,7 +753,7 @@ class OnPageOptimizer:
             }
 
         length = len(url_slug)
-        has_keyword = keyword.lower().replace(' ', '-') in url_slug.lower()
+        has_keyword = kw_lower.replace(' ', '-') in url_slug.lower()
 
         # Length check (2 points)
         if length <= self.URL_MAX:
@@ -473,8 +818,9 @@ class OnPageOptimizer:
             optimized = f"{keyword_capitalized} - {original_title}"
 
         if len(optimized) > max_length:
-            # Truncate at word boundary
-            optimized = optimized[:max_length].rsplit(' ', 1)[0] + "..."
+            # Truncate at the last word boundary within max_length
+            cut = optimized.rfind(' ', 0, max_length)
+            optimized = optimized[:cut if cut != -1 else max_length] + "..."
 
         return optimized
 
@@ -495,44 +841,16 @@ class OnPageOptimizer:
         Returns:
             Optimized meta description
         """
-        # Extract first paragraph
-        text = self._strip_html(content)
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        if not sentences:
-            return f"Learn about {keyword}. Discover expert tips and insights."
-
-        # Start with keyword
-        description = f"{keyword.capitalize()}. "
-
-        # Add sentences until we reach optimal length
-        for sentence in sentences:
-            if len(description) + len(sentence) + 1 <= max_length - 20:  # Leave room for CTA
-                description += sentence + ". "
-            else:
-                break
-
-        # Add CTA
-        if len(description) < max_length - 15:
-            description += "Learn more today!"
-
-        # Ensure it's within limits
-        if len(description) > max_length:
-            description = description[:max_length].rsplit(' ', 1)[0] + "..."
-
-        # Ensure minimum length
-        if len(description) < self.META_MIN:
-            description += f" Discover everything you need to know about {keyword}."
-
-        return description.strip()
+        return _build_meta_description(content, keyword, max_length, self.META_MIN)
 
     def _strip_html(self, html_content: str) -> str:
         """Strip HTML tags and decode entities."""
-        text = re.sub(r'<[^>]+>', ' ', html_content)
-        text = html.unescape(text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        return _strip_html(html_content)
+
+
+def _analyze_post(post_data: Dict) -> Dict:
+    """Analyze one post's on-page SEO; picklable for worker processes."""
+    return OnPageOptimizer().analyze_onpage(post_data)
 
 
 if __name__ == "__main__":
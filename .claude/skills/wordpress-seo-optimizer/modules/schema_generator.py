@@ -5,17 +5,156 @@ Generates JSON-LD structured data for various content types.
 Supports Article, FAQPage, HowTo, LocalBusiness, and more.
 """
 
+import copy
+import hashlib
 import json
-from typing import Dict, List, Optional
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
+from bs4 import BeautifulSoup
+
+# Run as a script (python modules/schema_generator.py) there is no package
+try:
+    from .onpage_optimizer import (
+        _HEADING_RE, _HEADING_TAG_RE, _RAW_MARKUP_RE, _UNCLOSED_TAG_RE, _inner_text
+    )
+except ImportError:
+    from onpage_optimizer import (
+        _HEADING_RE, _HEADING_TAG_RE, _RAW_MARKUP_RE, _UNCLOSED_TAG_RE, _inner_text
+    )
+
+# Optional: orjson serializes several times faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: selectolax (Lexbor) parses much faster than BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# A literal question mark or a character reference that decodes to one
+_QUESTION_MARK_RE = re.compile(r'\?|&#0*63(?!\d)|&#x0*3f(?![0-9a-f])|&quest', re.IGNORECASE)
+
+# Tags whose strings BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = frozenset({'script', 'style', 'template'})
+# Tags inside which BeautifulSoup keeps whitespace-only strings as they are
+_PRESERVE_WS_TAGS = frozenset({'pre', 'textarea'})
+_ASCII_SPACES = ' \n\t\x0c\r'
+
+# A <p> element right after a heading, past any whitespace
+_ANSWER_RE = re.compile(
+    r'\s*<p(?:\s(?:[^>"\']|"[^"]*"|\'[^\']*\')*)?>(.*?)</p\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Definition-list tags, whose end tags parsers may imply
+_DEFINITION_TAG_RE = re.compile(r'<d[ltd][\s/>]', re.IGNORECASE)
+
+
+def _node_text(node) -> str:
+    """get_text() for a Lexbor node, following BeautifulSoup's whitespace rules."""
+    parts = []
+    for child in node.traverse(include_text=True):
+        if child.tag != '-text' or child.parent.tag in _NON_TEXT_TAGS:
+            continue
+        text = child.text_content
+        if text and not text.strip(_ASCII_SPACES):
+            # BeautifulSoup collapses whitespace-only strings outside <pre>
+            ancestor = child.parent
+            while ancestor is not None and ancestor.tag not in _PRESERVE_WS_TAGS:
+                ancestor = ancestor.parent
+            if ancestor is None:
+                text = '\n' if '\n' in text else ' '
+        parts.append(text)
+    return ''.join(parts)
+
+
+def _extract_faq_fast(html_content: str) -> Optional[List[Dict[str, str]]]:
+    """
+    Regex version of the h3/h4 question pattern, without building any tree.
+
+    Returns None unless a parser would certainly read the HTML the same
+    way: no definition lists, nothing _extract_features_fast() rejects
+    (raw-text elements, unclosed or nested headings, anything but balanced
+    inline markup inside them), and every question heading directly
+    followed by a <p> holding only inline markup.
+    """
+    if _DEFINITION_TAG_RE.search(html_content):
+        return None
+    if _RAW_MARKUP_RE.search(html_content) or _UNCLOSED_TAG_RE.search(html_content):
+        return None
+
+    matches = list(_HEADING_RE.finditer(html_content))
+
+    # Every heading tag must belong to exactly one matched element
+    if len(_HEADING_TAG_RE.findall(html_content)) != 2 * len(matches):
+        return None
+
+    faqs = []
+    for match in matches:
+        if match.group(1) not in ('3', '4'):
+            continue
+        question_text = _inner_text(match.group(2))
+        if question_text is None:
+            return None
+        question_text = question_text.strip()
+        if '?' not in question_text:
+            continue
+
+        # Any other following sibling needs the tree to find the <p>
+        answer = _ANSWER_RE.match(html_content, match.end())
+        if answer is None:
+            return None
+        answer_text = _inner_text(answer.group(1))
+        if answer_text is None:
+            return None
+        faqs.append({
+            'question': question_text,
+            'answer': answer_text.strip()
+        })
+
+    return faqs
+
+
+def _orjson_dumps(schema: Dict, pretty: bool) -> Optional[bytes]:
+    """
+    Serialize with orjson, or return None if it rejects the data.
+
+    Output is byte-identical to the json.dumps() fallback in to_json_ld():
+    indent=2 when pretty, separators=(',', ':') when compact.
+    """
+    try:
+        return orjson.dumps(schema, option=orjson.OPT_INDENT_2 if pretty else 0)
+    except TypeError:
+        # Types orjson rejects (e.g. non-string keys): caller uses json
+        return None
 
 
 class SchemaGenerator:
     """Generate schema.org structured data in JSON-LD format."""
 
-    def __init__(self):
-        """Initialize schema generator."""
+    __slots__ = ('context', 'cache_size', '_cache', '_cache_lock')
+
+    def __init__(self, cache_size: int = 512):
+        """
+        Initialize schema generator.
+
+        Args:
+            cache_size: Number of auto_generate_from_post() results to keep,
+                keyed by a hash of the post fields they are built from.
+                0 disables the cache.
+        """
         self.context = "https://schema.org"
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, List[Dict]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def generate_article_schema(
         self,
@@ -80,6 +219,69 @@ class SchemaGenerator:
 
         return schema
 
+    def article_builder(
+        self,
+        publisher_name: Optional[str] = None,
+        publisher_logo: Optional[str] = None
+    ) -> Callable[..., Dict]:
+        """
+        Make a generate_article_schema() for one fixed publisher.
+
+        For sites building many articles with the same publisher: the
+        publisher dict is built once and shared by every schema the
+        builder returns, so copy it before modifying it in one of them.
+
+        Args:
+            publisher_name: Publisher name (optional)
+            publisher_logo: Publisher logo URL (optional)
+
+        Returns:
+            Function taking generate_article_schema()'s other arguments
+            (headline, author_name, date_published, date_modified,
+            description, image_url) and returning the same schema
+        """
+        context = self.context
+        publisher = None
+        if publisher_name:
+            publisher = {
+                "@type": "Organization",
+                "name": publisher_name
+            }
+            if publisher_logo:
+                publisher["logo"] = {
+                    "@type": "ImageObject",
+                    "url": publisher_logo
+                }
+
+        def build(
+            headline: str,
+            author_name: str,
+            date_published: str,
+            date_modified: Optional[str] = None,
+            description: Optional[str] = None,
+            image_url: Optional[str] = None
+        ) -> Dict:
+            schema = {
+                "@context": context,
+                "@type": "Article",
+                "headline": headline,
+                "author": {
+                    "@type": "Person",
+                    "name": author_name
+                },
+                "datePublished": date_published,
+                "dateModified": date_modified or date_published
+            }
+            if description:
+                schema["description"] = description
+            if image_url:
+                schema["image"] = image_url
+            if publisher is not None:
+                schema["publisher"] = publisher
+            return schema
+
+        return build
+
     def generate_faq_schema(self, questions: List[Dict[str, str]]) -> Dict:
         """
         Generate FAQPage schema.
@@ -90,22 +292,20 @@ class SchemaGenerator:
         Returns:
             FAQPage schema as dictionary
         """
-        main_entity = []
-
-        for q in questions:
-            main_entity.append({
-                "@type": "Question",
-                "name": q.get('question', ''),
-                "acceptedAnswer": {
-                    "@type": "Answer",
-                    "text": q.get('answer', '')
-                }
-            })
-
         return {
             "@context": self.context,
             "@type": "FAQPage",
-            "mainEntity": main_entity
+            "mainEntity": [
+                {
+                    "@type": "Question",
+                    "name": q.get('question', ''),
+                    "acceptedAnswer": {
+                        "@type": "Answer",
+                        "text": q.get('answer', '')
+                    }
+                }
+                for q in questions
+            ]
         }
 
     def generate_howto_schema(
@@ -129,21 +329,18 @@ class SchemaGenerator:
         Returns:
             HowTo schema as dictionary
         """
-        step_list = []
-
-        for i, step in enumerate(steps, 1):
-            step_schema = {
+        # The "Step N" fallback is only formatted for steps without a name
+        step_list = [
+            {
                 "@type": "HowToStep",
-                "name": step.get('name', f"Step {i}"),
+                "name": step['name'] if 'name' in step else f"Step {i}",
                 "text": step.get('text', ''),
                 "url": step.get('url', ''),
-                "position": i
+                "position": i,
+                **({"image": step['image']} if 'image' in step else {})
             }
-
-            if 'image' in step:
-                step_schema["image"] = step['image']
-
-            step_list.append(step_schema)
+            for i, step in enumerate(steps, 1)
+        ]
 
         schema = {
             "@context": self.context,
@@ -171,20 +368,18 @@ class SchemaGenerator:
         Returns:
             BreadcrumbList schema as dictionary
         """
-        item_list = []
-
-        for i, crumb in enumerate(breadcrumbs, 1):
-            item_list.append({
-                "@type": "ListItem",
-                "position": i,
-                "name": crumb.get('name', ''),
-                "item": crumb.get('url', '')
-            })
-
         return {
             "@context": self.context,
             "@type": "BreadcrumbList",
-            "itemListElement": item_list
+            "itemListElement": [
+                {
+                    "@type": "ListItem",
+                    "position": i,
+                    "name": crumb.get('name', ''),
+                    "item": crumb.get('url', '')
+                }
+                for i, crumb in enumerate(breadcrumbs, 1)
+            ]
         }
 
     def generate_local_business_schema(
@@ -240,19 +435,21 @@ class SchemaGenerator:
             }
 
         if opening_hours:
-            schema["openingHoursSpecification"] = []
+            specifications = schema["openingHoursSpecification"] = []
             for hours in opening_hours:
-                # Parse format like "Mo-Fr 09:00-17:00"
-                parts = hours.split()
+                # Parse format like "Mo-Fr 09:00-17:00"; anything after the
+                # time range is ignored, so it is left unsplit
+                parts = hours.split(None, 2)
                 if len(parts) >= 2:
                     days_part = parts[0]
                     time_part = parts[1]
+                    times = time_part.split('-')
 
-                    schema["openingHoursSpecification"].append({
+                    specifications.append({
                         "@type": "OpeningHoursSpecification",
                         "dayOfWeek": days_part.split('-'),
-                        "opens": time_part.split('-')[0],
-                        "closes": time_part.split('-')[1] if '-' in time_part else time_part
+                        "opens": times[0],
+                        "closes": times[1] if len(times) > 1 else time_part
                     })
 
         if price_range:
@@ -274,7 +471,23 @@ class SchemaGenerator:
         Returns:
             List of question-answer pairs
         """
-        from bs4 import BeautifulSoup
+        # Cheap pre-check: a question needs an h3/h4 and a question mark,
+        # a definition-list pair needs a <dl>; skip parsing if neither fits
+        content_lower = html_content.lower()
+        has_question_heading = (
+            ('<h3' in content_lower or '<h4' in content_lower)
+            and _QUESTION_MARK_RE.search(html_content) is not None
+        )
+        if not has_question_heading and '<dl' not in content_lower:
+            return []
+
+        if LexborHTMLParser is not None:
+            return self._extract_faq_lexbor(html_content)
+
+        # Without Lexbor, simple markup is still cheaper to scan than to parse
+        faqs = _extract_faq_fast(html_content)
+        if faqs is not None:
+            return faqs
 
         soup = BeautifulSoup(html_content, 'html.parser')
         faqs = []
@@ -293,16 +506,55 @@ class SchemaGenerator:
                         'answer': answer_text
                     })
 
-        # Pattern 2: dl/dt/dd structure
+        # Pattern 2: dl/dt/dd structure, each <dt> with the <dd> after it
         for dl in soup.find_all('dl'):
-            dts = dl.find_all('dt')
-            dds = dl.find_all('dd')
+            question = None
+            for child in dl.find_all(recursive=False):
+                # A <div> may wrap a dt/dd group
+                items = child.find_all(recursive=False) if child.name == 'div' else [child]
+                for item in items:
+                    if item.name == 'dt':
+                        question = item.get_text().strip()
+                    elif item.name == 'dd' and question is not None:
+                        faqs.append({
+                            'question': question,
+                            'answer': item.get_text().strip()
+                        })
+                        question = None
+
+        return faqs
+
+    def _extract_faq_lexbor(self, html_content: str) -> List[Dict[str, str]]:
+        """Lexbor version of extract_faq_from_content(), matching its results."""
+        tree = LexborHTMLParser(html_content)
+        faqs = []
 
-            for dt, dd in zip(dts, dds):
-                faqs.append({
-                    'question': dt.get_text().strip(),
-                    'answer': dd.get_text().strip()
-                })
+        for heading in tree.css('h3, h4'):
+            question_text = _node_text(heading).strip()
+            if '?' in question_text:
+                # Next sibling <p>, skipping anything else in between
+                next_p = heading.next
+                while next_p is not None and next_p.tag != 'p':
+                    next_p = next_p.next
+                if next_p is not None:
+                    faqs.append({
+                        'question': question_text,
+                        'answer': _node_text(next_p).strip()
+                    })
+
+        for dl in tree.css('dl'):
+            question = None
+            for child in dl.iter():
+                items = child.iter() if child.tag == 'div' else [child]
+                for item in items:
+                    if item.tag == 'dt':
+                        question = _node_text(item).strip()
+                    elif item.tag == 'dd' and question is not None:
+                        faqs.append({
+                            'question': question,
+                            'answer': _node_text(item).strip()
+                        })
+                        question = None
 
         return faqs
 
@@ -323,6 +575,27 @@ class SchemaGenerator:
         Returns:
             List of schema dictionaries
         """
+        cache_key = None
+        # Without a date the Article schema is stamped with the current time
+        if self.cache_size > 0 and 'date' in post_data:
+            cache_key = self._cache_key(
+                post_data.get('title', ''),
+                post_data.get('author', 'Anonymous'),
+                post_data['date'],
+                post_data.get('modified'),
+                post_data.get('excerpt', ''),
+                post_data.get('featured_image_url'),
+                post_data.get('content', ''),
+                site_name,
+                site_logo
+            )
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
         schemas = []
 
         # Always add Article schema
@@ -346,8 +619,57 @@ class SchemaGenerator:
             faq_schema = self.generate_faq_schema(faqs)
             schemas.append(faq_schema)
 
+        if cache_key is not None:
+            # Keep a private copy so callers can't modify the cached result
+            with self._cache_lock:
+                self._cache[cache_key] = copy.deepcopy(schemas)
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
         return schemas
 
+    def auto_generate_batch(
+        self,
+        posts: List[Dict],
+        site_name: Optional[str] = None,
+        site_logo: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ) -> List[List[Dict]]:
+        """
+        Generate schemas for many independent posts in parallel across CPU cores.
+
+        FAQ extraction and schema building are pure CPU work, so posts are
+        spread over worker processes rather than threads. Workers start
+        with empty caches; results are not added to this generator's cache.
+
+        Args:
+            posts: Post data, as accepted by auto_generate_from_post()
+            site_name: Site/publisher name
+            site_logo: Site logo URL
+            max_workers: Maximum number of worker processes (default: CPU count)
+
+        Returns:
+            One auto_generate_from_post() result per post, in input order
+        """
+        if len(posts) <= 1:
+            return [self.auto_generate_from_post(post, site_name, site_logo) for post in posts]
+
+        generate = partial(
+            _generate_post, context=self.context, site_name=site_name, site_logo=site_logo
+        )
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # Posts are cheap to generate; larger chunks amortize the IPC
+            return list(executor.map(generate, posts, chunksize=32))
+
+    def _cache_key(self, *fields) -> bytes:
+        """Hash the post fields into an auto_generate_from_post() cache key."""
+        # repr() keeps None apart from strings and tolerates non-str values
+        return hashlib.blake2b(
+            repr(fields).encode("utf-8", "surrogatepass"),
+            digest_size=16
+        ).digest()
+
     def to_json_ld(self, schema: Dict, pretty: bool = True) -> str:
         """
         Convert schema dictionary to JSON-LD string.
@@ -359,10 +681,15 @@ class SchemaGenerator:
         Returns:
             JSON-LD string
         """
+        if orjson is not None:
+            data = _orjson_dumps(schema, pretty)
+            if data is not None:
+                return data.decode()
+
         if pretty:
             return json.dumps(schema, indent=2, ensure_ascii=False)
         else:
-            return json.dumps(schema, ensure_ascii=False)
+            return json.dumps(schema, separators=(',', ':'), ensure_ascii=False)
 
     def to_html_script(self, schema: Dict) -> str:
         """
@@ -374,10 +701,28 @@ class SchemaGenerator:
         Returns:
             HTML script tag with JSON-LD
         """
+        if orjson is not None:
+            data = _orjson_dumps(schema, pretty=True)
+            if data is not None:
+                # Build the tag as bytes and decode once
+                return (b'<script type="application/ld+json">\n' + data + b'\n</script>').decode()
+
         json_ld = self.to_json_ld(schema, pretty=True)
         return f'<script type="application/ld+json">\n{json_ld}\n</script>'
 
 
+def _generate_post(
+    post_data: Dict,
+    context: str,
+    site_name: Optional[str],
+    site_logo: Optional[str]
+) -> List[Dict]:
+    """Generate one post's schemas; picklable for worker processes."""
+    generator = SchemaGenerator(cache_size=0)
+    generator.context = context
+    return generator.auto_generate_from_post(post_data, site_name, site_logo)
+
+
 if __name__ == "__main__":
     # Test schema generator
     generator = SchemaGenerator()
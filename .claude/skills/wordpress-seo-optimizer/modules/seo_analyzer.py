@@ -5,18 +5,56 @@ Combines all analysis modules to provide comprehensive SEO analysis
 and scoring for WordPress posts.
 """
 
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Dict, List, Optional
+
 from .keyword_analyzer import KeywordAnalyzer, extract_keywords_from_title
-from .onpage_optimizer import OnPageOptimizer
+from .onpage_optimizer import OnPageOptimizer, _extract_features
+
+
+@dataclass(slots=True)
+class PostResult:
+    """One row of a batch analysis report."""
+
+    id: int
+    title: str
+    score: int
+    critical_issues: int
+    recommendations: int
+
+    @classmethod
+    def from_analysis(cls, post_id: int, title: str, analysis: Dict) -> 'PostResult':
+        """Summarize an analyze() result as a report row."""
+        return cls(
+            id=post_id,
+            title=title,
+            score=analysis['overall_score'],
+            critical_issues=analysis['critical_issues'],
+            recommendations=len(analysis['recommendations'])
+        )
 
 
 class SEOAnalyzer:
     """Main SEO analyzer that orchestrates all analysis modules."""
 
-    def __init__(self):
-        """Initialize SEO analyzer with all sub-analyzers."""
+    def __init__(self, cache_size: int = 0):
+        """
+        Initialize SEO analyzer with all sub-analyzers.
+
+        Args:
+            cache_size: Number of analyze() results to keep, keyed by a
+                hash of the analyzed fields, so re-analyzing unchanged
+                posts is skipped. 0 disables the cache.
+        """
         self.keyword_analyzer = KeywordAnalyzer()
         self.onpage_optimizer = OnPageOptimizer()
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def analyze(self, post_data: Dict, target_keyword: Optional[str] = None) -> Dict:
         """
@@ -50,8 +88,24 @@ class SEOAnalyzer:
         meta_description = post_data.get('meta_description', '')
         url_slug = post_data.get('url_slug', '')
 
+        cache_key = None
+        if self.cache_size > 0:
+            cache_key = self._cache_key(
+                title, content, meta_description, url_slug, target_keyword
+            )
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        # Extract and strip the content once; every analysis below shares them
+        features = _extract_features(content)
+        plain_text = self.keyword_analyzer._strip_html(content)
+
         # Extract headings from content
-        headings = self._extract_headings(content)
+        headings = self._extract_headings(content, features)
 
         # Run keyword analysis
         keyword_analysis = self.keyword_analyzer.analyze_content(
@@ -59,7 +113,8 @@ class SEOAnalyzer:
             target_keyword=target_keyword,
             title=title,
             meta_description=meta_description,
-            headings=headings
+            headings=headings,
+            plain_text=plain_text
         )
 
         # Run on-page analysis
@@ -70,7 +125,9 @@ class SEOAnalyzer:
             'url_slug': url_slug,
             'target_keyword': target_keyword
         }
-        onpage_analysis = self.onpage_optimizer.analyze_onpage(onpage_data)
+        onpage_analysis = self.onpage_optimizer.analyze_onpage(
+            onpage_data, plain_text=plain_text, features=features
+        )
 
         # Calculate overall score (0-100)
         # Keyword: 15 points + On-page: 70 points + Technical/Schema: 15 points (future)
@@ -140,7 +197,7 @@ class SEOAnalyzer:
             if 'critical' in r.lower() or 'missing' in r.lower()
         ])
 
-        return {
+        result = {
             'overall_score': overall_score,
             'target_keyword': target_keyword,
             'keyword_analysis': keyword_analysis,
@@ -152,6 +209,23 @@ class SEOAnalyzer:
             'summary': self._generate_summary(overall_score, critical_issues, len(recommendations))
         }
 
+        if cache_key is not None:
+            # Keep a private copy so callers can't modify the cached result
+            with self._cache_lock:
+                self._cache[cache_key] = copy.deepcopy(result)
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return result
+
+    def _cache_key(self, *fields: str) -> bytes:
+        """Hash the analyzed fields into an analyze() cache key."""
+        return hashlib.blake2b(
+            "\x00".join(fields).encode("utf-8", "surrogatepass"),
+            digest_size=16
+        ).digest()
+
     def _detect_primary_keyword(self, post_data: Dict) -> str:
         """Auto-detect primary keyword from title."""
         title = post_data.get('title', '')
@@ -166,17 +240,16 @@ class SEOAnalyzer:
         # Fallback: return first phrase or first word
         return candidates[0] if candidates else "main topic"
 
-    def _extract_headings(self, html_content: str) -> List[str]:
-        """Extract all heading text from HTML content."""
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html_content, 'html.parser')
-        headings = []
-
-        for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            for heading in soup.find_all(tag):
-                headings.append(heading.get_text())
+    def _extract_headings(
+        self, html_content: str, features: Optional[Dict] = None
+    ) -> List[str]:
+        """Extract all heading text from HTML content (or its extracted features)."""
+        if features is None:
+            features = _extract_features(html_content)
 
-        return headings
+        # Group by level (all H1s first, then H2s, ...); the stable sort
+        # keeps document order within each level
+        return [text for _, text in sorted(features['headers'], key=lambda header: header[0])]
 
     def _prioritize_recommendations(
         self,
@@ -7,37 +7,105 @@ schema markup detection, HTTPS checks, and basic Core Web Vitals.
 
 import re
 import json
+from functools import lru_cache
 from typing import Dict, List, Optional
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 
+# Prefer the C-based lxml parser; fall back to the pure-Python parser
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# Optional: selectolax (Lexbor) parses much faster than BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Optional: orjson decodes several times faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_JSON_LD_TYPE = 'application/ld+json'
+_FLASH_TYPE = 'application/x-shockwave-flash'
+
+# Tags collected in the single walk over a page
+_COLLECTED_TAGS = ('meta', 'link', 'script', 'style', 'img', 'font', 'object')
+_COLLECTED_SELECTOR = ', '.join(_COLLECTED_TAGS)
+
+# Crawls audit the same URLs again and again; ParseResult is immutable,
+# so the parse can be shared
+_parse_url = lru_cache(maxsize=4096)(urlparse)
+
+# Article schema fields SchemaValidator checks for
+_ARTICLE_REQUIRED_FIELDS = ('headline', 'author', 'datePublished')
+_ARTICLE_RECOMMENDED_FIELDS = ('image', 'publisher', 'dateModified')
+
+
+def _load_json(text: str):
+    """json.loads(text), decoded by orjson when it accepts the text."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except (ValueError, TypeError):
+            # orjson is stricter (NaN, huge integers, lone surrogates):
+            # let json decide, and raise the error it would
+            pass
+    return json.loads(text)
+
+
+def _is_small_font(size: Optional[str]) -> bool:
+    """Whether a <font> size attribute is below 3 (non-numeric sizes are not)."""
+    if not size:
+        return False
+    try:
+        return int(size) < 3
+    except ValueError:
+        return False
+
 
 class TechnicalAuditor:
     """Audit technical SEO elements."""
 
+    __slots__ = ('_last_page',)
+
     def __init__(self):
         """Initialize technical auditor."""
-        pass
-
-    def audit(self, url: str, html_content: str) -> Dict:
+        # (html_content, elements) of the last page parsed
+        self._last_page = None
+
+    def audit(
+        self,
+        url: str,
+        html_content: str,
+        soup: Optional[BeautifulSoup] = None
+    ) -> Dict:
         """
         Perform comprehensive technical SEO audit.
 
         Args:
             url: Page URL
             html_content: Full HTML content of the page
+            soup: Already parsed html_content (optional, used instead of
+                parsing it again)
 
         Returns:
             Technical audit results with scores and recommendations
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Parse once; every check below works from the extracted elements
+        elements = self._extract_elements(html_content, soup)
 
         # Run all audits
         https_check = self._check_https(url)
-        mobile_check = self._check_mobile_friendly(soup)
-        schema_check = self._check_schema_markup(soup)
-        canonical_check = self._check_canonical(soup, url)
-        meta_robots_check = self._check_meta_robots(soup)
+        mobile_check = self._check_mobile_friendly(elements)
+        schema_check = self._check_schema_markup(elements)
+        canonical_check = self._check_canonical(elements, url)
+        meta_robots_check = self._check_meta_robots(elements)
 
         # Calculate score (max 15 points for MVP)
         score = 0
@@ -86,9 +154,145 @@ class TechnicalAuditor:
             'passed': score >= 12
         }
 
+    def _extract_elements(
+        self,
+        html_content: str,
+        soup: Optional[BeautifulSoup] = None
+    ) -> Dict:
+        """
+        Parse the page once and pull out everything the checks inspect.
+
+        Walks soup when one is given; otherwise parses with selectolax
+        (Lexbor) when installed, or BeautifulSoup. The last page is kept,
+        so audit() and check_page_speed_basic() on the same HTML share one
+        parse.
+
+        Returns:
+            Dictionary with:
+                - has_viewport: A viewport meta tag is present
+                - has_media_query: A <style> block contains @media
+                - has_flash: A Flash <object> is embedded
+                - has_small_fonts: A <font> tag has size below 3
+                - json_ld: Text of each JSON-LD script (None if empty)
+                - itemtypes: itemtype of each microdata element
+                - canonical_href: href of the canonical link (None if no tag)
+                - robots_content: content of the robots meta tag (None if no tag)
+                - resources: Image, script and stylesheet counts
+        """
+        cached = self._last_page
+        if cached is not None and cached[0] == html_content:
+            return cached[1]
+
+        if soup is None and LexborHTMLParser is not None:
+            elements = self._extract_elements_lexbor(html_content)
+        else:
+            elements = self._extract_elements_bs4(html_content, soup)
+
+        self._last_page = (html_content, elements)
+        return elements
+
+    def _extract_elements_bs4(
+        self,
+        html_content: str,
+        soup: Optional[BeautifulSoup] = None
+    ) -> Dict:
+        """BeautifulSoup version of _extract_elements()."""
+        if soup is None:
+            soup = BeautifulSoup(html_content, _HTML_PARSER)
+
+        # One walk over the tree, bucketing the tags the checks look at
+        nodes = {name: [] for name in _COLLECTED_TAGS}
+        itemtypes = []
+        for tag in soup.find_all(True):
+            bucket = nodes.get(tag.name)
+            if bucket is not None:
+                bucket.append(tag)
+            itemtype = tag.get('itemtype')
+            if itemtype is not None:
+                itemtypes.append(itemtype)
+
+        metas = nodes['meta']
+        robots = [tag for tag in metas if tag.get('name') == 'robots']
+        # rel is parsed into a list of tokens
+        canonical = [tag for tag in nodes['link'] if 'canonical' in tag.get('rel', [])]
+        stylesheets = [tag for tag in nodes['link'] if 'stylesheet' in tag.get('rel', [])]
+
+        return {
+            'has_viewport': any(tag.get('name') == 'viewport' for tag in metas),
+            'has_media_query': any('@media' in tag.get_text() for tag in nodes['style']),
+            'has_flash': any(tag.get('type') == _FLASH_TYPE for tag in nodes['object']),
+            'has_small_fonts': any(_is_small_font(tag.get('size')) for tag in nodes['font']),
+            'json_ld': [tag.string for tag in nodes['script'] if tag.get('type') == _JSON_LD_TYPE],
+            'itemtypes': itemtypes,
+            'canonical_href': canonical[0].get('href', '') if canonical else None,
+            'robots_content': robots[0].get('content', '') if robots else None,
+            'resources': self._count_resources(
+                [tag.get('loading') for tag in nodes['img']],
+                [tag.get('src') for tag in nodes['script']],
+                [tag.get('media') for tag in stylesheets]
+            )
+        }
+
+    def _extract_elements_lexbor(self, html_content: str) -> Dict:
+        """Lexbor version of _extract_elements(), matching its results."""
+        tree = LexborHTMLParser(html_content)
+
+        # One query for all the tags the checks look at, bucketed by name
+        nodes = {name: [] for name in _COLLECTED_TAGS}
+        for node in tree.css(_COLLECTED_SELECTOR):
+            nodes[node.tag].append(node)
+
+        metas = nodes['meta']
+        robots = [node for node in metas if node.attributes.get('name') == 'robots']
+        # rel is a space-separated list, as BeautifulSoup treats it
+        rels = [(node, (node.attributes.get('rel') or '').split()) for node in nodes['link']]
+        canonical = [node for node, rel in rels if 'canonical' in rel]
+        stylesheets = [node for node, rel in rels if 'stylesheet' in rel]
+
+        return {
+            'has_viewport': any(node.attributes.get('name') == 'viewport' for node in metas),
+            'has_media_query': any('@media' in node.text() for node in nodes['style']),
+            'has_flash': any(
+                node.attributes.get('type') == _FLASH_TYPE for node in nodes['object']
+            ),
+            'has_small_fonts': any(
+                _is_small_font(node.attributes.get('size')) for node in nodes['font']
+            ),
+            'json_ld': [
+                node.text() or None for node in nodes['script']
+                if node.attributes.get('type') == _JSON_LD_TYPE
+            ],
+            'itemtypes': [node.attributes['itemtype'] or '' for node in tree.css('[itemtype]')],
+            'canonical_href': (canonical[0].attributes.get('href') or '') if canonical else None,
+            'robots_content': (robots[0].attributes.get('content') or '') if robots else None,
+            'resources': self._count_resources(
+                [node.attributes.get('loading') for node in nodes['img']],
+                [node.attributes.get('src') for node in nodes['script']],
+                [node.attributes.get('media') for node in stylesheets]
+            )
+        }
+
+    def _count_resources(
+        self,
+        image_loading: List[Optional[str]],
+        script_srcs: List[Optional[str]],
+        stylesheet_media: List[Optional[str]]
+    ) -> Dict:
+        """Count resources from the loading/src/media attribute of each tag."""
+        return {
+            'images': len(image_loading),
+            'images_without_lazy': sum(1 for loading in image_loading if not loading),
+            'scripts': len(script_srcs),
+            'inline_scripts': sum(1 for src in script_srcs if not src),
+            'stylesheets': len(stylesheet_media),
+            'render_blocking_css': sum(
+                1 for media in stylesheet_media if not media or media == 'all'
+            )
+        }
+
     def _check_https(self, url: str) -> Dict:
         """Check if URL uses HTTPS."""
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
         is_https = parsed.scheme == 'https'
 
         return {
@@ -97,7 +301,7 @@ class TechnicalAuditor:
             'message': '✅ HTTPS enabled' if is_https else '⚠️ Site not using HTTPS'
         }
 
-    def _check_mobile_friendly(self, soup: BeautifulSoup) -> Dict:
+    def _check_mobile_friendly(self, elements: Dict) -> Dict:
         """
         Check for mobile-friendly indicators.
 
@@ -107,30 +311,24 @@ class TechnicalAuditor:
         recommendations = []
 
         # Check viewport meta tag
-        viewport = soup.find('meta', attrs={'name': 'viewport'})
-        has_viewport = viewport is not None
+        has_viewport = elements['has_viewport']
 
         if not has_viewport:
             issues.append("Missing viewport meta tag")
             recommendations.append("Add <meta name='viewport' content='width=device-width, initial-scale=1.0'>")
 
         # Check for responsive indicators
-        has_responsive_css = False
-        for style in soup.find_all('style'):
-            if '@media' in style.get_text():
-                has_responsive_css = True
-                break
+        has_responsive_css = elements['has_media_query']
 
         # Check for mobile-unfriendly elements
         # Flash content
-        has_flash = soup.find('object', attrs={'type': 'application/x-shockwave-flash'}) is not None
+        has_flash = elements['has_flash']
         if has_flash:
             issues.append("Flash content detected (not mobile-friendly)")
             recommendations.append("Remove Flash content")
 
         # Small text
-        small_fonts = soup.find_all('font', attrs={'size': lambda x: x and int(x) < 3})
-        if small_fonts:
+        if elements['has_small_fonts']:
             issues.append("Small font sizes detected")
             recommendations.append("Use minimum 16px font size for mobile")
 
@@ -147,27 +345,23 @@ class TechnicalAuditor:
             'message': '✅ Mobile-friendly' if passed else '⚠️ Mobile issues detected'
         }
 
-    def _check_schema_markup(self, soup: BeautifulSoup) -> Dict:
+    def _check_schema_markup(self, elements: Dict) -> Dict:
         """Check for structured data / schema markup."""
         schemas_found = []
         issues = []
         recommendations = []
 
         # Look for JSON-LD scripts
-        json_ld_scripts = soup.find_all('script', attrs={'type': 'application/ld+json'})
-
-        for script in json_ld_scripts:
+        for script_text in elements['json_ld']:
             try:
-                data = json.loads(script.string)
+                data = _load_json(script_text)
                 schema_type = data.get('@type', 'Unknown')
                 schemas_found.append(schema_type)
-            except (json.JSONDecodeError, AttributeError):
+            except (json.JSONDecodeError, AttributeError, TypeError):
                 issues.append("Invalid JSON-LD schema detected")
 
         # Look for microdata
-        microdata_items = soup.find_all(attrs={'itemtype': True})
-        for item in microdata_items:
-            itemtype = item.get('itemtype', '')
+        for itemtype in elements['itemtypes']:
             if 'schema.org' in itemtype:
                 schema_type = itemtype.split('/')[-1]
                 if schema_type not in schemas_found:
@@ -192,11 +386,11 @@ class TechnicalAuditor:
             'message': f'✅ Schema found: {", ".join(schemas_found[:3])}' if schemas_found else '⚠️ No schema markup'
         }
 
-    def _check_canonical(self, soup: BeautifulSoup, url: str) -> Dict:
+    def _check_canonical(self, elements: Dict, url: str) -> Dict:
         """Check canonical tag."""
-        canonical = soup.find('link', attrs={'rel': 'canonical'})
+        canonical_url = elements['canonical_href']
 
-        if not canonical:
+        if canonical_url is None:
             return {
                 'passed': False,
                 'has_canonical': False,
@@ -204,7 +398,6 @@ class TechnicalAuditor:
                 'message': '⚠️ Missing canonical tag'
             }
 
-        canonical_url = canonical.get('href', '')
         is_self_referencing = canonical_url == url
 
         return {
@@ -215,11 +408,11 @@ class TechnicalAuditor:
             'message': f'✅ Canonical tag present'
         }
 
-    def _check_meta_robots(self, soup: BeautifulSoup) -> Dict:
+    def _check_meta_robots(self, elements: Dict) -> Dict:
         """Check meta robots tag."""
-        meta_robots = soup.find('meta', attrs={'name': 'robots'})
+        content = elements['robots_content']
 
-        if not meta_robots:
+        if content is None:
             # No robots tag is fine (defaults to index, follow)
             return {
                 'passed': True,
@@ -227,7 +420,7 @@ class TechnicalAuditor:
                 'message': '✅ Indexable (no robots restriction)'
             }
 
-        content = meta_robots.get('content', '').lower()
+        content = content.lower()
 
         # Check for problematic directives
         is_noindex = 'noindex' in content
@@ -246,54 +439,55 @@ class TechnicalAuditor:
             'message': f'✅ Robots meta: {content}'
         }
 
-    def check_page_speed_basic(self, html_content: str) -> Dict:
+    def check_page_speed_basic(
+        self,
+        html_content: str,
+        soup: Optional[BeautifulSoup] = None
+    ) -> Dict:
         """
         Basic page speed checks.
 
         For MVP: Simple checks. Future: Integrate with PageSpeed Insights API
+
+        Args:
+            html_content: Full HTML content of the page
+            soup: Already parsed html_content (optional, used instead of
+                parsing it again)
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        resources = self._extract_elements(html_content, soup)['resources']
+        images_without_lazy = resources['images_without_lazy']
+        inline_scripts = resources['inline_scripts']
+        render_blocking_css = resources['render_blocking_css']
 
         issues = []
         recommendations = []
 
-        # Count resources
-        images = soup.find_all('img')
-        scripts = soup.find_all('script')
-        stylesheets = soup.find_all('link', attrs={'rel': 'stylesheet'})
-
         # Check for optimization opportunities
         # Images without loading="lazy"
-        images_without_lazy = [img for img in images if not img.get('loading')]
-        if len(images_without_lazy) > 3:
-            issues.append(f"{len(images_without_lazy)} images without lazy loading")
+        if images_without_lazy > 3:
+            issues.append(f"{images_without_lazy} images without lazy loading")
             recommendations.append("Add loading='lazy' to below-fold images")
 
         # Inline scripts (blocking)
-        inline_scripts = [s for s in scripts if not s.get('src')]
-        if len(inline_scripts) > 5:
-            issues.append(f"{len(inline_scripts)} inline scripts (may block rendering)")
+        if inline_scripts > 5:
+            issues.append(f"{inline_scripts} inline scripts (may block rendering)")
             recommendations.append("Move inline scripts to external files or defer")
 
         # Render-blocking resources
-        render_blocking_css = [
-            link for link in stylesheets
-            if not link.get('media') or link.get('media') == 'all'
-        ]
-        if len(render_blocking_css) > 3:
+        if render_blocking_css > 3:
             recommendations.append("Consider inlining critical CSS and deferring non-critical styles")
 
         return {
             'resource_counts': {
-                'images': len(images),
-                'scripts': len(scripts),
-                'stylesheets': len(stylesheets),
-                'inline_scripts': len(inline_scripts)
+                'images': resources['images'],
+                'scripts': resources['scripts'],
+                'stylesheets': resources['stylesheets'],
+                'inline_scripts': inline_scripts
             },
             'optimization_opportunities': {
-                'images_without_lazy': len(images_without_lazy),
-                'inline_scripts': len(inline_scripts),
-                'render_blocking_css': len(render_blocking_css)
+                'images_without_lazy': images_without_lazy,
+                'inline_scripts': inline_scripts,
+                'render_blocking_css': render_blocking_css
             },
             'issues': issues,
             'recommendations': recommendations
@@ -306,11 +500,12 @@ class SchemaValidator:
     @staticmethod
     def validate_article_schema(schema_data: Dict) -> Dict:
         """Validate Article schema."""
-        required_fields = ['headline', 'author', 'datePublished']
-        recommended_fields = ['image', 'publisher', 'dateModified']
-
-        missing_required = [f for f in required_fields if f not in schema_data]
-        missing_recommended = [f for f in recommended_fields if f not in schema_data]
+        missing_required = [
+            f for f in _ARTICLE_REQUIRED_FIELDS if f not in schema_data
+        ]
+        missing_recommended = [
+            f for f in _ARTICLE_RECOMMENDED_FIELDS if f not in schema_data
+        ]
 
         is_valid = len(missing_required) == 0
 
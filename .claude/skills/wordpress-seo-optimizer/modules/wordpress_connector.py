@@ -7,14 +7,181 @@ Integrates with wordpress-publisher module and detects SEO plugins.
 
 import sys
 import os
-from typing import Dict, List, Optional, Tuple
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, TypedDict, Union
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from .onpage_optimizer import _WORD_RE, _strip_html
+except ImportError:
+    from onpage_optimizer import _WORD_RE, _strip_html
+
+logger = logging.getLogger(__name__)
+
+# WordPress core rejects batch requests with more than 25 sub-requests,
+# unless the site changes it (the endpoint reports its own maxItems)
+_BATCH_LIMIT = 25
+
+# Largest per_page the posts endpoint accepts
+_MAX_PER_PAGE = 100
+
+# Fields _summarize_post() reads; the server skips computing the rest
+_SUMMARY_FIELDS = 'id,title,slug,status,date,modified,link'
+
+# Fields fetch_post(content_only_stats=True) reads from the post
+_STATS_FIELDS = (
+    'id,title,content,excerpt,slug,link,status,date,modified,'
+    'categories,tags,featured_media,meta'
+)
+
+# Where detected SEO plugins are remembered between runs, and for how long
+_PLUGIN_CACHE_PATH = Path.home() / '.cache' / 'wp_seo_optimizer' / 'plugin_detect.json'
+_PLUGIN_CACHE_TTL = 24 * 60 * 60
+
+# Display names of the supported SEO plugins
+_PLUGIN_NAMES = {
+    'yoast': 'Yoast SEO',
+    'rankmath': 'Rank Math',
+    'aioseo': 'All in One SEO',
+    'seopress': 'SEOPress',
+    None: 'No SEO plugin detected'
+}
+
+# Meta fields each supported SEO plugin stores its values in
+_PLUGIN_FIELDS = {
+    'yoast': {
+        'title': '_yoast_wpseo_title',
+        'description': '_yoast_wpseo_metadesc',
+        'keyword': '_yoast_wpseo_focuskw'
+    },
+    'rankmath': {
+        'title': 'rank_math_title',
+        'description': 'rank_math_description',
+        'keyword': 'rank_math_focus_keyword'
+    },
+    'aioseo': {
+        'title': '_aioseo_title',
+        'description': '_aioseo_description',
+        'keyword': '_aioseo_keyphrases'
+    },
+    'seopress': {
+        'title': '_seopress_titles_title',
+        'description': '_seopress_titles_desc',
+        'keyword': '_seopress_analysis_target_kw'
+    }
+}
+
+# Meta keys that give each SEO plugin away, in detection priority order
+# (a site may carry leftovers of a plugin it migrated from)
+_DETECTION_KEYS = {
+    '_yoast_wpseo_title': 'yoast',
+    '_yoast_wpseo_metadesc': 'yoast',
+    'rank_math_title': 'rankmath',
+    'rank_math_description': 'rankmath',
+    '_aioseo_title': 'aioseo',
+    '_aioseo_description': 'aioseo',
+    '_seopress_titles_title': 'seopress'
+}
+_DETECTION_RANK = {key: rank for rank, key in enumerate(_DETECTION_KEYS)}
+
+# Fields batch_update_post_seo() accepts besides post_id
+_UPDATE_FIELDS = frozenset(('title', 'meta_description', 'focus_keyword', 'content'))
+
+# How many fetched posts' current SEO values are kept to skip no-op
+# updates (skip_unchanged=True), and for how long after the fetch
+_POST_CACHE_SIZE = 256
+_POST_VALUES_TTL = 5 * 60
+
+# Transient statuses worth retrying (rate limiting, server hiccups)
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+@lru_cache(maxsize=1)
+def _load_wp_client_cls():
+    """Import WordPressClient once; later connectors reuse the class."""
+    # Try to import from modules directory
+    modules_dir = Path(__file__).parent.parent.parent.parent / 'modules' / 'wordpress-publisher' / 'src'
+    if modules_dir.exists() and str(modules_dir) not in sys.path:
+        sys.path.insert(0, str(modules_dir))
+
+    from wordpress_publisher import WordPressClient
+    return WordPressClient
+
+
+@lru_cache(maxsize=None)
+def _plugin_info(plugin: Optional[str]) -> Dict:
+    """get_seo_plugin_info() result for a plugin, built once per plugin."""
+    return {
+        'detected': plugin,
+        'name': _PLUGIN_NAMES.get(plugin, 'Unknown'),
+        'fields': _PLUGIN_FIELDS.get(plugin, {}),
+        'can_update': plugin is not None
+    }
+
+
+class WPPost(TypedDict):
+    """Post data returned by WordPressConnector.fetch_post()."""
+
+    id: int
+    title: str
+    content: str
+    excerpt: str
+    slug: str
+    url_slug: str
+    link: str
+    meta_description: str
+    focus_keyword: str
+    status: str
+    date: str
+    modified: str
+    categories: List[int]
+    tags: List[int]
+    featured_media: int
+    meta: Dict
+
+
+class WPPostStats(TypedDict):
+    """fetch_post(content_only_stats=True) result: text statistics, no HTML."""
+
+    id: int
+    title: str
+    excerpt: str
+    slug: str
+    url_slug: str
+    link: str
+    meta_description: str
+    focus_keyword: str
+    status: str
+    date: str
+    modified: str
+    categories: List[int]
+    tags: List[int]
+    featured_media: int
+    content_text: str
+    content_length: int
+    word_count: int
+
 
 class WordPressConnector:
     """Connect to WordPress and manage SEO operations via REST API."""
 
-    def __init__(self, base_url: str, username: str, app_password: str):
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        app_password: str,
+        force_refresh: bool = False
+    ):
         """
         Initialize WordPress connector.
 
@@ -22,25 +189,49 @@ class WordPressConnector:
             base_url: WordPress site URL (e.g., https://yoursite.com)
             username: WordPress username
             app_password: WordPress Application Password
+            force_refresh: Re-detect the SEO plugin even if a detection
+                from the last day is remembered
         """
         self.base_url = base_url.rstrip('/')
         self.username = username
         self.app_password = app_password
         self.wp_client = None
         self.seo_plugin = None
+        self._field_map = {}
+        self._batch_limit = None
+
+        # Current SEO values of recently fetched posts, so unchanged fields
+        # are not written back (fetch_posts fills it from several threads)
+        self._post_values: "OrderedDict[int, Dict]" = OrderedDict()
+        self._post_values_lock = threading.Lock()
+
+        # One pooled keep-alive session for the REST calls made directly
+        # (batch updates, paginated listing) instead of a connection per call.
+        # urllib3 retries only idempotent methods, so the batch POST is never
+        # replayed; the last response is returned rather than raised, so
+        # callers still see (and handle) a final 429
+        self._session = requests.Session()
+        self._session.auth = (username, app_password)
+        self._adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=_RETRY_STATUSES,
+                raise_on_status=False
+            )
+        )
+        self._session.mount('https://', self._adapter)
+        self._session.mount('http://', self._adapter)
 
         # Try to import wordpress-publisher
-        self._import_wordpress_client()
+        self._import_wordpress_client(force_refresh)
 
-    def _import_wordpress_client(self):
+    def _import_wordpress_client(self, force_refresh: bool = False):
         """Import WordPress client from wordpress-publisher module."""
         try:
-            # Try to import from modules directory
-            modules_dir = Path(__file__).parent.parent.parent.parent / 'modules' / 'wordpress-publisher' / 'src'
-            if modules_dir.exists():
-                sys.path.insert(0, str(modules_dir))
-
-            from wordpress_publisher import WordPressClient
+            WordPressClient = _load_wp_client_cls()
 
             self.wp_client = WordPressClient(
                 base_url=self.base_url,
@@ -48,8 +239,16 @@ class WordPressConnector:
                 app_password=self.app_password
             )
 
+            # If the client makes its calls through a requests.Session, let
+            # them share the pooled adapter too
+            client_session = getattr(self.wp_client, 'session', None)
+            if isinstance(client_session, requests.Session):
+                client_session.mount('https://', self._adapter)
+                client_session.mount('http://', self._adapter)
+
             # Detect SEO plugin
-            self.seo_plugin = self._detect_seo_plugin()
+            self.seo_plugin = self._detect_seo_plugin(force_refresh)
+            self._field_map = _PLUGIN_FIELDS.get(self.seo_plugin, {})
 
         except ImportError as e:
             raise ImportError(
@@ -58,57 +257,153 @@ class WordPressConnector:
                 f"Error: {e}"
             )
 
-    def _detect_seo_plugin(self) -> Optional[str]:
+    def close(self):
+        """Close the pooled connections."""
+        self._session.close()
+
+    def _detect_seo_plugin(self, force_refresh: bool = False) -> Optional[str]:
         """
         Detect which SEO plugin is active.
 
+        A detected plugin is remembered on disk for a day per site, so later
+        connectors skip the probe request. "No plugin" is not remembered,
+        so a plugin installed since is picked up by the next connector.
+
+        Args:
+            force_refresh: Probe the site even if a detection is remembered
+
         Returns:
             'yoast', 'rankmath', 'aioseo', 'seopress', or None
         """
+        if not force_refresh:
+            plugin = self._cached_seo_plugin()
+            if plugin is not None:
+                return plugin
+
         try:
-            # Try to fetch a post and check meta fields
-            posts = self.wp_client.list_posts(per_page=1)
+            # One post's meta, inline in the listing: the edit context
+            # includes every registered meta field, and _fields trims the
+            # rest. Users without edit rights get the view context instead
+            response = self._fetch_posts_page(
+                {'per_page': 1, 'context': 'edit', '_fields': 'id,meta'}, 1
+            )
+            if response.status_code in (401, 403):
+                response = self._fetch_posts_page(
+                    {'per_page': 1, '_fields': 'id,meta'}, 1
+                )
+            response.raise_for_status()
+            posts = response.json()
             if not posts:
                 return None
 
-            post = self.wp_client.get_post(posts[0]['id'])
-            meta = post.get('meta', {})
+            meta = posts[0].get('meta') or {}
 
             # Check for plugin-specific meta fields
-            if '_yoast_wpseo_title' in meta or '_yoast_wpseo_metadesc' in meta:
-                return 'yoast'
-            elif 'rank_math_title' in meta or 'rank_math_description' in meta:
-                return 'rankmath'
-            elif '_aioseo_title' in meta or '_aioseo_description' in meta:
-                return 'aioseo'
-            elif '_seopress_titles_title' in meta:
-                return 'seopress'
-
-            return None
+            hits = meta.keys() & _DETECTION_KEYS.keys()
+            plugin = _DETECTION_KEYS[min(hits, key=_DETECTION_RANK.get)] if hits else None
 
         except Exception as e:
-            print(f"Warning: Could not detect SEO plugin: {e}")
+            logger.warning("Could not detect SEO plugin: %s", e)
             return None
 
-    def fetch_post(self, post_id: int) -> Dict:
+        self._remember_seo_plugin(plugin)
+        return plugin
+
+    def _cached_seo_plugin(self) -> Optional[str]:
+        """Plugin remembered for this site, if still fresh."""
+        try:
+            with open(_PLUGIN_CACHE_PATH, encoding='utf-8') as f:
+                entry = json.load(f)[self.base_url]
+            plugin = entry['plugin']
+            if isinstance(plugin, str) and time.time() - entry['ts'] < _PLUGIN_CACHE_TTL:
+                return plugin
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _remember_seo_plugin(self, plugin: Optional[str]):
+        """Store this site's detected plugin on disk, or forget it if None (best effort)."""
+        try:
+            try:
+                with open(_PLUGIN_CACHE_PATH, encoding='utf-8') as f:
+                    cache = json.load(f)
+                if not isinstance(cache, dict):
+                    cache = {}
+            except (OSError, ValueError):
+                cache = {}
+
+            if plugin is None:
+                if cache.pop(self.base_url, None) is None:
+                    return
+            else:
+                cache[self.base_url] = {'plugin': plugin, 'ts': time.time()}
+
+            # Write a temporary file and swap it in, so concurrent runs
+            # never read a half-written cache
+            _PLUGIN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _PLUGIN_CACHE_PATH.with_name(f'{_PLUGIN_CACHE_PATH.name}.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, _PLUGIN_CACHE_PATH)
+        except OSError:
+            pass
+
+    def fetch_post(
+        self, post_id: int, content_only_stats: bool = False
+    ) -> Union[WPPost, WPPostStats]:
         """
         Fetch post data from WordPress.
 
         Args:
             post_id: WordPress post ID
+            content_only_stats: Return the content's plain text, length and
+                word count (as the on-page analyzer counts them) instead of
+                its HTML and the raw meta, so neither stays in memory
 
         Returns:
             Dictionary with post data suitable for SEO analysis
         """
         # Fetch post via REST API
-        post = self.wp_client.get_post(post_id)
+        if content_only_stats:
+            response = self._session.get(
+                f'{self.base_url}/wp-json/wp/v2/posts/{post_id}',
+                params={'context': 'view', '_fields': _STATS_FIELDS},
+                timeout=30
+            )
+            response.raise_for_status()
+            post = response.json()
+        else:
+            post = self.wp_client.get_post(post_id)
 
         # Extract SEO meta based on detected plugin
         meta = post.get('meta', {})
         meta_description = self._extract_meta_description(meta)
         focus_keyword = self._extract_focus_keyword(meta)
+        self._remember_post_values(post['id'], post['title']['rendered'], meta)
+
+        if content_only_stats:
+            content_text = _strip_html(post['content']['rendered'])
+            return {
+                'id': post['id'],
+                'title': post['title']['rendered'],
+                'excerpt': post['excerpt']['rendered'],
+                'slug': post['slug'],
+                'url_slug': post['slug'],
+                'link': post['link'],
+                'meta_description': meta_description,
+                'focus_keyword': focus_keyword,
+                'status': post['status'],
+                'date': post['date'],
+                'modified': post['modified'],
+                'categories': post.get('categories', []),
+                'tags': post.get('tags', []),
+                'featured_media': post.get('featured_media', 0),
+                'content_text': content_text,
+                'content_length': len(content_text),
+                'word_count': len(_WORD_RE.findall(content_text))
+            }
 
-        # Parse content for analysis
+        # Parse content for analysis (every WPPost field is always present)
         return {
             'id': post['id'],
             'title': post['title']['rendered'],
@@ -128,31 +423,51 @@ class WordPressConnector:
             'meta': meta  # Raw meta for custom processing
         }
 
+    def fetch_posts(
+        self, post_ids: List[int], max_workers: int = 10
+    ) -> List[Union[WPPost, Exception]]:
+        """
+        Fetch several posts concurrently.
+
+        Each fetch is a blocking REST round-trip, so overlapping them makes
+        the total time close to that of the slowest post rather than the sum.
+
+        Args:
+            post_ids: WordPress post IDs
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            One entry per post ID, in input order: the post data from
+            fetch_post(), or the exception raised while fetching that post
+        """
+        if not post_ids:
+            return []
+
+        def fetch_one(post_id: int) -> Union[WPPost, Exception]:
+            try:
+                return self.fetch_post(post_id)
+            except Exception as e:
+                return e
+
+        workers = min(max_workers, len(post_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch_one, post_ids))
+
     def _extract_meta_description(self, meta: Dict) -> str:
         """Extract meta description based on SEO plugin."""
-        if self.seo_plugin == 'yoast':
-            return meta.get('_yoast_wpseo_metadesc', '')
-        elif self.seo_plugin == 'rankmath':
-            return meta.get('rank_math_description', '')
-        elif self.seo_plugin == 'aioseo':
-            return meta.get('_aioseo_description', '')
-        elif self.seo_plugin == 'seopress':
-            return meta.get('_seopress_titles_desc', '')
-        return ''
+        field = self._field_map.get('description')
+        return meta.get(field, '') if field else ''
 
     def _extract_focus_keyword(self, meta: Dict) -> str:
         """Extract focus keyword based on SEO plugin."""
-        if self.seo_plugin == 'yoast':
-            return meta.get('_yoast_wpseo_focuskw', '')
-        elif self.seo_plugin == 'rankmath':
-            keywords = meta.get('rank_math_focus_keyword', '')
+        field = self._field_map.get('keyword')
+        if not field:
+            return ''
+        keywords = meta.get(field, '')
+        if self.seo_plugin == 'rankmath':
             # RankMath stores comma-separated keywords
             return keywords.split(',')[0].strip() if keywords else ''
-        elif self.seo_plugin == 'aioseo':
-            return meta.get('_aioseo_keyphrases', '')
-        elif self.seo_plugin == 'seopress':
-            return meta.get('_seopress_analysis_target_kw', '')
-        return ''
+        return keywords
 
     def update_post_seo(
         self,
@@ -160,7 +475,8 @@ class WordPressConnector:
         title: Optional[str] = None,
         meta_description: Optional[str] = None,
         focus_keyword: Optional[str] = None,
-        content: Optional[str] = None
+        content: Optional[str] = None,
+        skip_unchanged: bool = False
     ) -> Dict:
         """
         Update post SEO elements.
@@ -171,10 +487,232 @@ class WordPressConnector:
             meta_description: New meta description (optional)
             focus_keyword: New focus keyword (optional)
             content: New content (optional)
+            skip_unchanged: Leave out values the post had when this
+                connector fetched it (within the last few minutes), and
+                send nothing if none changed. Edits made elsewhere since
+                that fetch are not seen
 
         Returns:
             Updated post data
         """
+        requested = any((title, meta_description, focus_keyword, content))
+        if skip_unchanged:
+            title, meta_description, focus_keyword = self._drop_unchanged(
+                post_id, title, meta_description, focus_keyword
+            )
+        updates = self._build_seo_updates(title, meta_description, focus_keyword, content)
+
+        # Apply updates via REST API
+        if updates:
+            result = self.wp_client.update_post(post_id, updates)
+            self._forget_post_values(post_id)
+            return result
+
+        if requested:
+            return {'message': 'No changes; skipped'}
+        return {'message': 'No updates to apply'}
+
+    def batch_update_post_seo(
+        self, updates: List[Dict], skip_unchanged: bool = False
+    ) -> List[Dict]:
+        """
+        Update SEO elements of several posts through the REST batch endpoint.
+
+        Sub-requests are sent to /wp-json/batch/v1 (WordPress 5.6+) in groups
+        of the size the endpoint advertises (25 by default), so N updates
+        cost ceil(N / 25) round-trips instead of N. Every update is checked
+        here first (see _validate_seo_update), so the server skips its
+        all-must-validate pre-pass and applies each sub-request directly;
+        a rejected one shows up as an error status in its response.
+
+        A single update is sent as a plain update request, and sites
+        without the batch endpoint (before WordPress 5.6) get one update
+        request per post, sent concurrently over the pooled session; each
+        is then applied on its own.
+
+        Args:
+            updates: One dict per post with 'post_id' plus any of the
+                update_post_seo() keyword arguments (title,
+                meta_description, focus_keyword, content)
+            skip_unchanged: Leave out values each post had when it was
+                last fetched, as in update_post_seo()
+
+        Returns:
+            One response dict per sub-request sent, in input order
+            (posts with nothing to update are skipped)
+
+        Raises:
+            ValueError: If an update is malformed (nothing is sent then)
+        """
+        for update in updates:
+            self._validate_seo_update(update)
+
+        sub_requests = []
+        for update in updates:
+            fields = dict(update)
+            post_id = fields.pop('post_id')
+            if skip_unchanged:
+                fields['title'], fields['meta_description'], fields['focus_keyword'] = \
+                    self._drop_unchanged(
+                        post_id,
+                        fields.get('title'),
+                        fields.get('meta_description'),
+                        fields.get('focus_keyword')
+                    )
+            body = self._build_seo_updates(**fields)
+            if body:
+                self._forget_post_values(post_id)
+                sub_requests.append({
+                    'method': 'POST',
+                    'path': f'/wp/v2/posts/{post_id}',
+                    'body': body
+                })
+
+        responses = []
+        if not sub_requests:
+            return responses
+
+        # One post takes one round-trip either way; skip the batch probe
+        if len(sub_requests) == 1:
+            return self._send_updates_concurrently(sub_requests)
+
+        limit = self._get_batch_limit()
+        if not limit:
+            return self._send_updates_concurrently(sub_requests)
+
+        for start in range(0, len(sub_requests), limit):
+            response = self._session.post(
+                f'{self.base_url}/wp-json/batch/v1',
+                json={'requests': sub_requests[start:start + limit]},
+                timeout=30
+            )
+            if response.status_code == 404 and not start:
+                self._batch_limit = 0
+                return self._send_updates_concurrently(sub_requests)
+            response.raise_for_status()
+            responses.extend(response.json().get('responses', []))
+
+        return responses
+
+    def _validate_seo_update(self, update: Dict):
+        """Reject an update the posts endpoint would refuse."""
+        post_id = update.get('post_id')
+        if type(post_id) is not int or post_id <= 0:
+            raise ValueError(f"Invalid post_id: {post_id!r}")
+
+        for field, value in update.items():
+            if field == 'post_id':
+                continue
+            if field not in _UPDATE_FIELDS:
+                raise ValueError(f"Unknown update field for post {post_id}: {field!r}")
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"{field} for post {post_id} must be a string")
+
+    def _get_batch_limit(self) -> int:
+        """
+        Maximum sub-requests per batch call, as the site advertises it.
+
+        Asked once (OPTIONS /wp-json/batch/v1) and remembered; falls back
+        to WordPress's default of 25 if the schema can't be read, and is 0
+        if the site has no batch endpoint.
+        """
+        if self._batch_limit is None:
+            limit = _BATCH_LIMIT
+            try:
+                response = self._session.options(f'{self.base_url}/wp-json/batch/v1', timeout=30)
+                if response.status_code == 404:
+                    limit = 0
+                else:
+                    response.raise_for_status()
+                    endpoint = response.json()['endpoints'][0]
+                    advertised = endpoint['args']['requests']['maxItems']
+                    if type(advertised) is int and advertised > 0:
+                        limit = advertised
+            except (requests.RequestException, ValueError, KeyError, IndexError, TypeError):
+                pass
+            self._batch_limit = limit
+
+        return self._batch_limit
+
+    def _send_updates_concurrently(
+        self,
+        sub_requests: List[Dict],
+        max_workers: int = 8
+    ) -> List[Dict]:
+        """Send batch sub-requests one by one, in parallel; batch-style responses."""
+        def send(sub_request: Dict) -> Dict:
+            response = self._session.post(
+                f"{self.base_url}/wp-json{sub_request['path']}",
+                json=sub_request['body'],
+                timeout=30
+            )
+            try:
+                body = response.json()
+            except ValueError:
+                body = response.text
+            return {
+                'status': response.status_code,
+                'headers': dict(response.headers),
+                'body': body
+            }
+
+        if len(sub_requests) == 1:
+            return [send(sub_requests[0])]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sub_requests))) as executor:
+            return list(executor.map(send, sub_requests))
+
+    def _remember_post_values(self, post_id: int, title: str, meta: Dict):
+        """Keep a fetched post's current title, description and keyword."""
+        description_field = self._field_map.get('description')
+        keyword_field = self._field_map.get('keyword')
+        values = {
+            'title': title,
+            'meta_description': meta.get(description_field) if description_field else None,
+            'focus_keyword': meta.get(keyword_field) if keyword_field else None,
+            'fetched_at': time.monotonic()
+        }
+        with self._post_values_lock:
+            self._post_values[post_id] = values
+            self._post_values.move_to_end(post_id)
+            while len(self._post_values) > _POST_CACHE_SIZE:
+                self._post_values.popitem(last=False)
+
+    def _forget_post_values(self, post_id: int):
+        """Drop a post's remembered values once it has been written to."""
+        with self._post_values_lock:
+            self._post_values.pop(post_id, None)
+
+    def _drop_unchanged(
+        self,
+        post_id: int,
+        title: Optional[str],
+        meta_description: Optional[str],
+        focus_keyword: Optional[str]
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """(title, meta_description, focus_keyword), minus values the post already has."""
+        with self._post_values_lock:
+            current = self._post_values.get(post_id)
+        if current is None or time.monotonic() - current['fetched_at'] > _POST_VALUES_TTL:
+            return title, meta_description, focus_keyword
+
+        return tuple(
+            None if value is not None and value == current[name] else value
+            for name, value in (
+                ('title', title),
+                ('meta_description', meta_description),
+                ('focus_keyword', focus_keyword)
+            )
+        )
+
+    def _build_seo_updates(
+        self,
+        title: Optional[str] = None,
+        meta_description: Optional[str] = None,
+        focus_keyword: Optional[str] = None,
+        content: Optional[str] = None
+    ) -> Dict:
+        """Build the REST API update payload for the detected SEO plugin."""
         updates = {}
 
         # Update title
@@ -188,34 +726,14 @@ class WordPressConnector:
         # Update SEO meta fields based on plugin
         meta_updates = {}
 
-        if meta_description:
-            if self.seo_plugin == 'yoast':
-                meta_updates['_yoast_wpseo_metadesc'] = meta_description
-            elif self.seo_plugin == 'rankmath':
-                meta_updates['rank_math_description'] = meta_description
-            elif self.seo_plugin == 'aioseo':
-                meta_updates['_aioseo_description'] = meta_description
-            elif self.seo_plugin == 'seopress':
-                meta_updates['_seopress_titles_desc'] = meta_description
-
-        if focus_keyword:
-            if self.seo_plugin == 'yoast':
-                meta_updates['_yoast_wpseo_focuskw'] = focus_keyword
-            elif self.seo_plugin == 'rankmath':
-                meta_updates['rank_math_focus_keyword'] = focus_keyword
-            elif self.seo_plugin == 'aioseo':
-                meta_updates['_aioseo_keyphrases'] = focus_keyword
-            elif self.seo_plugin == 'seopress':
-                meta_updates['_seopress_analysis_target_kw'] = focus_keyword
+        for key, value in (('description', meta_description), ('keyword', focus_keyword)):
+            if value and key in self._field_map:
+                meta_updates[self._field_map[key]] = value
 
         if meta_updates:
             updates['meta'] = meta_updates
 
-        # Apply updates via REST API
-        if updates:
-            return self.wp_client.update_post(post_id, updates)
-
-        return {'message': 'No updates to apply'}
+        return updates
 
     def list_posts(
         self,
@@ -243,65 +761,92 @@ class WordPressConnector:
             order=order
         )
 
-        # Simplify post data
-        return [
-            {
-                'id': p['id'],
-                'title': p['title']['rendered'],
-                'slug': p['slug'],
-                'status': p['status'],
-                'date': p['date'],
-                'modified': p['modified'],
-                'link': p['link']
-            }
-            for p in posts
-        ]
+        return [self._summarize_post(p) for p in posts]
 
-    def get_seo_plugin_info(self) -> Dict:
+    def list_all_posts(
+        self,
+        status: str = 'publish',
+        orderby: str = 'modified',
+        order: str = 'desc',
+        max_workers: int = 8
+    ) -> List[Dict]:
         """
-        Get information about detected SEO plugin.
+        List every WordPress post, fetching result pages concurrently.
+
+        The first page reports the page count (X-WP-TotalPages); the
+        remaining pages are then requested in parallel, so a K-page listing
+        takes about two round-trips instead of K. Pages the server
+        rate-limits (HTTP 429) are retried one at a time afterwards. Only
+        the summary fields are requested (_fields), so the server neither
+        renders content nor sends it.
+
+        Args:
+            status: Post status (publish, draft, etc.)
+            orderby: Sort by (date, modified, title, etc.)
+            order: Sort order (asc, desc)
+            max_workers: Maximum number of concurrent page requests
 
         Returns:
-            Dictionary with plugin info
+            List of post summaries, in listing order
         """
-        plugin_names = {
-            'yoast': 'Yoast SEO',
-            'rankmath': 'Rank Math',
-            'aioseo': 'All in One SEO',
-            'seopress': 'SEOPress',
-            None: 'No SEO plugin detected'
+        params = {
+            'per_page': _MAX_PER_PAGE,
+            'status': status,
+            'orderby': orderby,
+            'order': order,
+            '_fields': _SUMMARY_FIELDS
         }
 
-        plugin_fields = {
-            'yoast': {
-                'title': '_yoast_wpseo_title',
-                'description': '_yoast_wpseo_metadesc',
-                'keyword': '_yoast_wpseo_focuskw'
-            },
-            'rankmath': {
-                'title': 'rank_math_title',
-                'description': 'rank_math_description',
-                'keyword': 'rank_math_focus_keyword'
-            },
-            'aioseo': {
-                'title': '_aioseo_title',
-                'description': '_aioseo_description',
-                'keyword': '_aioseo_keyphrases'
-            },
-            'seopress': {
-                'title': '_seopress_titles_title',
-                'description': '_seopress_titles_desc',
-                'keyword': '_seopress_analysis_target_kw'
-            }
-        }
+        first = self._fetch_posts_page(params, 1)
+        first.raise_for_status()
+        total_pages = int(first.headers.get('X-WP-TotalPages', 1))
+
+        pages = list(range(2, total_pages + 1))
+        responses = [first]
+        if pages:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pages))) as executor:
+                responses.extend(executor.map(
+                    lambda page: self._fetch_posts_page(params, page), pages
+                ))
+
+        posts = []
+        for page, response in enumerate(responses, 1):
+            if response.status_code == 429:
+                response = self._fetch_posts_page(params, page)
+            response.raise_for_status()
+            posts.extend(self._summarize_post(p) for p in response.json())
+
+        return posts
+
+    def _fetch_posts_page(self, params: Dict, page: int) -> requests.Response:
+        """Request one page of the posts listing."""
+        return self._session.get(
+            f'{self.base_url}/wp-json/wp/v2/posts',
+            params={**params, 'page': page},
+            timeout=30
+        )
 
+    def _summarize_post(self, post: Dict) -> Dict:
+        """Simplify REST API post data to a listing summary."""
         return {
-            'detected': self.seo_plugin,
-            'name': plugin_names.get(self.seo_plugin, 'Unknown'),
-            'fields': plugin_fields.get(self.seo_plugin, {}),
-            'can_update': self.seo_plugin is not None
+            'id': post['id'],
+            'title': post['title']['rendered'],
+            'slug': post['slug'],
+            'status': post['status'],
+            'date': post['date'],
+            'modified': post['modified'],
+            'link': post['link']
         }
 
+    def get_seo_plugin_info(self) -> Dict:
+        """
+        Get information about detected SEO plugin.
+
+        Returns:
+            Dictionary with plugin info (shared between calls; don't modify)
+        """
+        return _plugin_info(self.seo_plugin)
+
     def test_connection(self) -> Tuple[bool, str]:
         """
         Test WordPress connection.
@@ -329,6 +874,54 @@ class WordPressNotAvailableError(Exception):
     pass
 
 
+# Connectors shared within the process, by (base_url, username, app_password)
+_CONNECTORS: Dict[Tuple[str, str, str], WordPressConnector] = {}
+_CONNECTORS_LOCK = threading.Lock()
+
+
+def get_default_connector(
+    base_url: str,
+    username: str,
+    app_password: str
+) -> WordPressConnector:
+    """
+    Get the process-wide connector for these credentials.
+
+    The first call creates it and tests the connection; later calls reuse
+    its pooled session, SEO plugin detection and fetched-post values
+    instead of starting over. Only connectors that passed the test are
+    shared.
+
+    Args:
+        base_url: WordPress URL
+        username: WordPress username
+        app_password: Application password
+
+    Returns:
+        Shared WordPressConnector instance
+
+    Raises:
+        WordPressNotAvailableError: If the connection test fails
+    """
+    key = (base_url.rstrip('/'), username, app_password)
+    with _CONNECTORS_LOCK:
+        connector = _CONNECTORS.get(key)
+    if connector is not None:
+        return connector
+
+    connector = WordPressConnector(base_url, username, app_password)
+
+    # Test connection
+    success, message = connector.test_connection()
+    logger.info(message)
+
+    if not success:
+        raise WordPressNotAvailableError(message)
+
+    with _CONNECTORS_LOCK:
+        return _CONNECTORS.setdefault(key, connector)
+
+
 def create_connector(
     base_url: Optional[str] = None,
     username: Optional[str] = None,
@@ -337,7 +930,10 @@ def create_connector(
     """
     Create WordPress connector with credentials.
 
-    If credentials are not provided, will prompt user.
+    If credentials are not provided, will prompt user (only when stdin is
+    a terminal; otherwise they are required). The connection is tested,
+    and a connector that passed is shared with later calls for the same
+    credentials (see get_default_connector).
 
     Args:
         base_url: WordPress URL
@@ -347,7 +943,7 @@ def create_connector(
     Returns:
         WordPressConnector instance
     """
-    if not all([base_url, username, app_password]):
+    if not all([base_url, username, app_password]) and sys.stdin.isatty():
         print("WordPress Connection Required")
         print("-" * 60)
 
@@ -358,19 +954,12 @@ def create_connector(
     if not all([base_url, username, app_password]):
         raise ValueError("WordPress credentials required")
 
-    connector = WordPressConnector(base_url, username, app_password)
-
-    # Test connection
-    success, message = connector.test_connection()
-    print(message)
-
-    if not success:
-        raise WordPressNotAvailableError(message)
-
-    return connector
+    return get_default_connector(base_url, username, app_password)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     # Test WordPress connector
     print("WordPress Connector Test")
     print("=" * 60)
@@ -0,0 +1,73 @@
+"""Tests for the regex fast path of onpage_optimizer._extract_features()."""
+
+import os
+import sys
+
+import pytest
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules import onpage_optimizer  # noqa: E402
+
+# Simple HTML the fast path must handle itself, with the parser's result
+CORPUS = [
+    '',
+    '<p>No headings or images here.</p>',
+    '<h1>Dog Training Guide</h1><p>Intro</p><h2>Why train?</h2><h3>Puppies</h3><h2>Tips</h2>',
+    '<H2 class="title">Mixed <b>bold</b> &amp; <em>emphasis</em></H2>',
+    '<h2 data-x=\'a>b\'>Quoted &gt; attribute</h2>',
+    '<h1>\n  Padded heading \n</h1><h2>Caf&eacute; &#233; &#xE9;</h2>',
+    '<h2>Link <a href="/x">inside</a> heading</h2><h4>Fourth</h4><h6>Sixth</h6>',
+    '<img src="a.png"><img src="b.png" alt="Dog &amp; cat"><img alt=\'single\' src=c.png><img alt=bare>',
+    '<img src="d.png" alt=""><IMG SRC="e.png" ALT="Upper"><img src="f.png" alt="x" />',
+    '<article><h1>Title</h1><p>Text <img src="g.png" alt="Inline"> more</p>'
+    '<h2>Next <span>part</span></h2></article>',
+]
+
+# HTML the fast path must leave to the parser
+FALLBACKS = {
+    'comment': '<h1>Title</h1><!-- <h2>hidden</h2> --><p>x</p>',
+    'cdata': '<h1>A</h1><![CDATA[ <h2>x</h2> ]]>',
+    'script': '<script>var s = "<h2>not a heading</h2>";</script><h1>Real</h1>',
+    'style': '<style>h1 > img { }</style><h1>Real</h1><img alt="x">',
+    'textarea': '<textarea><h2>literal</h2></textarea>',
+    'template': '<template><h2>inert</h2></template><h1>Real</h1>',
+    'unclosed tag': '<h1>Title</h1><p class="x"<img src="a.png" alt="y">',
+    'unclosed heading': '<h2>Never closed<p>text</p>',
+    'nested headings': '<h2>Outer <h3>inner</h3> tail</h2>',
+    'block inside heading': '<h2><div>Block</div> text</h2>',
+    'unbalanced inline': '<h2><b>bold</h2>',
+    'stray end tag in heading': '<h2>Text</span> more</h2>',
+    'self-closing inline': '<h2>A <span/> B</h2>',
+    'whitespace run in heading': '<h2><b>a</b>  <i>b</i></h2>',
+    'duplicate alt': '<img alt="one" alt="two">',
+    'malformed img attributes': '<img alt="unterminated src="a.png">',
+    'img attribute junk': '<img "alt"="x">',
+    'unknown entity': '<h2>Fish &bogus; chips</h2>',
+    'unterminated entity': '<h2>Fish &amp chips</h2>',
+    'control character reference': '<h2>Bad &#1; char</h2>',
+    'unknown entity in alt': '<img alt="x &nope; y">',
+}
+
+
+def _soup_features(html_content: str) -> dict:
+    """Features as extracted from a BeautifulSoup tree."""
+    soup = BeautifulSoup(html_content, onpage_optimizer._HTML_PARSER)
+    return onpage_optimizer._extract_features(html_content, soup)
+
+
+@pytest.mark.parametrize('html_content', CORPUS)
+def test_fast_path_matches_parser(html_content):
+    """Simple HTML is handled by the regexes, with the parser's result."""
+    features = onpage_optimizer._extract_features_fast(html_content)
+
+    assert features is not None
+    assert features == _soup_features(html_content)
+
+
+@pytest.mark.parametrize('html_content', FALLBACKS.values(), ids=FALLBACKS.keys())
+def test_fast_path_falls_back(html_content):
+    """Markup the regexes can't read like a parser goes to BeautifulSoup."""
+    assert onpage_optimizer._extract_features_fast(html_content) is None
+    assert onpage_optimizer._extract_features(html_content) == _soup_features(html_content)
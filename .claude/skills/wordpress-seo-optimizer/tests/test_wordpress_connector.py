@@ -0,0 +1,240 @@
+"""Tests for WordPressConnector against a mocked requests session."""
+
+import json
+import os
+import sys
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules import wordpress_connector  # noqa: E402
+from modules.wordpress_connector import WordPressConnector  # noqa: E402
+
+BASE_URL = 'https://example.com'
+BATCH_URL = f'{BASE_URL}/wp-json/batch/v1'
+POSTS_URL = f'{BASE_URL}/wp-json/wp/v2/posts'
+
+
+class FakeResponse:
+    """Just enough of requests.Response for the connector."""
+
+    def __init__(self, status_code=200, body=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = {}
+        self.text = json.dumps(body)
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} error')
+
+
+class FakeSession:
+    """requests.Session stand-in that records calls and answers from handlers."""
+
+    def __init__(self):
+        self.auth = None
+        self.calls = []
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def close(self):
+        pass
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(('GET', url, params))
+        return FakeSession.on_get(url, params)
+
+    def options(self, url, timeout=None):
+        self.calls.append(('OPTIONS', url, None))
+        return FakeSession.on_options(url)
+
+    def post(self, url, json=None, timeout=None):
+        self.calls.append(('POST', url, json))
+        return FakeSession.on_post(url, json)
+
+
+class FakeClient:
+    """wordpress_publisher.WordPressClient stand-in."""
+
+    posts = {}
+    updates = []
+
+    def __init__(self, base_url, username, app_password):
+        pass
+
+    def get_post(self, post_id):
+        return FakeClient.posts[post_id]
+
+    def update_post(self, post_id, updates):
+        FakeClient.updates.append((post_id, updates))
+        return {'id': post_id}
+
+
+def _post(post_id, title='Title', meta=None):
+    """REST API post data."""
+    return {
+        'id': post_id,
+        'title': {'rendered': title},
+        'content': {'rendered': '<p>Body</p>'},
+        'excerpt': {'rendered': ''},
+        'slug': f'post-{post_id}',
+        'link': f'{BASE_URL}/post-{post_id}',
+        'status': 'publish',
+        'date': '2024-01-01T00:00:00',
+        'modified': '2024-01-01T00:00:00',
+        'meta': meta or {}
+    }
+
+
+def _batch_reply(url, body):
+    """Batch endpoint answering 200 to every sub-request."""
+    if url == BATCH_URL:
+        return FakeResponse(207, {'responses': [
+            {'status': 200, 'body': {'path': r['path']}} for r in body['requests']
+        ]})
+    return FakeResponse(200, {'id': int(url.rsplit('/', 1)[1])})
+
+
+@pytest.fixture
+def site(monkeypatch, tmp_path):
+    """A Yoast site behind a mocked session, with an empty plugin cache."""
+    monkeypatch.setattr(requests, 'Session', FakeSession)
+    monkeypatch.setattr(wordpress_connector, '_load_wp_client_cls', lambda: FakeClient)
+    monkeypatch.setattr(wordpress_connector, '_PLUGIN_CACHE_PATH', tmp_path / 'plugin_detect.json')
+    monkeypatch.setattr(FakeClient, 'posts', {})
+    monkeypatch.setattr(FakeClient, 'updates', [])
+    monkeypatch.setattr(FakeSession, 'on_get', staticmethod(
+        lambda url, params: FakeResponse(200, [
+            {'id': 1, 'meta': {'_yoast_wpseo_metadesc': ''}}
+        ])
+    ), raising=False)
+    monkeypatch.setattr(FakeSession, 'on_options', staticmethod(
+        lambda url: FakeResponse(200, {
+            'endpoints': [{'args': {'requests': {'maxItems': 25}}}]
+        })
+    ), raising=False)
+    monkeypatch.setattr(FakeSession, 'on_post', staticmethod(_batch_reply), raising=False)
+    return monkeypatch
+
+
+def _connector(**kwargs):
+    return WordPressConnector(BASE_URL, 'user', 'app password', **kwargs)
+
+
+def _updates(count):
+    return [{'post_id': n, 'meta_description': f'Description {n}'} for n in range(1, count + 1)]
+
+
+def test_batches_are_chunked_by_advertised_max_items(site):
+    site.setattr(FakeSession, 'on_options', staticmethod(
+        lambda url: FakeResponse(200, {'endpoints': [{'args': {'requests': {'maxItems': 2}}}]})
+    ))
+    connector = _connector()
+
+    responses = connector.batch_update_post_seo(_updates(5))
+
+    batches = [body['requests'] for method, url, body in connector._session.calls
+               if method == 'POST' and url == BATCH_URL]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [r['body']['path'] for r in responses] == [f'/wp/v2/posts/{n}' for n in range(1, 6)]
+
+
+def test_single_update_skips_the_batch_endpoint(site):
+    connector = _connector()
+
+    responses = connector.batch_update_post_seo(_updates(1))
+
+    sent = [(method, url) for method, url, _ in connector._session.calls if method != 'GET']
+    assert sent == [('POST', f'{POSTS_URL}/1')]
+    assert responses[0]['status'] == 200
+
+
+@pytest.mark.parametrize('missing_on', ['OPTIONS', 'POST'])
+def test_missing_batch_endpoint_falls_back_to_single_updates(site, missing_on):
+    if missing_on == 'OPTIONS':
+        site.setattr(FakeSession, 'on_options', staticmethod(lambda url: FakeResponse(404, {})))
+    else:
+        site.setattr(FakeSession, 'on_post', staticmethod(
+            lambda url, body: FakeResponse(404, {}) if url == BATCH_URL else _batch_reply(url, body)
+        ))
+    connector = _connector()
+
+    responses = connector.batch_update_post_seo(_updates(3))
+
+    assert [r['body']['id'] for r in responses] == [1, 2, 3]
+    single_posts = sorted(url for method, url, _ in connector._session.calls
+                          if method == 'POST' and url != BATCH_URL)
+    assert single_posts == [f'{POSTS_URL}/{n}' for n in range(1, 4)]
+    assert connector._batch_limit == 0
+
+
+@pytest.mark.parametrize('bad_update', [
+    {'post_id': 0, 'title': 'Zero id'},
+    {'post_id': True, 'title': 'Boolean id'},
+    {'title': 'No id'},
+    {'post_id': 3, 'tilte': 'Misspelled field'},
+    {'post_id': 3, 'title': 42},
+])
+def test_bad_update_raises_before_anything_is_sent(site, bad_update):
+    connector = _connector()
+    connector._session.calls.clear()
+
+    with pytest.raises(ValueError):
+        connector.batch_update_post_seo(_updates(2) + [bad_update])
+
+    assert connector._session.calls == []
+
+
+def test_skip_unchanged_uses_recent_fetches_only(site):
+    FakeClient.posts[7] = _post(7, title='Same title', meta={'_yoast_wpseo_metadesc': 'Same'})
+    connector = _connector()
+    connector.fetch_post(7)
+
+    # Opt-in only: by default the value is sent
+    connector.update_post_seo(7, title='Same title')
+    assert FakeClient.updates == [(7, {'title': 'Same title'})]
+
+    connector.fetch_post(7)
+    result = connector.update_post_seo(
+        7, title='Same title', meta_description='Same', skip_unchanged=True
+    )
+    assert result == {'message': 'No changes; skipped'}
+    assert len(FakeClient.updates) == 1
+
+    # Values fetched too long ago are not trusted
+    connector.fetch_post(7)
+    fetched_at = connector._post_values[7]['fetched_at']
+    site.setattr(wordpress_connector.time, 'monotonic',
+                 lambda: fetched_at + wordpress_connector._POST_VALUES_TTL + 1)
+    connector.update_post_seo(7, title='Same title', skip_unchanged=True)
+    assert FakeClient.updates[-1] == (7, {'title': 'Same title'})
+
+
+def test_detected_plugin_is_remembered(site):
+    assert _connector().seo_plugin == 'yoast'
+
+    connector = _connector()
+
+    assert connector.seo_plugin == 'yoast'
+    assert not [call for call in connector._session.calls if call[0] == 'GET']
+
+
+def test_no_plugin_is_not_remembered(site):
+    site.setattr(FakeSession, 'on_get', staticmethod(
+        lambda url, params: FakeResponse(200, [{'id': 1, 'meta': {}}])
+    ))
+    assert _connector().seo_plugin is None
+    assert not wordpress_connector._PLUGIN_CACHE_PATH.exists()
+
+    # A plugin installed since is picked up by the next connector
+    site.setattr(FakeSession, 'on_get', staticmethod(
+        lambda url, params: FakeResponse(200, [{'id': 1, 'meta': {'rank_math_title': 't'}}])
+    ))
+    assert _connector().seo_plugin == 'rankmath'